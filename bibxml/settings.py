@@ -1,6 +1,6 @@
 from typing import List, Optional, cast
 from pathlib import Path
-from os import environ, path
+from os import environ, path, cpu_count
 import socket
 
 
@@ -120,6 +120,7 @@ INSTALLED_APPS = [
     'management.app.Config',
     'sources.app.Config',
     'xml2rfc_compat.app.Config',
+    'datatracker.app.Config',
     'compressor',
     'debug_toolbar',
     'health_check',
@@ -353,6 +354,72 @@ DATATRACKER_REDIRECT_URI = environ.get(
    since Datatracker’s redirect would not be handled by this service.
 """
 
+DATATRACKER_CONNECT_TIMEOUT = float(
+    environ.get("DATATRACKER_CONNECT_TIMEOUT", '3.05'))
+"""How many seconds to wait for a connection to Datatracker API
+to be established, see :mod:`datatracker.request`."""
+
+DATATRACKER_READ_TIMEOUT = float(
+    environ.get("DATATRACKER_READ_TIMEOUT", '10'))
+"""How many seconds to wait for Datatracker API to send data
+(between bytes, not for the entire response),
+see :mod:`datatracker.request`."""
+
+DATATRACKER_POOL_SIZE = 10
+"""How many keep-alive connections to Datatracker API
+each process keeps open at most."""
+
+DATATRACKER_MAX_RETRIES = 2
+"""How many times a failed request to Datatracker API is retried.
+
+Connection errors are retried for any request,
+while gateway errors (502, 503, 504) only for GET requests."""
+
+DATATRACKER_RETRY_BACKOFF = 0.5
+"""Backoff factor for retrying requests to Datatracker API.
+The n-th retry is made after ``backoff * 2 ** (n - 1)`` seconds."""
+
+DATATRACKER_TOKEN_CACHE_SECONDS = int(
+    environ.get("DATATRACKER_TOKEN_CACHE_SECONDS", '300'))
+"""For how long a Datatracker API token, once found valid,
+is accepted without asking Datatracker again.
+Set to 0 to validate tokens on every request.
+
+.. seealso:: :func:`datatracker.auth.token_is_valid_cached`
+"""
+
+DATATRACKER_INVALID_TOKEN_CACHE_SECONDS = 30
+"""For how long a Datatracker API token, once found invalid,
+is rejected without asking Datatracker again."""
+
+DATATRACKER_TOKEN_STALE_SECONDS = 3600
+"""For how long, after :data:`DATATRACKER_TOKEN_CACHE_SECONDS` pass,
+a token found valid is still accepted
+if Datatracker can’t be reached to validate it again.
+Set to 0 to reject such tokens while Datatracker is unavailable."""
+
+DATATRACKER_TOKEN_RECHECK_SECONDS = 30
+"""After Datatracker fails to re-validate a token
+and its stale verdict is used instead
+(see :data:`DATATRACKER_TOKEN_STALE_SECONDS`),
+for how long the stale verdict is used
+without trying to reach Datatracker again."""
+
+DATATRACKER_DRAFT_SYNC_INTERVAL: Optional[int] = int(
+    environ.get("DATATRACKER_DRAFT_SYNC_INTERVAL", '3600').strip() or '0'
+) or None
+"""How often, in seconds, newly posted Internet Drafts are mirrored
+from Datatracker using Celery beat scheduler.
+Set to 0 to disable.
+
+.. seealso:: :mod:`datatracker.mirror`
+"""
+
+DATATRACKER_DRAFT_SYNC_INITIAL_DAYS = 365
+"""When the Internet Draft mirror is empty,
+how many days back the first sync should go.
+Drafts not posted since are retrieved from Datatracker on demand."""
+
 REQUIRE_DATATRACKER_AUTH = int(
     environ.get("REQUIRE_DATATRACKER_AUTH", default=0)
 ) == 1
@@ -373,8 +440,27 @@ If ``True``:
 DEFAULT_CACHE_SECONDS = 21600
 """How long to cache by default."""
 
-SEARCH_CACHE_SECONDS = 3600
-"""How long to cache search results for."""
+SEARCH_CACHE_SECONDS = 259200
+"""How long to cache search results for.
+
+Cached results are not used once any indexable source is reindexed
+(see :mod:`sources.generations`), so this can be long."""
+
+CITATION_CACHE_SECONDS = int(
+    environ.get('CITATION_CACHE_SECONDS', '3600'))
+"""How long to cache composite items built from indexed sources
+by :func:`main.query.build_citation_for_docid`.
+Set to 0 to disable caching.
+
+.. seealso:: :mod:`main.citation_cache`
+"""
+
+CITATION_CACHE_LOCAL_SIZE = 256
+"""How many recently used composite items each process
+keeps in memory in front of the shared cache."""
+
+CITATION_CACHE_LOCAL_SECONDS = 30
+"""How long an item is kept in process memory."""
 
 
 # BibXML-specific
@@ -386,6 +472,72 @@ DEFAULT_SEARCH_RESULT_LIMIT = 400
 If the user hits this limit, they are expected to provide
 a more precise query."""
 
+SEARCH_FALLBACK_WORKERS: int = int(
+    environ.get(
+        'SEARCH_FALLBACK_WORKERS',
+        '',
+    ).strip() or '0'
+) or 4
+"""How many query formats search tries at once
+when falling back to other formats is allowed
+and the requested format found nothing
+(see :meth:`main.search.BaseCitationSearchView.handle_query_in_subsequent_formats`).
+Each uses its own database connection,
+so this many extra connections may be open per such search.
+
+If set to 1, formats are tried one after another
+until one finds anything."""
+
+API_BATCH_MAX_ITEMS = 500
+"""How many items can be requested at once
+from :func:`main.api.get_by_docids`
+or :func:`xml2rfc_compat.views.handle_xml2rfc_paths`."""
+
+API_BATCH_EXTERNAL_CONCURRENCY = 10
+"""How many items not found in indexed sources
+:func:`main.api.get_by_docids` requests from external sources at a time."""
+
+INDEXING_BATCH_SIZE = 500
+"""How many parsed items :func:`main.sources.index_dataset`
+and :func:`xml2rfc_compat.source.index_xml2rfc_source`
+accumulate before writing them to the database
+in a single bulk upsert statement."""
+
+INDEXING_PARSER_PROCESSES: int = int(
+    environ.get(
+        'INDEXING_PARSER_PROCESSES',
+        '',
+    ).strip() or '0'
+) or (cpu_count() or 1)
+"""How many worker processes :func:`main.sources.index_dataset`
+uses to parse and validate Relaton source files.
+Defaults to the number of available CPUs.
+
+If set to 1, files are parsed serially in the indexing task process."""
+
+INDEXING_PROGRESS_REPORT_INTERVAL = 2
+"""Minimum number of seconds between indexing task progress updates
+stored in Celery result backend.
+
+.. seealso:: :class:`sources.task_status.ThrottledProgressHandler`
+"""
+
+INDEXING_PROGRESS_REPORT_ITEMS = 1000
+"""Indexing task progress is also updated
+whenever this many items were indexed since the previous update,
+regardless of :data:`INDEXING_PROGRESS_REPORT_INTERVAL`."""
+
+INDEXING_USE_STAGING_TABLE = int(
+    environ.get('INDEXING_USE_STAGING_TABLE', '0')
+) == 1
+"""Whether :func:`main.sources.index_dataset` should load items
+into a temporary staging table when reindexing an entire dataset,
+and merge them into indexed data with a single statement at the end.
+
+This keeps the transaction that modifies indexed data short,
+and avoids index maintenance while items are being loaded,
+at the cost of writing changed items twice."""
+
 DATASET_TMP_ROOT = environ.get('DATASET_TMP_ROOT', '/data/datasets')
 """Where to keep fetched source data and data generated during indexing.
 Should be a directory. No trailing slash."""
@@ -511,3 +663,10 @@ This prefix is subtracted from further resolution.
 
 Must have trailing slash, but no leading slash.
 """
+
+XML2RFC_PRERENDER = int(environ.get('XML2RFC_PRERENDER', '1')) == 1
+"""Whether XML for xml2rfc-style paths should be pre-rendered
+after indexable sources change.
+
+.. seealso:: :mod:`xml2rfc_compat.prerender`
+"""
@@ -1,10 +1,10 @@
-from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.cache import never_cache
 from django.conf import settings
 from django.urls import path, include
-from django.views.decorators.http import require_POST, require_safe
 from django.views.generic.base import TemplateView
 
+from common.decorators import cache_control, require_safe
+from common.decorators import csrf_exempt, require_POST
 from main import api as public_api, views as public_views
 from management import api as mgmt_api, views as mgmt_views
 from management import auth
@@ -67,9 +67,13 @@ urlpatterns = [
                 public_api.CitationSearchResultListView.as_view()
             )), name='api_search'),
 
-            path('by-docid/', require_safe(dt_auth.api(
-                public_api.get_by_docid
+            # Responses carry validators, caches must revalidate
+            path('by-docid/', require_safe(cache_control(no_cache=True)(
+                dt_auth.api(public_api.get_by_docid)
             )), name='api_get_by_docid'),
+            path('by-docid/batch/', csrf_exempt(require_POST(dt_auth.api(
+                public_api.get_by_docids
+            ))), name='api_get_by_docids'),
 
             path('ref/', include([
                 path('doi/<ref>/', require_safe(dt_auth.api(
@@ -77,9 +81,11 @@ urlpatterns = [
                 )), name='api_get_doi_ref'),
 
                 # Obsolete
-                path('<dataset_name>/<ref>/', require_safe(dt_auth.api(
-                    public_api.get_ref
-                )), name='api_get_ref'),
+                path('<dataset_name>/<ref>/', require_safe(
+                    cache_control(no_cache=True)(dt_auth.api(
+                        public_api.get_ref
+                    ))
+                ), name='api_get_ref'),
             ])),
 
             # Management endpoints
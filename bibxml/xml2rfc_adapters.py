@@ -11,12 +11,12 @@ from relaton.models.bibdata import BibliographicItem, DocID, VersionInfo
 
 from bib_models.util import get_primary_docid
 from common.util import as_list
-from datatracker.internet_drafts import get_internet_draft
 from datatracker.internet_drafts import remove_version
+from datatracker.mirror import get_mirrored_internet_draft
 from doi.crossref import get_bibitem as get_doi_bibitem
 from main.exceptions import RefNotFoundError
 from main.models import RefData
-from main.query import search_refs_relaton_field
+from main.query import search_refs_relaton_field, search_refs_docids
 from xml2rfc_compat.adapters import ReversedRef, Xml2rfcAdapter
 from xml2rfc_compat.adapters import register_adapter
 
@@ -107,6 +107,10 @@ class InternetDraftsAdapter(Xml2rfcAdapter):
     .. seealso:: :issue:`157`
     """
 
+    prerender = False
+    """Resolution checks Datatracker for newer versions
+    (see :mod:`datatracker.mirror`)."""
+
     anchor_is_valid: bool
     bare_anchor: str
     unversioned_anchor: str
@@ -171,14 +175,11 @@ class InternetDraftsAdapter(Xml2rfcAdapter):
     def fetch_refs(self) -> Sequence[RefData]:
         unversioned = self.unversioned_anchor
         if version := self.requested_version:
-            query = (
-                '(@.type == "Internet-Draft") && '
-                f'(@.id == "draft-{unversioned}-{version}")'
-            )
-            self.log(f"using query {query}")
-            return list(search_refs_relaton_field({
-                'docid[*]': query,
-            }, limit=10, exact=True))
+            docid = DocID(
+                type='Internet-Draft',
+                id=f'draft-{unversioned}-{version}')
+            self.log(f"using exact docid {docid.type} {docid.id}")
+            return list(search_refs_docids(docid, case_sensitive=True))
         else:
             query = (
                 '(@.type == "Internet-Draft") && '
@@ -235,10 +236,11 @@ class InternetDraftsAdapter(Xml2rfcAdapter):
         dt_bibitem: Optional[BibliographicItem] = None
 
         if not (self.requested_version and self.requested_version == indexed_version):
-            # Check Datatracker’s latest version (slow)
+            # Check Datatracker’s latest version
             # when request is unversioned or requested version is not indexed
+            # (from the mirror, or from Datatracker if not mirrored yet)
             try:
-                dt_bibitem = get_internet_draft(
+                dt_bibitem = get_mirrored_internet_draft(
                     f'draft-{self.bare_anchor}',
                     strict=indexed_bibitem is None,
                 ).bibitem
@@ -508,21 +510,16 @@ class IanaAdapter(Xml2rfcAdapter):
 
 
     def resolve(self) -> BibliographicItem:
-        refs = self.fetch_refs()
-        if num_refs := len(refs):
-            self.log(f"{num_refs} found")
-            resolved_item = self.build_bibitem_from_refs(refs)
-            link = as_list(resolved_item.link or [])
-            for index, _ in enumerate(link):
-                parsed_link = urlparse(link[index].content)
-                if parsed_link.scheme == "http":
-                    link[index].content = \
-                        parsed_link._replace(scheme="https").geturl()
-            resolved_item.date = []
-            return resolved_item
-        else:
-            self.log("no refs found")
-            raise RefNotFoundError()
+        # Uses item prefetched by resolve_many(), if any
+        resolved_item = super().resolve()
+        link = as_list(resolved_item.link or [])
+        for index, _ in enumerate(link):
+            parsed_link = urlparse(link[index].content)
+            if parsed_link.scheme == "http":
+                link[index].content = \
+                    parsed_link._replace(scheme="https").geturl()
+        resolved_item.date = []
+        return resolved_item
 
 
 @register_adapter('bibxml9')
@@ -635,6 +632,10 @@ class DoiAdapter(Xml2rfcAdapter):
     """
     Resolves DOI paths, using Crossref integration.
     """
+
+    prerender = False
+    """Items come from Crossref rather than indexed sources."""
+
     @classmethod
     def reverse(cls, item: BibliographicItem) -> List[ReversedRef]:
         if (dois := list(filter(lambda d: d.type == 'DOI', item.docid))):
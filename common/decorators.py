@@ -0,0 +1,153 @@
+"""Async-aware counterparts of Django view decorators.
+
+Django’s own view decorators don’t support async views
+before Django 5.0. Decorators in this module wrap coroutine functions
+in coroutine functions, and otherwise defer to Django’s decorators,
+so that they can be applied to either kind of view.
+"""
+
+import datetime
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.http import HttpResponseNotAllowed
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.cache import patch_cache_control
+from django.utils.http import http_date, quote_etag
+from django.utils.log import log_response
+from django.views.decorators import cache as django_cache
+from django.views.decorators import csrf as django_csrf
+from django.views.decorators import http as django_http
+
+
+__all__ = (
+    'require_http_methods',
+    'require_safe',
+    'require_POST',
+    'csrf_exempt',
+    'cache_control',
+    'condition',
+)
+
+
+SAFE_METHODS = ['GET', 'HEAD']
+
+
+def require_http_methods(request_method_list):
+    """Like Django’s ``require_http_methods()``."""
+    def decorator(func):
+        if not iscoroutinefunction(func):
+            return django_http.require_http_methods(request_method_list)(func)
+
+        @wraps(func)
+        async def inner(request, *args, **kwargs):
+            if request.method not in request_method_list:
+                response = HttpResponseNotAllowed(request_method_list)
+                log_response(
+                    "Method Not Allowed (%s): %s",
+                    request.method,
+                    request.path,
+                    response=response,
+                    request=request,
+                )
+                return response
+            return await func(request, *args, **kwargs)
+
+        return inner
+
+    return decorator
+
+
+def require_safe(func):
+    """Like Django’s ``require_safe()``."""
+    return require_http_methods(SAFE_METHODS)(func)
+
+
+def require_POST(func):
+    """Like Django’s ``require_POST()``."""
+    return require_http_methods(['POST'])(func)
+
+
+def csrf_exempt(func):
+    """Like Django’s ``csrf_exempt()``."""
+    if not iscoroutinefunction(func):
+        return django_csrf.csrf_exempt(func)
+
+    @wraps(func)
+    async def inner(*args, **kwargs):
+        return await func(*args, **kwargs)
+
+    inner.csrf_exempt = True  # type: ignore[attr-defined]
+
+    return inner
+
+
+def cache_control(**kwargs):
+    """Like Django’s ``cache_control()``."""
+    def decorator(func):
+        if not iscoroutinefunction(func):
+            return django_cache.cache_control(**kwargs)(func)
+
+        @wraps(func)
+        async def inner(request, *args, **kw):
+            response = await func(request, *args, **kw)
+            patch_cache_control(response, **kwargs)
+            return response
+
+        return inner
+
+    return decorator
+
+
+def condition(etag_func=None, last_modified_func=None):
+    """Like Django’s ``condition()``.
+
+    For async views, given functions are expected to be synchronous
+    and are called in a thread.
+    """
+    def decorator(func):
+        if not iscoroutinefunction(func):
+            return django_http.condition(
+                etag_func=etag_func,
+                last_modified_func=last_modified_func,
+            )(func)
+
+        @wraps(func)
+        async def inner(request, *args, **kwargs):
+            res_etag = (
+                await sync_to_async(etag_func)(request, *args, **kwargs)
+                if etag_func
+                else None)
+            res_etag = quote_etag(res_etag) if res_etag is not None else None
+
+            res_last_modified = None
+            if last_modified_func and (dt := await sync_to_async(
+                last_modified_func
+            )(request, *args, **kwargs)):
+                if not timezone.is_aware(dt):
+                    dt = timezone.make_aware(dt, datetime.timezone.utc)
+                res_last_modified = int(dt.timestamp())
+
+            response = get_conditional_response(
+                request,
+                etag=res_etag,
+                last_modified=res_last_modified,
+            )
+
+            if response is None:
+                response = await func(request, *args, **kwargs)
+
+            if request.method in SAFE_METHODS:
+                if (res_last_modified
+                        and not response.has_header('Last-Modified')):
+                    response.headers['Last-Modified'] = \
+                        http_date(res_last_modified)
+                if res_etag:
+                    response.headers.setdefault('ETag', res_etag)
+
+            return response
+
+        return inner
+
+    return decorator
@@ -1,10 +1,11 @@
 """Utilities for dealing with Git."""
 
-from typing import Tuple
+from typing import Tuple, List, Optional
 from os import access, path, R_OK, W_OK, X_OK
 from pathlib import Path
 from shutil import rmtree
 from git import Repo
+from git.exc import GitCommandError
 from celery.utils.log import get_task_logger
 from django.core.exceptions import SuspiciousOperation
 from django.conf import settings
@@ -97,3 +98,42 @@ def ensure_latest(repo_url: str, branch: str, work_dir: str) \
             work_dir,
             f'dir: {is_dir}, git: {is_git_dir}, access: {is_accessible}')
         return reclone(repo_url, branch, work_dir), True
+
+
+def get_changed_paths(repo: Repo, since_sha: str) -> Optional[List[str]]:
+    """
+    Lists paths that were added, modified or deleted
+    between given commit and current head commit of given repository.
+
+    Compares the trees of both commits directly, so commits in between
+    are not required and shallow fetches are fine; however, the object
+    of the previous commit must still be present in the repository
+    (which it is after :func:`ensure_latest()` pulls, but not
+    after :func:`reclone()`).
+
+    A renamed file is represented by both its old and new paths.
+
+    :returns: a list of paths relative to repository root,
+              or None if changes could not be determined
+              (e.g., commit ``since_sha`` is not present).
+    """
+    if repo.head.commit.hexsha == since_sha:
+        return []
+
+    try:
+        output = repo.git.diff(
+            '--name-only',
+            '--no-renames',
+            '-z',
+            since_sha,
+            repo.head.commit.hexsha,
+            '--',
+        )
+    except GitCommandError:
+        logger.warning(
+            "Unable to list paths changed since %s in %s",
+            since_sha,
+            repo.working_tree_dir)
+        return None
+    else:
+        return [p for p in output.split('\x00') if p]
@@ -0,0 +1,59 @@
+"""Utilities for loading YAML data."""
+
+from typing import Any, Type
+
+import yaml
+
+
+__all__ = (
+    'DataLoader',
+    'PurePythonDataLoader',
+    'load_data',
+)
+
+
+TIMESTAMP_TAG = 'tag:yaml.org,2002:timestamp'
+
+
+def make_loader_without_timestamps(base: Type[yaml.SafeLoader]) \
+        -> Type[yaml.SafeLoader]:
+    """
+    Returns a subclass of given loader class that leaves timestamps
+    as strings instead of converting them into ``datetime`` objects
+    (which are not JSON-serializable).
+
+    Implicit resolvers are replaced on the subclass only,
+    global PyYAML state is not modified.
+    """
+    return type(
+        f'{base.__name__}WithoutTimestamps',
+        (base, ),
+        {
+            'yaml_implicit_resolvers': {
+                first_char: [
+                    resolver
+                    for resolver in resolvers
+                    if resolver[0] != TIMESTAMP_TAG
+                ]
+                for first_char, resolvers
+                in base.yaml_implicit_resolvers.items()
+            },
+        },
+    )
+
+
+PurePythonDataLoader = make_loader_without_timestamps(yaml.SafeLoader)
+"""Safe loader implemented in pure Python, not resolving timestamps."""
+
+DataLoader = make_loader_without_timestamps(
+    getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+"""Safe loader not resolving timestamps.
+
+Based on libyaml-backed ``yaml.CSafeLoader`` when PyYAML
+was built with libyaml, otherwise same as :data:`PurePythonDataLoader`.
+"""
+
+
+def load_data(data: str) -> Any:
+    """Deserializes given YAML string using :data:`DataLoader`."""
+    return yaml.load(data, Loader=DataLoader)
@@ -0,0 +1,20 @@
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class Config(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'datatracker'
+
+    def ready(self):
+        from sources.celery import app as celery_app
+
+        if interval := getattr(
+            settings,
+            'DATATRACKER_DRAFT_SYNC_INTERVAL',
+            None,
+        ):
+            celery_app.conf.beat_schedule['sync-internet-drafts'] = {
+                'task': 'datatracker.tasks.sync_internet_drafts_task',
+                'schedule': interval,
+            }
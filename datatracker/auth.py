@@ -1,10 +1,22 @@
 """Authentication using Datatracker bibxml API developer tokens.
+
+Verdicts on provided tokens are cached (see :func:`.token_is_valid_cached`),
+so that most API requests don’t wait for Datatracker.
 """
 
+import hashlib
 import logging
 import functools
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, Optional, Tuple
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+import requests
 from simplejson import JSONDecodeError
 
+from django.core.cache import cache
 from django.http.response import HttpResponseForbidden
 from django.conf import settings
 
@@ -16,6 +28,30 @@ from .exceptions import UnexpectedDatatrackerResponse
 log = logging.getLogger(__name__)
 
 
+TOKEN_CACHE_SECONDS: int = getattr(
+    settings,
+    'DATATRACKER_TOKEN_CACHE_SECONDS',
+    300)
+
+INVALID_TOKEN_CACHE_SECONDS: int = getattr(
+    settings,
+    'DATATRACKER_INVALID_TOKEN_CACHE_SECONDS',
+    30)
+
+TOKEN_STALE_SECONDS: int = getattr(
+    settings,
+    'DATATRACKER_TOKEN_STALE_SECONDS',
+    3600)
+
+TOKEN_RECHECK_SECONDS: int = getattr(
+    settings,
+    'DATATRACKER_TOKEN_RECHECK_SECONDS',
+    30)
+
+
+TOKEN_CACHE_KEY_PREFIX = 'datatracker-token'
+
+
 def api(viewfunc):
     """Header-based auth decorator for Django views.
     Use for API endpoints that require Datatracker authentication.
@@ -28,36 +64,199 @@ def api(viewfunc):
 
     :data:`bibxml.settings.REQUIRE_DATATRACKER_AUTH`
     makes this decorator no-op.
+
+    Can wrap async views, in which case the token is checked in a thread.
     """
     if not getattr(settings, 'REQUIRE_DATATRACKER_AUTH', False):
         return viewfunc
 
+    if iscoroutinefunction(viewfunc):
+        @functools.wraps(viewfunc)
+        async def async_wrapper(request, *args, **kwargs):
+            forbidden = await sync_to_async(check_request)(request)
+            if forbidden is not None:
+                return forbidden
+            return await viewfunc(request, *args, **kwargs)
+
+        return async_wrapper
+
     @functools.wraps(viewfunc)
     def wrapper(request, *args, **kwargs):
-        provided_secret = request.headers.get('x-datatracker-token', None)
-
-        if provided_secret is not None:
-            try:
-                authenticated = token_is_valid(provided_secret)
-            except UnexpectedDatatrackerResponse:
-                log.exception(
-                    "Datatracker returned something unexpected "
-                    "while checking auth. token")
-                return HttpResponseForbidden(
-                    "Unable to verify Datatracker token")
+        forbidden = check_request(request)
+        if forbidden is not None:
+            return forbidden
+        return viewfunc(request, *args, **kwargs)
+
+    return wrapper
+
+
+def check_request(request) -> Optional[HttpResponseForbidden]:
+    """Returns a response to be used if given request
+    is not authenticated, or None if it is."""
+    provided_secret = request.headers.get('x-datatracker-token', None)
+
+    if provided_secret is not None:
+        try:
+            authenticated = token_is_valid_cached(provided_secret)
+        except UnexpectedDatatrackerResponse:
+            log.exception(
+                "Datatracker returned something unexpected "
+                "while checking auth. token")
+            return HttpResponseForbidden(
+                "Unable to verify Datatracker token")
+        except requests.RequestException:
+            log.exception(
+                "Failed to reach Datatracker "
+                "while checking auth. token")
+            return HttpResponseForbidden(
+                "Unable to verify Datatracker token")
+        else:
+            if authenticated:
+                return None
             else:
-                if authenticated:
-                    return viewfunc(request, *args, **kwargs)
-                else:
-                    return HttpResponseForbidden("Invalid Datatracker API key")
+                return HttpResponseForbidden("Invalid Datatracker API key")
 
-        elif get_client(request) is not None:
-            return viewfunc(request, *args, **kwargs)
+    elif get_client(request) is not None:
+        return None
 
-        return HttpResponseForbidden(
-            "Missing Datatracker API key, or outdated OAuth2 access token")
+    return HttpResponseForbidden(
+        "Missing Datatracker API key, or outdated OAuth2 access token")
 
-    return wrapper
+
+def get_token_cache_key(api_key: str) -> str:
+    """Returns cache key for given token’s verdict.
+    Tokens themselves are never stored."""
+    digest = hashlib.sha256(api_key.encode('utf-8')).hexdigest()
+    return f'{TOKEN_CACHE_KEY_PREFIX}:{digest}'
+
+
+_validations_lock = threading.Lock()
+_validations: Dict[str, Future[bool]] = {}
+"""Validations in progress, by token cache key.
+A future resolves to a verdict, or to the error validation failed with."""
+
+
+def _join_validation(key: str) -> Tuple[Future[bool], bool]:
+    """Returns a future for given key’s validation in progress,
+    and whether the caller started it (and so must resolve it)."""
+    with _validations_lock:
+        if key in _validations:
+            return _validations[key], False
+        future: Future[bool] = Future()
+        _validations[key] = future
+        return future, True
+
+
+def _get_fresh_verdict(
+    verdict: Optional[Dict[str, float]],
+) -> Optional[bool]:
+    if verdict is None:
+        return None
+    valid = bool(verdict['valid'])
+    max_age = TOKEN_CACHE_SECONDS if valid else INVALID_TOKEN_CACHE_SECONDS
+    if time.time() - verdict['checked_at'] < max_age:
+        return valid
+    if valid and time.time() < verdict.get('recheck_after', 0):
+        # Datatracker failed to re-validate it moments ago
+        return True
+    return None
+
+
+def token_is_valid_cached(api_key: str) -> bool:
+    """Like :func:`.token_is_valid`, but caches verdicts.
+
+    - Valid tokens are trusted
+      for :data:`bibxml.settings.DATATRACKER_TOKEN_CACHE_SECONDS`,
+      invalid tokens are rejected without asking Datatracker again
+      for :data:`bibxml.settings.DATATRACKER_INVALID_TOKEN_CACHE_SECONDS`.
+
+    - Concurrent validations of the same token within a process
+      are deduplicated: one thread asks Datatracker,
+      others wait for and reuse its outcome, including a failure.
+
+    - If Datatracker can’t be reached or responds unexpectedly
+      when re-validating a token that was valid last time,
+      the token is considered valid for up to
+      :data:`bibxml.settings.DATATRACKER_TOKEN_STALE_SECONDS`
+      after it was last validated. Datatracker is not asked again
+      for :data:`bibxml.settings.DATATRACKER_TOKEN_RECHECK_SECONDS`
+      after such a failure.
+
+    :raises UnexpectedDatatrackerResponse:
+        same as :func:`.token_is_valid`, unless a stale verdict was used
+    :raises requests.RequestException:
+        Datatracker could not be reached,
+        unless a stale verdict was used
+    """
+    if TOKEN_CACHE_SECONDS < 1:
+        return token_is_valid(api_key)
+
+    key = get_token_cache_key(api_key)
+
+    if (valid := _get_fresh_verdict(cache.get(key))) is not None:
+        return valid
+
+    future, is_leader = _join_validation(key)
+
+    if not is_leader:
+        return future.result()
+
+    try:
+        future.set_result(_revalidate_token(api_key, key))
+    except Exception as err:
+        future.set_exception(err)
+    finally:
+        # Don’t leave waiters hanging if something else interrupted us
+        future.cancel()
+        # Later arrivals find the outcome in cache
+        with _validations_lock:
+            _validations.pop(key, None)
+
+    return future.result()
+
+
+def _revalidate_token(api_key: str, key: str) -> bool:
+    # Another thread could have validated the token in the meantime
+    verdict = cache.get(key)
+    if (valid := _get_fresh_verdict(verdict)) is not None:
+        return valid
+
+    try:
+        valid = token_is_valid(api_key)
+    except (UnexpectedDatatrackerResponse, requests.RequestException):
+        if not verdict or not verdict['valid']:
+            raise
+        stale_until = (
+            verdict['checked_at']
+            + TOKEN_CACHE_SECONDS
+            + TOKEN_STALE_SECONDS)
+        now = time.time()
+        if now >= stale_until:
+            raise
+        log.warning(
+            "Unable to re-validate Datatracker token, "
+            "using a verdict obtained %d seconds ago",
+            now - verdict['checked_at'])
+        if TOKEN_RECHECK_SECONDS > 0:
+            cache.set(
+                key,
+                {
+                    **verdict,
+                    'recheck_after': min(
+                        now + TOKEN_RECHECK_SECONDS,
+                        stale_until),
+                },
+                stale_until - now)
+        return True
+
+    cache.set(
+        key,
+        {'valid': valid, 'checked_at': time.time()},
+        (TOKEN_CACHE_SECONDS + TOKEN_STALE_SECONDS)
+        if valid
+        else INVALID_TOKEN_CACHE_SECONDS)
+
+    return valid
 
 
 def token_is_valid(api_key: str) -> bool:
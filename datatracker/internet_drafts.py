@@ -6,12 +6,13 @@ for “Internet-Draft” document identifier type.
 """
 
 import logging
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 import ast
 import datetime
 import re
 import json
 
+import httpx
 import requests
 
 from bib_models import construct_bibitem
@@ -19,11 +20,12 @@ from main.types import ExternalBibliographicItem, ExternalSourceMeta
 from main.exceptions import RefNotFoundError
 from main import external_sources
 
-from .request import get, BASE_DOMAIN
+from .request import get, aget, BASE_DOMAIN
 
 
 __all__ = (
     'get_internet_draft',
+    'aget_internet_draft',
     'remove_version',
     'version_re',
 )
@@ -63,7 +65,7 @@ def get_internet_draft(
     """Retrieves an Internet Draft from Datatracker in Relaton format.
 
     Makes necessary requests to Datatracker API
-    and converts .
+    and converts responses using :func:`.construct_internet_draft()`.
 
     :param str docid:
     :param bool strict: see :ref:`strict-validation`
@@ -81,6 +83,85 @@ def get_internet_draft(
 
     data = resp.json()
 
+    latest_submission_data: Optional[Dict[str, Any]] = None
+    if latest_submission_url := get_latest_submission_url(data):
+        try:
+            latest_submission_data = get(latest_submission_url).json()
+        except (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+        ):
+            pass
+
+    return construct_internet_draft(
+        versionless,
+        data,
+        latest_submission_data,
+        strict)
+
+
+@external_sources.register_async('datatracker')
+async def aget_internet_draft(
+    docid: str,
+    strict: bool = True,
+) -> ExternalBibliographicItem:
+    """Like :func:`.get_internet_draft()`,
+    but doesn’t block the event loop while waiting for Datatracker."""
+
+    versionless, _ = remove_version(docid)
+
+    resp = await aget(f'/api/v1/doc/document/{versionless}/')
+
+    if resp.status_code == 404:
+        raise RefNotFoundError()
+
+    data = resp.json()
+
+    latest_submission_data: Optional[Dict[str, Any]] = None
+    if latest_submission_url := get_latest_submission_url(data):
+        try:
+            latest_submission_data = \
+                (await aget(latest_submission_url)).json()
+        except httpx.TransportError:
+            pass
+
+    return construct_internet_draft(
+        versionless,
+        data,
+        latest_submission_data,
+        strict)
+
+
+def get_latest_submission_url(data: Dict[str, Any]) -> Optional[str]:
+    """Given Datatracker document data,
+    returns the endpoint for the latest submission, if any.
+
+    Some data (e.g., authors and dates) is only available
+    via separate submission endpoint.
+    """
+    try:
+        return data['submissions'][-1]
+    except (IndexError, KeyError):
+        log.warning(
+            "Unable to retrieve complete Internet Draft metadata: "
+            "no submissions available")
+        return None
+
+
+def construct_internet_draft(
+    versionless: str,
+    data: Dict[str, Any],
+    latest_submission_data: Optional[Dict[str, Any]],
+    strict: bool = True,
+) -> ExternalBibliographicItem:
+    """Converts Datatracker document and submission data
+    into a bibliographic item.
+
+    :param str versionless: versionless Internet Draft name
+    :param bool strict: see :ref:`strict-validation`
+    :rtype: main.types.ExternalBibliographicItem
+    """
+
     bibitem_data: Dict[str, Any] = dict(
         type='draft',
         abstract=[{
@@ -108,64 +189,51 @@ def get_internet_draft(
         contributor=[],
     )
 
-    # Some data (e.g., authors and dates) is only available
-    # via separate submission endpoint
-    try:
-        latest_submission_url = data['submissions'][-1]
-    except IndexError:
-        log.warning(
-            "Unable to retrieve complete Internet Draft metadata: "
-            "no submissions available")
-    else:
-        try:
-            latest_submission_data = get(latest_submission_url).json()
-        except requests.exceptions.ConnectionError:
-            pass
-        else:
-            if 'document_date' in latest_submission_data:
-                bibitem_data['date'] = [{
-                    'type': 'created',
-                    'value': latest_submission_data['document_date'],
-                }, {
-                    'type': 'submitted',
-                    'value': latest_submission_data['submission_date'],
-                }]
-
-            if 'authors' in latest_submission_data:
-                authors: List[Any]
-                if isinstance(latest_submission_data['authors'], list):
-                    authors = latest_submission_data['authors']
-                elif isinstance(latest_submission_data['authors'], str):
+    if latest_submission_data is not None:
+        if 'document_date' in latest_submission_data:
+            bibitem_data['date'] = [{
+                'type': 'created',
+                'value': latest_submission_data['document_date'],
+            }, {
+                'type': 'submitted',
+                'value': latest_submission_data['submission_date'],
+            }]
+
+        if 'authors' in latest_submission_data:
+            authors: List[Any]
+            if isinstance(latest_submission_data['authors'], list):
+                authors = latest_submission_data['authors']
+            elif isinstance(latest_submission_data['authors'], str):
+                try:
+                    authors = json.loads(latest_submission_data['authors'])
+                except json.JSONDecodeError:
                     try:
-                        authors = json.loads(latest_submission_data['authors'])
-                    except json.JSONDecodeError:
-                        try:
-                            # IMPORTANT: Using literal_eval means we assume
-                            # Datatracker’s responses are always trustworthy.
-                            # The reason we’re using it is because Datatracker
-                            # appears to return something like Python’s repr()
-                            # of a list sometimes here
-                            # (i.e., not JSON-decodable)
-                            authors = ast.literal_eval(
-                                latest_submission_data['authors'])
-                        except (ValueError, SyntaxError):
-                            authors = []
-                else:
-                    authors = []
-                if authors:
-                    bibitem_data['contributor'] += [
-                        {
-                            'role': ['author'],
-                            'person': {
-                                'name': {
-                                    'completename': {
-                                        'content': a['name']
-                                    },
+                        # IMPORTANT: Using literal_eval means we assume
+                        # Datatracker’s responses are always trustworthy.
+                        # The reason we’re using it is because Datatracker
+                        # appears to return something like Python’s repr()
+                        # of a list sometimes here
+                        # (i.e., not JSON-decodable)
+                        authors = ast.literal_eval(
+                            latest_submission_data['authors'])
+                    except (ValueError, SyntaxError):
+                        authors = []
+            else:
+                authors = []
+            if authors:
+                bibitem_data['contributor'] += [
+                    {
+                        'role': ['author'],
+                        'person': {
+                            'name': {
+                                'completename': {
+                                    'content': a['name']
                                 },
                             },
-                        }
-                        for a in authors
-                    ]
+                        },
+                    }
+                    for a in authors
+                ]
 
     bibitem, errors = construct_bibitem(bibitem_data, strict)
 
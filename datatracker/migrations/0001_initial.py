@@ -0,0 +1,28 @@
+# Generated by Django 4.2.30 on 2026-10-17 04:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InternetDraft',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True)),
+                ('rev', models.CharField(max_length=16)),
+                ('title', models.TextField()),
+                ('abstract', models.TextField(blank=True)),
+                ('submission_date', models.DateField(db_index=True)),
+                ('document_date', models.DateField(null=True)),
+                ('authors', models.JSONField(default=list)),
+                ('synced_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
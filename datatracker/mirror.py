@@ -0,0 +1,164 @@
+"""Local mirror of latest Internet Draft revisions.
+
+Resolving unversioned Internet Draft paths requires knowing
+the latest revision of a draft, which used to mean
+querying Datatracker on every request.
+Instead, :func:`.sync_internet_drafts()` periodically
+(see :data:`bibxml.settings.DATATRACKER_DRAFT_SYNC_INTERVAL`)
+reads posted submissions from Datatracker and records
+the latest revision of each draft
+in :class:`datatracker.models.InternetDraft`,
+and :func:`.get_mirrored_internet_draft()` consults that table first.
+
+.. note::
+
+   The mirror can lag behind Datatracker
+   by up to the sync interval.
+"""
+
+import datetime
+import logging
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+
+from main.types import ExternalBibliographicItem
+
+from .internet_drafts import get_internet_draft, construct_internet_draft
+from .internet_drafts import remove_version
+from .models import InternetDraft
+from .request import get
+
+
+__all__ = (
+    'get_mirrored_internet_draft',
+    'sync_internet_drafts',
+)
+
+
+log = logging.getLogger(__name__)
+
+
+DRAFT_SYNC_INITIAL_DAYS: int = getattr(
+    settings,
+    'DATATRACKER_DRAFT_SYNC_INITIAL_DAYS',
+    365)
+
+DRAFT_SYNC_PAGE_SIZE = 500
+
+SUBMISSIONS_ENDPOINT = '/api/v1/submit/submission/'
+
+
+def get_mirrored_internet_draft(
+    docid: str,
+    strict: bool = True,
+) -> ExternalBibliographicItem:
+    """Like :func:`datatracker.internet_drafts.get_internet_draft()`,
+    but uses the mirror if it has given draft,
+    and only queries Datatracker otherwise.
+
+    :param str docid: draft name, possibly with version (which is ignored)
+    :param bool strict: see :ref:`strict-validation`
+    :rtype: main.types.ExternalBibliographicItem
+    """
+    versionless, _ = remove_version(docid)
+    try:
+        draft = InternetDraft.objects.get(name=versionless)
+    except InternetDraft.DoesNotExist:
+        return get_internet_draft(docid, strict)
+    else:
+        data, latest_submission_data = draft.as_datatracker_data()
+        return construct_internet_draft(
+            versionless,
+            data,
+            latest_submission_data,
+            strict)
+
+
+def sync_internet_drafts(
+    since: Optional[datetime.date] = None,
+) -> int:
+    """Records latest revisions of drafts posted since given date.
+
+    By default, continues from the latest submission date in the mirror,
+    or starts :data:`bibxml.settings.DATATRACKER_DRAFT_SYNC_INITIAL_DAYS`
+    ago if the mirror is empty.
+
+    Submissions are read in order of posting,
+    so later revisions overwrite earlier ones.
+
+    :returns: number of submissions recorded
+    :raises requests.RequestException: failed to query Datatracker
+    """
+    if since is None:
+        latest = InternetDraft.objects.order_by(
+            '-submission_date',
+        ).values_list('submission_date', flat=True).first()
+        since = latest or (
+            datetime.date.today()
+            - datetime.timedelta(days=DRAFT_SYNC_INITIAL_DAYS))
+
+    endpoint: Optional[str] = (
+        f'{SUBMISSIONS_ENDPOINT}'
+        f'?state=posted'
+        f'&submission_date__gte={since.isoformat()}'
+        f'&order_by=submission_date'
+        f'&limit={DRAFT_SYNC_PAGE_SIZE}'
+    )
+    recorded = 0
+
+    while endpoint:
+        resp = get(endpoint)
+        resp.raise_for_status()
+        page = resp.json()
+
+        drafts: Dict[str, InternetDraft] = {}
+        for submission in page['objects']:
+            if draft := _draft_from_submission(submission):
+                drafts[draft.name] = draft
+
+        InternetDraft.objects.bulk_create(
+            drafts.values(),
+            update_conflicts=True,
+            unique_fields=['name'],
+            update_fields=[
+                'rev',
+                'title',
+                'abstract',
+                'submission_date',
+                'document_date',
+                'authors',
+                'synced_at',
+            ],
+        )
+        recorded += len(drafts)
+
+        endpoint = page['meta'].get('next')
+
+    log.info(
+        "Recorded %s Internet Draft revisions posted since %s",
+        recorded,
+        since)
+
+    return recorded
+
+
+def _draft_from_submission(
+    submission: Dict[str, Any],
+) -> Optional[InternetDraft]:
+    try:
+        return InternetDraft(
+            name=submission['name'],
+            rev=submission['rev'],
+            title=submission['title'],
+            abstract=submission.get('abstract') or '',
+            submission_date=submission['submission_date'],
+            document_date=submission.get('document_date') or None,
+            authors=submission.get('authors') or [],
+            synced_at=datetime.datetime.now(datetime.timezone.utc),
+        )
+    except KeyError:
+        log.warning(
+            "Skipping malformed Datatracker submission %s",
+            submission.get('resource_uri'))
+        return None
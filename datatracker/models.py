@@ -0,0 +1,53 @@
+from typing import Any, Dict, Tuple
+
+from django.db import models
+
+
+class InternetDraft(models.Model):
+    """Latest posted revision of an Internet Draft,
+    mirrored from Datatracker.
+
+    .. seealso:: :mod:`datatracker.mirror`
+    """
+
+    name = models.CharField(max_length=255, unique=True)
+    """Versionless draft name, e.g. ``draft-ietf-foo-bar``."""
+
+    rev = models.CharField(max_length=16)
+    """Latest posted revision, e.g. ``03``."""
+
+    title = models.TextField()
+
+    abstract = models.TextField(blank=True)
+
+    submission_date = models.DateField(db_index=True)
+    """When the latest revision was posted.
+    Used as the cursor when syncing."""
+
+    document_date = models.DateField(null=True)
+
+    authors = models.JSONField(default=list)
+    """Authors as given by Datatracker for the latest submission.
+    Normally a list of objects with ``name`` key,
+    but could be a string."""
+
+    synced_at = models.DateTimeField(auto_now=True)
+
+    def as_datatracker_data(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Returns a 2-tuple of document data and latest submission data
+        in the shape returned by Datatracker API, limited to mirrored fields,
+        for use with
+        :func:`datatracker.internet_drafts.construct_internet_draft()`.
+        """
+        return dict(
+            name=self.name,
+            rev=self.rev,
+            title=self.title,
+            abstract=self.abstract,
+        ), dict(
+            submission_date=self.submission_date.isoformat(),
+            document_date=(
+                self.document_date or self.submission_date
+            ).isoformat(),
+            authors=self.authors,
+        )
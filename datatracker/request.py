@@ -1,4 +1,22 @@
+"""Making requests to Datatracker API.
+
+Synchronous requests go through a module-level :data:`.session`,
+which keeps connections to Datatracker alive between requests
+and retries failed requests with backoff.
+All requests time out (see :data:`.timeout`),
+and their durations are tracked
+in :data:`prometheus.metrics.datatracker_request_duration`.
+"""
+
+from typing import Tuple
+
+from django.conf import settings
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from prometheus import metrics
 
 
 BASE_AUTH_DOMAIN = 'https://auth.ietf.org/'
@@ -8,16 +26,63 @@ BASE_DOMAIN = 'https://datatracker.ietf.org'
 """Base domain for Datatracker API."""
 
 
+timeout: Tuple[float, float] = (
+    getattr(settings, 'DATATRACKER_CONNECT_TIMEOUT', 3.05),
+    getattr(settings, 'DATATRACKER_READ_TIMEOUT', 10),
+)
+"""Connect and read timeouts, in seconds,
+applied to every request to Datatracker API."""
+
+
+session = requests.Session()
+"""Session used for requests to Datatracker API.
+Shared by all threads of the process."""
+
+session.mount(BASE_DOMAIN, HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=getattr(settings, 'DATATRACKER_POOL_SIZE', 10),
+    max_retries=Retry(
+        total=getattr(settings, 'DATATRACKER_MAX_RETRIES', 2),
+        backoff_factor=getattr(settings, 'DATATRACKER_RETRY_BACKOFF', 0.5),
+        status_forcelist=[502, 503, 504],
+        # Return the last response rather than raise
+        # if gateway errors persist, as before retries were introduced
+        raise_on_status=False,
+    ),
+))
+
+
+def get_endpoint_label(endpoint: str) -> str:
+    """Returns endpoint with object ID replaced with a placeholder,
+    for use as a metric label.
+
+    >>> get_endpoint_label('/api/v1/doc/document/draft-foo-bar/')
+    '/api/v1/doc/document/{id}/'
+    """
+    path = endpoint.split('?')[0]
+    if path.startswith(BASE_DOMAIN):
+        path = path[len(BASE_DOMAIN):]
+    parts = path.strip('/').split('/')
+    if parts[:2] == ['api', 'v1'] and len(parts) > 4:
+        parts = [*parts[:4], '{id}']
+    return '/%s/' % '/'.join(parts)
+
+
 def post(endpoint: str, api_key: str) -> requests.Response:
     """Handles Datatracker authenticated POST request.
 
     :param str endpoint: Endpoint URL relative to :data:`.BASE_DOMAIN`,
         with leading slash.
     """
-    return requests.post(
-        f'{BASE_DOMAIN}{endpoint}',
-        files={'apikey': (None, api_key)},
-    )
+    with metrics.datatracker_request_duration.labels(
+        get_endpoint_label(endpoint),
+        'POST',
+    ).time():
+        return session.post(
+            f'{BASE_DOMAIN}{endpoint}',
+            files={'apikey': (None, api_key)},
+            timeout=timeout,
+        )
 
 
 def get(endpoint: str, format='json') -> requests.Response:
@@ -26,7 +91,38 @@ def get(endpoint: str, format='json') -> requests.Response:
     :param str endpoint: Endpoint URL relative to :data:`.BASE_DOMAIN`,
         with leading slash.
     """
-    return requests.get(
-        f'{BASE_DOMAIN}{endpoint}',
-        params={'format': format} if format else None,
-    )
+    with metrics.datatracker_request_duration.labels(
+        get_endpoint_label(endpoint),
+        'GET',
+    ).time():
+        return session.get(
+            f'{BASE_DOMAIN}{endpoint}',
+            params={'format': format} if format else None,
+            timeout=timeout,
+        )
+
+
+async def aget(endpoint: str, format='json') -> httpx.Response:
+    """Like :func:`.get`, but doesn’t block the event loop.
+
+    Uses the same timeouts, but retries only failed connection attempts.
+
+    :param str endpoint: Endpoint URL relative to :data:`.BASE_DOMAIN`,
+        with leading slash.
+    """
+    connect_timeout, read_timeout = timeout
+    async with httpx.AsyncClient(
+        base_url=BASE_DOMAIN,
+        timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+        transport=httpx.AsyncHTTPTransport(
+            retries=getattr(settings, 'DATATRACKER_MAX_RETRIES', 2),
+        ),
+    ) as client:
+        with metrics.datatracker_request_duration.labels(
+            get_endpoint_label(endpoint),
+            'GET',
+        ).time():
+            return await client.get(
+                endpoint,
+                params={'format': format} if format else None,
+            )
@@ -0,0 +1,27 @@
+"""
+Celery task for keeping the Internet Draft mirror up to date.
+"""
+from celery.utils.log import get_task_logger
+
+from sources.celery import app
+
+from . import mirror
+
+
+logger = get_task_logger(__name__)
+
+
+def sync_internet_drafts_task() -> int:
+    """Records drafts posted since the last sync,
+    see :func:`datatracker.mirror.sync_internet_drafts`.
+
+    :returns: number of submissions recorded
+    """
+    try:
+        return mirror.sync_internet_drafts()
+    except Exception:
+        logger.exception("Failed to sync Internet Drafts from Datatracker")
+        raise
+
+
+sync_internet_drafts = app.task(sync_internet_drafts_task)
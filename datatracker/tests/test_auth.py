@@ -0,0 +1,134 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import requests
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from datatracker import auth
+
+
+class TokenCacheTestCase(SimpleTestCase):
+    """
+    Test cases for caching Datatracker token verdicts.
+    """
+
+    token = 'token-cache-test'
+
+    def setUp(self):
+        cache.delete(auth.get_token_cache_key(self.token))
+
+    def tearDown(self):
+        cache.delete(auth.get_token_cache_key(self.token))
+
+    def test_verdicts_are_cached(self):
+        for verdict in [True, False]:
+            cache.delete(auth.get_token_cache_key(self.token))
+            with mock.patch.object(
+                auth, 'token_is_valid',
+                return_value=verdict,
+            ) as token_is_valid:
+                self.assertEqual(
+                    auth.token_is_valid_cached(self.token),
+                    verdict)
+                self.assertEqual(
+                    auth.token_is_valid_cached(self.token),
+                    verdict)
+                self.assertEqual(token_is_valid.call_count, 1)
+
+    def test_token_is_not_stored(self):
+        self.assertNotIn(self.token, auth.get_token_cache_key(self.token))
+
+    def test_stale_verdict_is_used_if_datatracker_fails(self):
+        cache.set(auth.get_token_cache_key(self.token), {
+            'valid': True,
+            'checked_at': time.time() - auth.TOKEN_CACHE_SECONDS - 1,
+        })
+        with mock.patch.object(
+            auth, 'token_is_valid',
+            side_effect=requests.ConnectionError,
+        ):
+            self.assertTrue(auth.token_is_valid_cached(self.token))
+        self.assertNotIn(
+            auth.get_token_cache_key(self.token),
+            auth._validations)
+
+    def test_unknown_token_fails_if_datatracker_fails(self):
+        with mock.patch.object(
+            auth, 'token_is_valid',
+            side_effect=requests.ConnectionError,
+        ):
+            with self.assertRaises(requests.ConnectionError):
+                auth.token_is_valid_cached(self.token)
+        self.assertNotIn(
+            auth.get_token_cache_key(self.token),
+            auth._validations)
+
+    def _validate_concurrently(self, side_effect, threads=5):
+        """Validates the token in given number of threads at once,
+        with Datatracker responding only after all of them are waiting.
+        Returns ``token_is_valid`` mock and a list of outcomes."""
+        join = mock.Mock(wraps=auth._join_validation)
+
+        def respond():
+            deadline = time.monotonic() + 5
+            while join.call_count < threads and time.monotonic() < deadline:
+                time.sleep(0.01)
+            return side_effect()
+
+        def validate():
+            try:
+                return auth.token_is_valid_cached(self.token)
+            except Exception as err:
+                return err
+
+        with mock.patch.object(auth, '_join_validation', join), \
+             mock.patch.object(
+                 auth, 'token_is_valid',
+                 side_effect=lambda api_key: respond(),
+             ) as token_is_valid:
+            with ThreadPoolExecutor(threads) as executor:
+                outcomes = list(executor.map(
+                    lambda _: validate(),
+                    range(threads)))
+
+        return token_is_valid, outcomes
+
+    def test_concurrent_validations_are_deduplicated(self):
+        token_is_valid, outcomes = self._validate_concurrently(
+            lambda: True)
+        self.assertEqual(token_is_valid.call_count, 1)
+        self.assertEqual(outcomes, [True] * 5)
+
+    def test_concurrent_validations_share_failure(self):
+        def fail():
+            raise requests.ConnectionError()
+
+        token_is_valid, outcomes = self._validate_concurrently(fail)
+        self.assertEqual(token_is_valid.call_count, 1)
+        for outcome in outcomes:
+            self.assertIsInstance(outcome, requests.ConnectionError)
+        self.assertNotIn(
+            auth.get_token_cache_key(self.token),
+            auth._validations)
+
+    def test_stale_verdict_is_used_without_retrying_for_a_while(self):
+        cache.set(auth.get_token_cache_key(self.token), {
+            'valid': True,
+            'checked_at': time.time() - auth.TOKEN_CACHE_SECONDS - 1,
+        })
+
+        def fail():
+            raise requests.ConnectionError()
+
+        token_is_valid, outcomes = self._validate_concurrently(fail)
+        self.assertEqual(token_is_valid.call_count, 1)
+        self.assertEqual(outcomes, [True] * 5)
+
+        with mock.patch.object(
+            auth, 'token_is_valid',
+            side_effect=requests.ConnectionError,
+        ) as token_is_valid:
+            self.assertTrue(auth.token_is_valid_cached(self.token))
+        token_is_valid.assert_not_called()
@@ -0,0 +1,89 @@
+import datetime
+from unittest import mock
+
+from django.test import TestCase
+
+from datatracker import mirror
+from datatracker.models import InternetDraft
+
+
+def _submission(name: str, rev: str, date: str):
+    return {
+        'name': name,
+        'rev': rev,
+        'title': f'Title of {name}',
+        'abstract': 'Abstract',
+        'submission_date': date,
+        'document_date': date,
+        'authors': [{'name': 'Jane Doe'}],
+    }
+
+
+class InternetDraftMirrorTestCase(TestCase):
+    """
+    Test cases for mirroring Internet Drafts from Datatracker.
+    """
+
+    def _mock_pages(self, *pages):
+        responses = []
+        for idx, objects in enumerate(pages):
+            resp = mock.Mock()
+            resp.json.return_value = {
+                'meta': {
+                    'next': (
+                        f'/api/v1/submit/submission/?offset={idx + 1}'
+                        if idx < len(pages) - 1
+                        else None),
+                },
+                'objects': objects,
+            }
+            responses.append(resp)
+        return mock.patch.object(mirror, 'get', side_effect=responses)
+
+    def test_sync_keeps_latest_revision(self):
+        with self._mock_pages([
+            _submission('draft-foo-bar', '00', '2022-01-01'),
+            _submission('draft-foo-baz', '03', '2022-01-02'),
+        ], [
+            _submission('draft-foo-bar', '01', '2022-02-01'),
+        ]) as get:
+            recorded = mirror.sync_internet_drafts(datetime.date(2022, 1, 1))
+
+        self.assertEqual(get.call_count, 2)
+        self.assertEqual(recorded, 3)
+        self.assertEqual(
+            InternetDraft.objects.get(name='draft-foo-bar').rev,
+            '01')
+
+    def test_sync_continues_from_latest_submission(self):
+        InternetDraft.objects.create(
+            name='draft-foo-bar',
+            rev='00',
+            title='Foo',
+            submission_date=datetime.date(2022, 3, 1))
+
+        with self._mock_pages([]) as get:
+            mirror.sync_internet_drafts()
+
+        self.assertIn('submission_date__gte=2022-03-01', get.call_args[0][0])
+
+    def test_mirrored_draft_does_not_query_datatracker(self):
+        InternetDraft.objects.create(
+            name='draft-foo-bar',
+            rev='02',
+            title='Foo',
+            submission_date=datetime.date(2022, 3, 1),
+            authors=[{'name': 'Jane Doe'}])
+
+        with mock.patch.object(mirror, 'get_internet_draft') as live:
+            item = mirror.get_mirrored_internet_draft('draft-foo-bar-01')
+
+        live.assert_not_called()
+        self.assertEqual(item.bibitem.version[0].draft, '02')  # type: ignore[index]
+        self.assertEqual(len(item.bibitem.contributor or []), 1)
+
+    def test_missing_draft_queries_datatracker(self):
+        with mock.patch.object(mirror, 'get_internet_draft') as live:
+            mirror.get_mirrored_internet_draft('draft-foo-bar')
+
+        live.assert_called_once_with('draft-foo-bar', True)
@@ -3,8 +3,10 @@
 Registers an external source.
 """
 
+import json
 import logging
 
+import httpx
 import requests
 import requests_cache
 from simplejson import JSONDecodeError
@@ -13,7 +15,7 @@ from bib_models import DocID
 from main.types import ExternalBibliographicItem
 from main import external_sources
 
-from .crossref import get_bibitem
+from .crossref import get_bibitem, aget_bibitem
 
 
 log = logging.getLogger(__name__)
@@ -47,3 +49,25 @@ def get_doi_ref(
             raise
         else:
             return sourced_item
+
+
+@external_sources.register_async('doi')
+async def aget_doi_ref(
+    doi: str,
+    strict: bool = True,
+) -> ExternalBibliographicItem:
+    """
+    Like :func:`.get_doi_ref`, but doesn’t block the event loop.
+
+    :raises main.exceptions.RefNotFoundError: reference not found
+    """
+
+    try:
+        return await aget_bibitem(DocID(
+            type='DOI',
+            id=doi,
+        ), strict=strict)
+    except httpx.HTTPError:
+        raise RuntimeError("Error connecting to external source")
+    except json.JSONDecodeError:
+        raise RuntimeError("Could not decode external source response")
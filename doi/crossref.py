@@ -1,6 +1,7 @@
 """Responsible for Crossref interaction."""
 from typing import List, Dict, Any, Optional
 
+import httpx
 from crossref.restful import Works, Etiquette
 from django.conf import settings
 from django.core.cache import cache
@@ -29,6 +30,15 @@ etiquette = Etiquette(
 
 works = Works(etiquette=etiquette)
 
+WORKS_ENDPOINT = 'https://api.crossref.org/works'
+"""Crossref endpoint for retrieving works by DOI."""
+
+NOT_FOUND_MESSAGE = (
+    "There was a problem retrieving DOI data. "
+    "This can be caused by an invalid id or by "
+    "Crossref (the service we retrieve DOI data "
+    "from) being unavailable at the moment. Try again later!")
+
 ACCEPTED_DATE_TYPES = ["published", "accessed", "created", "implemented", "obsoleted",
                        "confirmed", "updated", "issued", "transmitted", "copied", "unchanged",
                        "circulated", "adapted", "vote-started", "vote-ended", "announced"]
@@ -58,12 +68,51 @@ def get_bibitem(docid: DocID, strict: bool = True) \
     if not resp:
         resp = works.doi(docid.id)
         if not resp:
-            raise RefNotFoundError("There was a problem retrieving DOI data. "
-                                   "This can be caused by an invalid id or by "
-                                   "Crossref (the service we retrieve DOI data "
-                                   "from) being unavailable at the moment. Try again later!")
+            raise RefNotFoundError(NOT_FOUND_MESSAGE)
         cache.set(f'DOI_{docid.id}', resp, DEFAULT_CACHE_SECONDS)
 
+    return construct_doi_bibitem(resp, strict)
+
+
+async def aget_bibitem(docid: DocID, strict: bool = True) \
+        -> ExternalBibliographicItem:
+    """Like :func:`.get_bibitem`,
+    but doesn’t block the event loop while waiting for Crossref.
+
+    :raises httpx.HTTPError: error communicating with Crossref
+    """
+
+    if docid.type != 'DOI':
+        raise ValueError(
+            "DOI source requires DOI docid.type",
+            repr(docid))
+
+    resp = await cache.aget(f'DOI_{docid.id}')
+    if not resp:
+        async with httpx.AsyncClient(
+            headers={'user-agent': str(etiquette)},
+        ) as client:
+            result = await client.get(f'{WORKS_ENDPOINT}/{docid.id}')
+        if result.status_code == 404:
+            raise RefNotFoundError(NOT_FOUND_MESSAGE)
+        result.raise_for_status()
+        resp = result.json()['message']
+        await cache.aset(f'DOI_{docid.id}', resp, DEFAULT_CACHE_SECONDS)
+
+    return construct_doi_bibitem(resp, strict)
+
+
+def construct_doi_bibitem(resp: Dict[str, Any], strict: bool = True) \
+        -> ExternalBibliographicItem:
+    """Deserializes work data returned by Crossref
+    into a :class:`main.types.ExternalBibliographicItem` instance.
+
+    :param bool strict: see :ref:`strict-validation`
+    :rtype: main.types.ExternalBibliographicItem
+    :raises pydantic.ValidationError:
+        strict is True and Relaton data failed to validate
+    """
+
     docids: List[DocID] = [
         DocID(type='DOI', id=resp['DOI']),
 
@@ -127,7 +176,7 @@ def get_bibitem(docid: DocID, strict: bool = True) \
     dates = []
     for date_type in ACCEPTED_DATE_TYPES:
         if resp.get(date_type):
-            date_parts = resp.get(date_type).get('date-parts')
+            date_parts = resp[date_type].get('date-parts')
             for _part in date_parts:
                 if isinstance(_part[0], int):
                     date = "%04d" % _part[0]
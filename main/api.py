@@ -1,32 +1,58 @@
 """View functions for API endpoints."""
 
-from typing import Dict, Any, Optional
+import asyncio
+import json
+import logging
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 from urllib.parse import unquote_plus
 
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import TextField
+from django.db.models.functions import Cast, MD5
 from django.http import HttpResponse, HttpResponseBadRequest, JsonResponse
+from asgiref.sync import sync_to_async
 
 from pydantic import ValidationError
 from relaton.serializers.bibxml.anchor import get_suitable_anchor
 from relaton.models import DocID
 
+from common.decorators import condition
 from common.pydantic import unpack_dataclasses
 from common.util import as_list
 from bib_models import BibliographicItem, serializers
 from prometheus import metrics
-from doi import get_doi_ref as _get_doi_ref
+from doi import aget_doi_ref as _aget_doi_ref
 
 from .search import BaseCitationSearchView
+from .models import RefData
+from .conditional import make_etag, get_last_modified
 from .query import get_indexed_item
-from .query import build_citation_for_docid
+from .query import build_citation_for_docid, build_citations_in_batch
+from .query import search_refs_docids
 from .exceptions import RefNotFoundError
 from .types import ExternalBibliographicItem
 from . import external_sources
 
 
+API_BATCH_MAX_ITEMS: int = getattr(settings, 'API_BATCH_MAX_ITEMS', 500)
+
+API_BATCH_EXTERNAL_CONCURRENCY: int = getattr(
+    settings,
+    'API_BATCH_EXTERNAL_CONCURRENCY',
+    10)
+
+
+log = logging.getLogger(__name__)
+
+
 # TODO: Make ``get_doi_ref`` logic part of ``get_by_docid``
-def get_doi_ref(request, ref):
+async def get_doi_ref(request, ref):
     """Retrieves a citation using DOI from Crossref.
     ``format``, ``anchor`` handling equivalent to :func:`get_by_docid`.
+
+    Doesn’t block the event loop while waiting for Crossref.
     """
 
     format = request.GET.get('format', 'relaton')
@@ -39,7 +65,7 @@ def get_doi_ref(request, ref):
     parsed_ref = unquote_plus(ref)
 
     try:
-        bibitem = _get_doi_ref(parsed_ref).bibitem
+        bibitem = (await _aget_doi_ref(parsed_ref)).bibitem
 
     except RefNotFoundError:
         return JsonResponse({
@@ -76,7 +102,99 @@ def get_doi_ref(request, ref):
                     charset='utf-8')
 
 
-def get_by_docid(request):
+async def aget_external_item(
+    docid: str,
+    doctype: str,
+) -> Optional[ExternalBibliographicItem]:
+    """Tries external sources that apply to given document identifier,
+    returns the first item obtained or None.
+
+    Doesn’t block the event loop
+    (see :func:`main.external_sources.aget_item`)."""
+    for ext_s in external_sources.registry.values():
+        if ext_s.applies_to(DocID(id=docid, type=doctype)):
+            try:
+                return await external_sources.aget_item(ext_s, docid, None)
+            except (RefNotFoundError, RuntimeError):
+                continue
+    return None
+
+
+async def aget_external_items(
+    docids: Sequence[Tuple[str, str]],
+) -> List[Optional[ExternalBibliographicItem]]:
+    """Like :func:`aget_external_item`, but for many
+    (docid, doctype) pairs at once.
+
+    At most :data:`bibxml.settings.API_BATCH_EXTERNAL_CONCURRENCY`
+    items are requested from external sources at a time.
+    Items that could not be obtained for any reason are None.
+    """
+    semaphore = asyncio.Semaphore(max(API_BATCH_EXTERNAL_CONCURRENCY, 1))
+
+    async def get(docid: str, doctype: str):
+        async with semaphore:
+            try:
+                return await aget_external_item(docid, doctype)
+            except Exception:
+                log.exception(
+                    "Failed to obtain %s (%s) from external sources",
+                    docid, doctype)
+                return None
+
+    return list(await asyncio.gather(*(
+        get(docid, doctype)
+        for docid, doctype in docids
+    )))
+
+
+def get_indexed_docid_digest(request) -> Optional[str]:
+    """Returns a digest of indexed data matching document identifier
+    requested via GET query, or None if there is no such data
+    (and the item could only come from an external source).
+
+    The digest is computed once and memoized on the request,
+    so that ETag and Last-Modified functions can share it."""
+    if not hasattr(request, '_indexed_docid_digest'):
+        request._indexed_docid_digest = _get_indexed_docid_digest(
+            request.GET.get('docid'),
+            request.GET.get('doctype', None))
+    return request._indexed_docid_digest
+
+
+def _get_indexed_docid_digest(
+    docid: Optional[str],
+    doctype: Optional[str],
+) -> Optional[str]:
+    if not docid:
+        return None
+    digests = sorted(
+        search_refs_docids(
+            DocID(id=docid.strip(), type=doctype.strip())
+            if doctype
+            else docid.strip()
+        ).
+        annotate(digest=MD5(Cast('body', TextField()))).
+        values_list('digest', flat=True))
+    return ','.join(digests) if digests else None
+
+
+def get_by_docid_etag(request) -> Optional[str]:
+    if digest := get_indexed_docid_digest(request):
+        return make_etag(request, digest)
+    return None
+
+
+def get_by_docid_last_modified(request) -> Optional[datetime]:
+    if get_indexed_docid_digest(request) is not None:
+        return get_last_modified()
+    return None
+
+
+@condition(
+    etag_func=get_by_docid_etag,
+    last_modified_func=get_by_docid_last_modified)
+async def get_by_docid(request):
     """Obtains item by ``doctype`` and ``docid`` specified in GET query,
     returns serialized using specified ``format`` (“relaton” by default).
 
@@ -90,6 +208,18 @@ def get_by_docid(request):
     (either given in GET query
     or obtained via
     :func:`relaton.serializers.bibxml.anchor.get_suitable_anchor()`).
+
+    Supports conditional requests (see :mod:`main.conditional`)
+    for indexed items. Since the item may come from any indexed source,
+    validators change whenever any source is reindexed,
+    and ETag is also derived from matching indexed item data.
+
+    .. note:: Items obtained from external sources as a fallback
+              have no validators, since those sources can change
+              at any time.
+
+    Indexed sources are queried in a thread,
+    and external sources are queried without blocking the event loop.
     """
 
     doctype, docid = request.GET.get('doctype', None), request.GET.get('docid')
@@ -115,7 +245,9 @@ def get_by_docid(request):
 
     try:
         try:
-            bibitem: BibliographicItem = build_citation_for_docid(
+            bibitem: BibliographicItem = await sync_to_async(
+                build_citation_for_docid,
+            )(
                 docid.strip(),
                 doctype.strip() if doctype else None,
                 strict=True)
@@ -123,19 +255,7 @@ def get_by_docid(request):
         except RefNotFoundError:
             if doctype is not None and check_external == 'last_resort':
                 # As a fallback, try external sources.
-                sources = [
-                    ext_s
-                    for ext_s in external_sources.registry.values()
-                    if ext_s.applies_to(DocID(id=docid, type=doctype))
-                ]
-                for ext_s in sources:
-                    external_bibitem: Optional[ExternalBibliographicItem]
-                    try:
-                        external_bibitem = ext_s.get_item(docid, None)
-                    except (RefNotFoundError, RuntimeError):
-                        external_bibitem = None
-                    else:
-                        break
+                external_bibitem = await aget_external_item(docid, doctype)
                 if external_bibitem:
                     bibitem = external_bibitem.bibitem
                 else:
@@ -202,6 +322,183 @@ def get_by_docid(request):
     return resp
 
 
+async def get_by_docids(request):
+    """Obtains many items by document identifiers at once.
+
+    Expects a JSON object in POST body, with ``items``
+    (a list of objects with ``docid`` and optional ``doctype``
+    and ``anchor`` keys) and optional ``format``
+    and ``check_external_sources`` keys,
+    which work the same way as in :func:`get_by_docid`.
+    At most :data:`bibxml.settings.API_BATCH_MAX_ITEMS` items
+    can be requested.
+
+    Items are built using :func:`main.query.build_citations_in_batch`,
+    so that the number of DB queries does not depend
+    on the number of requested items.
+    Items not found are requested from external sources concurrently
+    (see :func:`aget_external_items`).
+
+    Responds with newline-delimited JSON, one object per
+    requested item in the same order. Each object contains
+    ``docid``, ``doctype`` and HTTP-like ``status``,
+    and either ``error`` or, on success,
+    ``anchor`` (see ``X-Xml2rfc-Anchor`` in :func:`get_by_docid`)
+    and ``data`` (Relaton structure, if ``relaton`` format is requested)
+    or ``content`` (serialized item otherwise).
+    """
+
+    try:
+        params = json.loads(request.body)
+        items = [
+            (
+                str(item['docid']).strip(),
+                str(item['doctype']).strip()
+                if item.get('doctype', None) else None,
+                item.get('anchor', None),
+            )
+            for item in params['items']
+        ]
+        format = params.get('format', None) or 'relaton'
+        check_external = (
+            params.get('check_external_sources', None) or 'last_resort')
+    except (ValueError, TypeError, KeyError, AttributeError):
+        return JsonResponse({
+            "error":
+                "Expected a JSON object with a list of items, "
+                "each with a docid",
+        }, status=400)
+
+    if format != 'relaton' and format not in serializers.registry:
+        return JsonResponse({
+            "error": "Requested format is not supported",
+        }, status=400)
+
+    if len(items) > API_BATCH_MAX_ITEMS:
+        return JsonResponse({
+            "error":
+                "Too many items requested (maximum is {})".
+                format(API_BATCH_MAX_ITEMS),
+        }, status=400)
+
+    # Empty type matches any document identifier type
+    docids = [
+        DocID(id=docid, type=doctype or '')
+        for docid, doctype, _ in items
+    ]
+    errors: Dict[int, ValidationError] = {}
+    bibitems: List[Optional[BibliographicItem]] = list(
+        await sync_to_async(build_citations_in_batch)(
+            docids,
+            strict=True,
+            errors=errors))
+
+    if check_external == 'last_resort':
+        # External sources can only be tried if doctype is specified
+        missing: Dict[int, Tuple[str, str]] = {
+            idx: (docid, doctype)
+            for idx, ((docid, doctype, _), bibitem)
+            in enumerate(zip(items, bibitems))
+            if bibitem is None and doctype and idx not in errors
+        }
+        external_bibitems = await aget_external_items(
+            list(missing.values()))
+        for idx, external_bibitem in zip(missing.keys(), external_bibitems):
+            if external_bibitem:
+                bibitems[idx] = external_bibitem.bibitem
+
+    def resolve(
+        docid: str,
+        bibitem: Optional[BibliographicItem],
+        error: Optional[ValidationError],
+    ) -> BibliographicItem:
+        if error is not None:
+            raise error
+        if bibitem is None:
+            raise RefNotFoundError(
+                "Not found in indexed or external sources",
+                docid)
+        return bibitem
+
+    def render_line(
+        docid: str,
+        doctype: Optional[str],
+        requested_anchor: Optional[str],
+        bibitem: Optional[BibliographicItem],
+        error: Optional[ValidationError],
+    ) -> Tuple[Dict[str, Any], str]:
+        result: Dict[str, Any] = dict(docid=docid, doctype=doctype)
+
+        try:
+            bibitem = resolve(docid, bibitem, error)
+
+        except (RefNotFoundError, AttributeError, IndexError):
+            return dict(
+                result,
+                status=404,
+                error=(
+                    "Unable to find bibliographic item matching "
+                    "document ID {}{}".
+                    format(docid, f' (type {doctype})' if doctype else '')
+                ),
+            ), 'not_found'
+
+        except ValidationError as err:
+            return dict(
+                result,
+                status=500,
+                error=(
+                    "Source data for item {} ({}) didn’t validate "
+                    "(err: {})".
+                    format(docid, doctype or "unspecified", str(err))
+                ),
+            ), 'validation_error'
+
+        result['anchor'] = requested_anchor or get_suitable_anchor(bibitem)
+
+        if format == 'relaton':
+            result['data'] = unpack_dataclasses(bibitem.dict())
+        else:
+            try:
+                result['content'] = serializers.get(format).serialize(
+                    bibitem,
+                    anchor=requested_anchor,
+                ).decode('utf-8')
+            except ValueError as err:
+                return dict(
+                    result,
+                    status=500,
+                    error=(
+                        "Unable to serialize item {} ({}) "
+                        "into requested format: "
+                        "unsuitable source data (err: {})".
+                        format(docid, doctype or "unspecified", str(err))
+                    ),
+                ), 'serialization_error'
+
+        return dict(result, status=200), 'success'
+
+    def render_lines() -> List[str]:
+        lines: List[str] = []
+        for idx, ((docid, doctype, anchor), bibitem) in enumerate(
+            zip(items, bibitems)
+        ):
+            line, outcome = render_line(
+                docid,
+                doctype,
+                anchor,
+                bibitem,
+                errors.get(idx, None))
+            metrics.api_bibitem_hits.labels(docid, outcome, format).inc()
+            lines.append(json.dumps(line, cls=DjangoJSONEncoder) + '\n')
+        return lines
+
+    return HttpResponse(
+        ''.join(await sync_to_async(render_lines)()),
+        content_type='application/x-ndjson',
+        charset='utf-8')
+
+
 class CitationSearchResultListView(BaseCitationSearchView):
     """Allows to search bibliographic data via API."""
 
@@ -218,11 +515,23 @@ class CitationSearchResultListView(BaseCitationSearchView):
     )
 
     def render_to_response(self, context):
-        result_count = len(self.object_list)
+        if self.use_cursor:
+            result_count = self.total_found or 0
+        else:
+            result_count = len(self.object_list)
         meta: Dict[str, Any] = dict(total_records=result_count)
 
         page_obj = context['page_obj']
-        if page_obj:
+        if self.use_cursor:
+            if self.next_cursor:
+                base_url = self.request.build_absolute_uri(self.request.path)
+                params = self.request.GET.copy()
+                params[self.cursor_param] = self.next_cursor
+                meta['next'] = "{}?{}".format(
+                    base_url,
+                    params.urlencode())
+
+        elif page_obj:
             base_url = self.request.build_absolute_uri(self.request.path)
             params = self.request.GET.copy()
             try:
@@ -266,10 +575,36 @@ def json_schema(request, ref: str):
     return SCHEMA_REFS[ref].schema_json(indent=2)
 
 
+def get_ref_etag(request, dataset_name: str, ref: str) -> Optional[str]:
+    if dataset_name in external_sources.registry:
+        return None
+    digest = (
+        RefData.objects.
+        filter(dataset=dataset_name, ref=ref.strip()).
+        annotate(digest=MD5(Cast('body', TextField()))).
+        values_list('digest', flat=True).
+        first())
+    return make_etag(request, digest or '', source_ids=[dataset_name])
+
+
+def get_ref_last_modified(request, dataset_name: str, ref: str) \
+        -> Optional[datetime]:
+    if dataset_name in external_sources.registry:
+        return None
+    return get_last_modified([dataset_name])
+
+
+@condition(
+    etag_func=get_ref_etag,
+    last_modified_func=get_ref_last_modified)
 def get_ref(request, dataset_name: str, ref: str):
     """Retrieves a reference from dataset by reference.
     Dataset can either be a :attr:`.models.RefData.dataset`
     or an external source ID.
+
+    For indexed datasets, supports conditional requests
+    (see :mod:`main.conditional`), with ETag derived from
+    dataset generation and indexed item data.
     """
 
     format = request.GET.get('format', 'relaton')
@@ -0,0 +1,196 @@
+"""Caching of composite bibliographic items
+built by :func:`main.query.build_citation_for_docid`.
+
+Composed items are stored in Django’s default cache
+(Redis, when configured) as compressed pickles,
+which can be loaded without querying the database
+or running Pydantic validation again.
+
+In front of it, each process keeps a small in-memory LRU cache
+of recently used entries.
+
+Cache keys include generations of all indexable sources
+(see :mod:`sources.generations`), so entries become unreachable
+as soon as any source is reindexed, including entries
+written by requests that read data before indexing finished,
+and entries for items another source has since started
+providing data for.
+"""
+
+import hashlib
+import logging
+import pickle
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, List, Optional, Set, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from bib_models import BibliographicItem
+from sources import indexable
+from sources.generations import get_generation_token
+
+from .types import CompositeSourcedBibliographicItem
+
+
+__all__ = (
+    'get_cache_key',
+    'get_cached_citation',
+    'cache_citation',
+)
+
+
+log = logging.getLogger(__name__)
+
+
+CITATION_CACHE_SECONDS: int = getattr(
+    settings,
+    'CITATION_CACHE_SECONDS',
+    3600)
+
+CITATION_CACHE_LOCAL_SIZE: int = getattr(
+    settings,
+    'CITATION_CACHE_LOCAL_SIZE',
+    256)
+
+CITATION_CACHE_LOCAL_SECONDS: int = getattr(
+    settings,
+    'CITATION_CACHE_LOCAL_SECONDS',
+    30)
+
+
+KEY_PREFIX = 'citation'
+
+
+class LocalLRUCache:
+    """A thread-safe, size-bound in-memory cache
+    with a maximum age for entries."""
+
+    def __init__(self, maxsize: int, max_age: float):
+        self.maxsize = maxsize
+        self.max_age = max_age
+        self._entries: OrderedDict[str, Tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.max_age:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes):
+        if self.maxsize < 1:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+local_cache = LocalLRUCache(
+    CITATION_CACHE_LOCAL_SIZE,
+    CITATION_CACHE_LOCAL_SECONDS)
+
+
+def get_cache_key(
+    id: str,
+    id_type: Optional[str],
+    strict: bool,
+    hydrate_relation_levels: int,
+    generation: Optional[str] = None,
+) -> str:
+    """Returns cache key for an item built
+    with given :func:`main.query.build_citation_for_docid` arguments.
+
+    The key must be obtained before querying data the item is built from.
+
+    :param generation:
+        :func:`sources.generations.get_generation_token()`
+        of all indexable sources, if already known
+        (e.g., when obtaining keys for many items).
+    """
+    if generation is None:
+        generation = get_generation_token(list(indexable.registry.keys()))
+    digest = hashlib.sha1(
+        '\n'.join([id, id_type or '']).encode('utf-8')
+    ).hexdigest()
+    return ':'.join([
+        KEY_PREFIX,
+        generation,
+        str(hydrate_relation_levels),
+        str(int(strict)),
+        digest,
+    ])
+
+
+def get_cached_citation(key: str) \
+        -> Optional[CompositeSourcedBibliographicItem]:
+    """Returns cached item under given key, or None.
+
+    A new instance is returned on each call,
+    so callers are free to alter it."""
+
+    if CITATION_CACHE_SECONDS < 1:
+        return None
+
+    if (serialized := local_cache.get(key)) is None:
+        serialized = cache.get(key, None)
+        if serialized is None:
+            return None
+        local_cache.set(key, serialized)
+
+    try:
+        return pickle.loads(zlib.decompress(serialized))
+    except Exception:
+        log.exception("Failed to load cached item %s", key)
+        return None
+
+
+def cache_citation(key: str, item: CompositeSourcedBibliographicItem):
+    """Stores given item under given key."""
+
+    if CITATION_CACHE_SECONDS < 1:
+        return
+
+    serialized = zlib.compress(
+        pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL))
+
+    cache.set(key, serialized, CITATION_CACHE_SECONDS)
+    local_cache.set(key, serialized)
+
+
+def get_source_ids(item: BibliographicItem) -> Set[str]:
+    """Returns IDs of sources that contributed to given composite item
+    or to any of its hydrated relations."""
+
+    source_ids: Set[str] = set()
+    seen: Set[int] = set()
+    items: List[Any] = [item]
+
+    while items:
+        next_items: List[Any] = []
+        for _item in items:
+            if id(_item) in seen:
+                continue
+            seen.add(id(_item))
+            for sourced_item in getattr(_item, 'sources', {}).values():
+                source_ids.add(sourced_item.source.id)
+            for relation in (getattr(_item, 'relation', None) or []):
+                next_items.append(relation.bibitem)
+        items = next_items
+
+    return source_ids
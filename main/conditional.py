@@ -0,0 +1,65 @@
+"""Validators for conditional requests
+to views that serve data derived from indexable sources.
+
+Intended to be used with Django’s
+``django.views.decorators.http.condition()``,
+which responds with 304 Not Modified (without calling the view)
+if client-provided ``If-None-Match`` or ``If-Modified-Since``
+match computed validators.
+
+ETags are strong and change whenever service version (``SNAPSHOT``),
+generation of any relevant source (see :mod:`sources.generations`),
+requested path and query, or given content digest changes.
+``Last-Modified`` is the latest time any relevant source was indexed.
+"""
+
+import hashlib
+from datetime import datetime
+from typing import Optional, Sequence
+
+from django.conf import settings
+
+from sources import indexable
+from sources.generations import get_generation_token, get_last_changed_at
+
+
+__all__ = (
+    'make_etag',
+    'get_last_modified',
+)
+
+
+def make_etag(
+    request,
+    *parts: str,
+    source_ids: Optional[Sequence[str]] = None,
+) -> str:
+    """Returns a quoted strong ETag for given request.
+
+    :param parts:
+        Additional strings to derive the ETag from,
+        such as a digest of the underlying item’s data.
+    :param source_ids:
+        IDs of sources the response depends on.
+        All registered indexable sources by default.
+    """
+    if source_ids is None:
+        source_ids = list(indexable.registry.keys())
+    digest = hashlib.sha1('\n'.join([
+        settings.SNAPSHOT or '',
+        get_generation_token(source_ids),
+        request.get_full_path(),
+        *parts,
+    ]).encode('utf-8')).hexdigest()
+    return f'"{digest}"'
+
+
+def get_last_modified(
+    source_ids: Optional[Sequence[str]] = None,
+) -> Optional[datetime]:
+    """Returns the latest time any of given sources
+    (by default, any registered indexable source) was indexed,
+    if known."""
+    if source_ids is None:
+        source_ids = list(indexable.registry.keys())
+    return get_last_changed_at(source_ids)
@@ -1,8 +1,9 @@
 """Provides an external source registry."""
 
-from typing import Dict, Callable, Optional, Union
+from typing import Awaitable, Dict, Callable, Optional, Union
 import logging
 
+from asgiref.sync import sync_to_async
 from pydantic.dataclasses import dataclass
 
 from bib_models import DocID
@@ -36,6 +37,15 @@ class ExternalSource:
     Can be used to automatically fetch data from sources.
     """
 
+    aget_item: Optional[
+        Callable[[str, Optional[bool]], Awaitable[ExternalBibliographicItem]]
+    ] = None
+    """Async counterpart of ``get_item``, if registered
+    via :func:`.register_async`.
+
+    .. seealso:: :func:`.aget_item`
+    """
+
 
 def get(id: str) -> ExternalSource:
     """Returns a registered external source by ID."""
@@ -66,5 +76,38 @@ def register_for_types(id: str, doc_types: Dict[str, bool]):
     return register_external_source
 
 
+def register_async(id: str):
+    """
+    Registers an async item getter for previously registered
+    external source with given ID.
+    """
+    def register_async_item_getter(item_getter: Callable[
+        [str, Optional[bool]], Awaitable[ExternalBibliographicItem]
+    ]):
+        registry[id].aget_item = item_getter
+        return item_getter
+
+    return register_async_item_getter
+
+
+async def aget_item(
+    source: ExternalSource,
+    docid: str,
+    strict: Optional[bool] = True,
+) -> ExternalBibliographicItem:
+    """Obtains an item from given external source
+    without blocking the event loop.
+
+    Uses source’s async item getter, if registered,
+    otherwise calls ``get_item`` in a separate thread.
+    """
+    if source.aget_item:
+        return await source.aget_item(docid, strict)
+    return await sync_to_async(
+        source.get_item,
+        thread_sensitive=False,
+    )(docid, strict)
+
+
 registry: Dict[str, ExternalSource] = {}
 """Registry of external sources."""
@@ -0,0 +1,105 @@
+# Generated by Django 4.2.30 on 2026-10-17 04:31
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0008_refdata_latest_date'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RefDataDocID',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('doctype', models.TextField()),
+                ('docid', models.TextField()),
+                ('docid_normalized', models.TextField(db_index=True)),
+                ('primary', models.BooleanField()),
+                ('ref_data', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, related_name='docids', to='main.refdata')),
+            ],
+            options={
+                'db_table': 'api_ref_data_docid',
+            },
+        ),
+        migrations.RunSQL(
+            sql=[
+                # Lists docid objects in given item body,
+                # whether docid is a list or a single object
+                '''
+                CREATE FUNCTION api_ref_data_docid_list(body jsonb)
+                RETURNS SETOF jsonb AS $$
+                    SELECT d FROM jsonb_array_elements(
+                        CASE jsonb_typeof(body->'docid')
+                            WHEN 'array' THEN body->'docid'
+                            WHEN 'object' THEN jsonb_build_array(body->'docid')
+                            ELSE '[]'::jsonb
+                        END
+                    ) AS d
+                    WHERE jsonb_typeof(d) = 'object' AND d->>'id' IS NOT NULL
+                $$ LANGUAGE sql IMMUTABLE;
+                ''',
+                '''
+                CREATE FUNCTION api_ref_data_docid_sync() RETURNS trigger AS $$
+                BEGIN
+                    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                        DELETE FROM api_ref_data_docid
+                        WHERE ref_data_id = OLD.id;
+                    END IF;
+                    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                        INSERT INTO api_ref_data_docid
+                        (ref_data_id, doctype, docid, docid_normalized, "primary")
+                        SELECT
+                            NEW.id,
+                            coalesce(d->>'type', ''),
+                            d->>'id',
+                            lower(d->>'id'),
+                            coalesce(d->'primary' = 'true'::jsonb, false)
+                        FROM api_ref_data_docid_list(NEW.body) AS d;
+                    END IF;
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+                ''',
+                '''
+                CREATE TRIGGER api_ref_data_docid_insert
+                AFTER INSERT ON api_ref_data
+                FOR EACH ROW EXECUTE FUNCTION api_ref_data_docid_sync();
+                ''',
+                '''
+                CREATE TRIGGER api_ref_data_docid_update
+                AFTER UPDATE OF body ON api_ref_data
+                FOR EACH ROW
+                WHEN (OLD.body IS DISTINCT FROM NEW.body)
+                EXECUTE FUNCTION api_ref_data_docid_sync();
+                ''',
+                '''
+                CREATE TRIGGER api_ref_data_docid_delete
+                AFTER DELETE ON api_ref_data
+                FOR EACH ROW EXECUTE FUNCTION api_ref_data_docid_sync();
+                ''',
+                # Fill in identifiers of already indexed items
+                '''
+                INSERT INTO api_ref_data_docid
+                (ref_data_id, doctype, docid, docid_normalized, "primary")
+                SELECT
+                    r.id,
+                    coalesce(d->>'type', ''),
+                    d->>'id',
+                    lower(d->>'id'),
+                    coalesce(d->'primary' = 'true'::jsonb, false)
+                FROM api_ref_data AS r, api_ref_data_docid_list(r.body) AS d;
+                ''',
+            ],
+            reverse_sql=[
+                'DROP TRIGGER api_ref_data_docid_delete ON api_ref_data;',
+                'DROP TRIGGER api_ref_data_docid_update ON api_ref_data;',
+                'DROP TRIGGER api_ref_data_docid_insert ON api_ref_data;',
+                'DROP FUNCTION api_ref_data_docid_sync();',
+                'DROP FUNCTION api_ref_data_docid_list(jsonb);',
+            ],
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 4.2.30 on 2026-10-17 12:10
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0009_refdatadocid'),
+    ]
+
+    operations = [
+        # Superseded by search_vector
+        migrations.RemoveIndex(
+            model_name='refdata',
+            name='body_ts_gin',
+        ),
+        migrations.RunSQL(
+            sql=[
+                # Django before 5.0 can’t declare generated columns,
+                # so this column is not a model field.
+                # Weights: title A, identifiers B, contributor names C,
+                # abstract and anything else D.
+                # Fields weighted above are left out of D,
+                # so that their text is not indexed twice.
+                '''
+                ALTER TABLE api_ref_data
+                ADD COLUMN search_vector tsvector
+                GENERATED ALWAYS AS (
+                    setweight(to_tsvector(
+                        'english',
+                        jsonb_path_query_array(body, '$.title[*].content')
+                    ), 'A')
+                    || setweight(to_tsvector(
+                        'english',
+                        translate(
+                            jsonb_path_query_array(body, '$.docid[*].id')::text,
+                            '/',
+                            ' ')
+                    ), 'B')
+                    || setweight(to_tsvector(
+                        'english',
+                        jsonb_path_query_array(
+                            body,
+                            '$.contributor[*].*.name.**.content')
+                    ), 'C')
+                    || setweight(to_tsvector(
+                        'english',
+                        body - '{title,docid,contributor}'::text[]
+                    ), 'D')
+                ) STORED;
+                ''',
+                '''
+                CREATE INDEX api_ref_data_search_vector_gin
+                ON api_ref_data USING gin (search_vector);
+                ''',
+            ],
+            reverse_sql=[
+                'DROP INDEX api_ref_data_search_vector_gin;',
+                'ALTER TABLE api_ref_data DROP COLUMN search_vector;',
+            ],
+        ),
+    ]
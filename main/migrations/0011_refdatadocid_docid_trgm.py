@@ -0,0 +1,40 @@
+# Generated by Django 4.2.30 on 2026-10-17 13:02
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0010_refdata_search_vector'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            # pg_trgm is loaded by ops/load-postgres-extensions.sh,
+            # but may be unavailable in development or test databases,
+            # in which case docid substring search scans the lookup table
+            sql='''
+            DO $$
+            BEGIN
+                IF EXISTS (
+                    SELECT FROM pg_available_extensions
+                    WHERE name = 'pg_trgm'
+                ) THEN
+                    CREATE EXTENSION IF NOT EXISTS pg_trgm;
+                    CREATE INDEX IF NOT EXISTS
+                        api_ref_data_docid_normalized_trgm
+                    ON api_ref_data_docid
+                    USING gin (docid_normalized gin_trgm_ops);
+                ELSE
+                    RAISE WARNING 'pg_trgm is not available, '
+                        'docid substring search will not be indexed';
+                END IF;
+            END
+            $$;
+            ''',
+            reverse_sql='''
+            DROP INDEX IF EXISTS api_ref_data_docid_normalized_trgm;
+            ''',
+        ),
+    ]
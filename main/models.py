@@ -17,6 +17,12 @@ class RefData(models.Model):
 
     - Explicit table name ``api_ref_data`` is used
     - ``ref`` and ``dataset`` combinations must be unique
+    - The table also has a ``search_vector`` column,
+      which is generated by the database from ``body``
+      (see migration ``0010``) and is not a model field.
+      It’s a tsvector weighted by field
+      (see :data:`main.query.SEARCH_VECTOR_WEIGHTS`),
+      and is used by :func:`main.query.search_refs_relaton_field`.
     """
 
     dataset = models.CharField(
@@ -97,11 +103,48 @@ class RefData(models.Model):
                     config='english'),
                 name='body_docid_gin',
             ),
-            GinIndex(
-                SearchVector(
-                    'body',
-                    config='english'),
-                name='body_ts_gin',
-            ),
             # TODO: Add more specific indexes for RefData.body subfields
         ]
+
+
+class RefDataDocID(models.Model):
+    """Holds one :term:`document identifier`
+    of a :class:`RefData` instance, for fast exact lookups.
+
+    Rows are derived from ``docid`` in :attr:`RefData.body`
+    and maintained by a database trigger on ``api_ref_data``
+    (see migration ``0009``),
+    so they are kept up to date regardless of how ``RefData``
+    rows are written. Do not write to this table directly.
+
+    Model meta notes:
+
+    - Explicit table name ``api_ref_data_docid`` is used
+    """
+
+    ref_data = models.ForeignKey(
+        RefData,
+        on_delete=models.DO_NOTHING,
+        related_name='docids')
+    """Item this identifier belongs to.
+    Rows are deleted by the trigger along with the item."""
+
+    doctype = models.TextField()
+    """:term:`document identifier type`, as is
+    (empty string if not specified)."""
+
+    docid = models.TextField()
+    """:term:`docid.id`, as is."""
+
+    docid_normalized = models.TextField(db_index=True)
+    """:term:`docid.id` normalized for case-insensitive matching
+    (lower-cased).
+
+    Also covered by a trigram index, if ``pg_trgm`` is available
+    (see :func:`main.query.search_refs_docid_substring`)."""
+
+    primary = models.BooleanField()
+    """Whether this is a :term:`primary document identifier`."""
+
+    class Meta:
+        db_table = 'api_ref_data_docid'
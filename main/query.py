@@ -1,33 +1,38 @@
 """Retrieving bibliographic items from indexed Relaton sources."""
 
-import re
 import logging
 import json
+import re
 from typing import cast as typeCast, Optional
-from typing import Dict, List, Union, Tuple, Any
+from typing import Dict, List, Union, Tuple, Any, Sequence, Set
 
 from django.contrib.postgres.search import SearchQuery
 from django.contrib.postgres.search import SearchHeadline
 from django.db.models.functions import Cast
-from django.db.models import TextField
+from django.db.models import TextField, JSONField
 from django.db.models.query import QuerySet, Q
 from django.db.models.expressions import RawSQL
 from django.conf import settings
 
+from pydantic import ValidationError
+
 # from sources import list_internal as list_internal_sources
 # from sources import InternalSource
 
 from common.util import as_list, get_fuzzy_match_regex
 from bib_models import DocID, Relation
+from sources import indexable
+from sources.generations import get_generation_token
 from bib_models.util import construct_bibitem, get_primary_docid
 
 from .exceptions import RefNotFoundError
 from .types import IndexedBibliographicItem
 from .types import CompositeSourcedBibliographicItem, FoundItem
 from .sources import get_source_meta, get_indexed_object_meta
-from .models import RefData
+from .models import RefData, RefDataDocID
 from .query_utils import query_suppressing_user_input_error, compose_bibitem
-from .query_utils import get_docid_struct_for_search
+from .citation_cache import get_cache_key, get_cached_citation
+from .citation_cache import cache_citation
 
 
 __all__ = (
@@ -35,8 +40,13 @@ __all__ = (
     'list_doctypes',
     'build_citation_for_docid',
     'build_search_results',
+    'only_listing_fields',
     'hydrate_relations',
+    'build_citations_for_docids',
+    'build_citations_in_batch',
     'search_refs_docids',
+    'search_refs_docids_per_id',
+    'search_refs_docid_substring',
     'search_refs_relaton_struct',
     'search_refs_relaton_field',
     'search_refs_json_repr_match',
@@ -48,6 +58,44 @@ __all__ = (
 log = logging.getLogger(__name__)
 
 
+SEARCH_VECTOR_WEIGHTS: Dict[str, str] = {
+    'title': 'A',
+    'docid': 'B',
+    'contributor': 'C',
+}
+"""Weights of top-level fields in the generated ``search_vector`` column
+of :class:`~.models.RefData`.
+Abstract and the rest of the item are weighted D.
+
+Only contributor names are weighted C, other contributor data
+(such as roles or affiliations) is not in ``search_vector``."""
+
+WEBSEARCH_NEGATION_REGEX = re.compile(r'(?:^|\s)-\S')
+"""Matches websearch queries that may contain negated terms."""
+
+
+LISTING_BODY_SQL = '''
+    jsonb_strip_nulls(jsonb_build_object(
+        'docid', body->'docid',
+        'title', body->'title',
+        'formattedref', body->'formattedref',
+        'date', body->'date',
+        'relation', CASE
+            WHEN COALESCE(
+                body #>> '{title,0,content}',
+                body #>> '{title,content}',
+                ''
+            ) <> '' THEN NULL
+            ELSE body->'relation'
+        END
+    ))
+'''
+"""Extracts parts of :attr:`~.models.RefData.body`
+shown when listing found items (see :func:`.only_listing_fields`).
+Relations are only used to describe items
+whose first title has no content (see ``relaton/smart_title.html``)."""
+
+
 def list_refs(dataset_id: str) -> QuerySet[RefData]:
     """Returns all indexed refs in a dataset.
 
@@ -197,6 +245,15 @@ def search_refs_relaton_field(
           its corresponding query is converted
           to a fuzzy web search tsquery, and `@@` operator is used.
 
+          Field specs listed in :data:`.SEARCH_VECTOR_WEIGHTS`
+          use the indexed ``search_vector`` column of the respective weight
+          instead of building a tsvector on the fly.
+          Queries with negated terms (like ``foo -bar``)
+          on such fields can’t use the index and scan every row.
+          Results are ordered by relevance (``ts_rank_cd()``,
+          which favours matches in more heavily weighted fields),
+          and then by date.
+
           Wildcards in field path specs are not allowed.
 
           .. important:: Field path specs are not escaped.
@@ -210,7 +267,8 @@ def search_refs_relaton_field(
                   'some.field': 'some +query',
               }
 
-          Empty field spec is treated specially, matching the whole body::
+          Empty field spec is treated specially, matching the whole body
+          using the indexed ``search_vector`` column::
 
               { '': '"websearch string" anywhere in body' }
 
@@ -253,6 +311,7 @@ def search_refs_relaton_field(
     interpolated_params: List[str] = []
 
     annotate_headline: Union[None, str] = None
+    rank_query: Optional[str] = None
 
     for idx, fields in enumerate(field_queries):
         anded_queries = []
@@ -276,13 +335,26 @@ def search_refs_relaton_field(
                 interpolated_params.append(query)
                 if fieldspec == '':
                     annotate_headline = 'body'
-                    tpl = '''
-                        to_tsvector(
-                            'english',
-                            body
-                        ) @@ websearch_to_tsquery('english', %s)
-                    '''
-                    anded_queries.append(tpl)
+                    rank_query = query
+                    anded_queries.append(
+                        "search_vector @@ websearch_to_tsquery('english', %s)",
+                    )
+                elif weight := SEARCH_VECTOR_WEIGHTS.get(fieldspec):
+                    rank_query = query
+                    condition = '''
+                        ts_filter(search_vector, '{{{weight}}}')
+                        @@ websearch_to_tsquery('english', %s)
+                    '''.format(weight=weight.lower())
+                    if not WEBSEARCH_NEGATION_REGEX.search(query):
+                        # Lets the index narrow down rows.
+                        # Can’t be used with negated terms,
+                        # which may occur in other fields.
+                        interpolated_params.append(query)
+                        condition = (
+                            "(search_vector "
+                            "@@ websearch_to_tsquery('english', %s) "
+                            "AND " + condition + ")")
+                    anded_queries.append(condition)
                 else:
                     tpl = '''
                         to_tsvector(
@@ -317,9 +389,15 @@ def search_refs_relaton_field(
     #     annotate_headline or "no annotation",
     #     field_queries)
 
-    qs = (
-        RefData.objects.filter(id__in=final_query).
-        order_by('-latest_date'))
+    qs = RefData.objects.filter(id__in=final_query)
+
+    if rank_query is not None:
+        qs = qs.annotate(rank=RawSQL(
+            "ts_rank_cd(search_vector, websearch_to_tsquery('english', %s))",
+            (rank_query, ),
+        )).order_by('-rank', '-latest_date')
+    else:
+        qs = qs.order_by('-latest_date')
 
     if annotate_headline is not None:
         # This annotation does not seem to cause perceptible impact
@@ -339,71 +417,192 @@ def search_refs_relaton_field(
     return qs.only('ref', 'dataset', 'body')[:limit]
 
 
-def search_refs_docids(*ids: Union[DocID, str]) -> QuerySet[RefData]:
+def search_refs_docids(
+    *ids: Union[DocID, str],
+    case_sensitive: bool = False,
+) -> QuerySet[RefData]:
     """Given a list of document identifiers
     (``DocID`` instances, or just strings
     which would be treated as ``docid.id``),
     queries and retrieves matching :class:`.models.RefData` objects.
 
+    Uses :class:`.models.RefDataDocID` lookup table.
+    Identifier (and type, if given) are matched case-insensitively,
+    but if some items match given identifiers exactly, only those
+    are returned. If ``DocID`` is marked as primary,
+    only primary identifiers are matched.
+
+    :param bool case_sensitive:
+        if True, only exactly matching items are returned.
+
     :rtype: django.db.models.query.QuerySet[RefData]
     """
+    if len(ids) < 1:
+        return RefData.objects.none()
 
-    # Exact & fast
-    struct_queries: List[Any] = [
-        struct
-        for id in ids
-        for struct in (
-            {'docid': [get_docid_struct_for_search(id)]}
-            if isinstance(id, DocID) else {'docid': [{'id': id}]},
-            # Support cases where docid is not a list:
-            {'docid': get_docid_struct_for_search(id)}
-            if isinstance(id, DocID) else {'docid': {'id': id}},
+    query = Q()
+    for id in ids:
+        query |= get_docid_lookup_query(id)
+
+    matches = (
+        RefDataDocID.objects.
+        filter(query).
+        values_list('ref_data_id', 'doctype', 'docid'))
+
+    exact_matches = set(
+        ref_data_id
+        for ref_data_id, doctype, docid in matches
+        if any(
+            docid_matches_exactly(id, doctype, docid)
+            for id in ids
         )
-    ]
-    refs = search_refs_relaton_struct(
-        *struct_queries,
-        limit=15,
     )
 
-    if len(refs) < 1:
-        # Less exact, case-insensitive, slower
-        jsonpath_queries = [
-            {
-                'docid[*]':
-                '@.id like_regex {id}{type_query}{primary_query}'.format(
-                    id=id,
-                    type_query=(
-                        f' && @.type like_regex {id_type}'
-                        if id_type else ''),
-                    primary_query=(
-                        ' && @.primary == true'
-                        if id_primary else ''),
-                ),
-                # To exclude untyped add ' && exists (@.type)'
-            }
-            for (id, id_type, id_primary) in ((
-                '"(?i)^%s$"' % re.escape(
-                    id.id
-                    if isinstance(id, DocID) else id
-                ),
-                '"(?i)^%s$"' % re.escape(typeCast(DocID, id).type)
-                if getattr(id, 'type', None) else None,
-                getattr(id, 'primary', False),
-            ) for id in ids)
+    if exact_matches or case_sensitive:
+        ref_data_ids = exact_matches
+    else:
+        ref_data_ids = set(ref_data_id for ref_data_id, _, _ in matches)
+
+    return (
+        RefData.objects.filter(id__in=ref_data_ids).
+        only('ref', 'dataset', 'body').
+        order_by('-latest_date')[:15])
+
+
+def search_refs_docid_substring(
+    query: str,
+    limit: Optional[int] = None,
+) -> QuerySet[RefData]:
+    """Returns items any identifier of which includes given string,
+    case-insensitively and ignoring exact separators used.
+    For example, ``31.111:Rel-6`` matches ``3GPP TS 31.111:Rel-6/12.0.0``.
+
+    Uses :class:`.models.RefDataDocID` lookup table,
+    where normalized identifiers are covered by a trigram index,
+    so that lookup time does not grow with the number of indexed items.
+
+    .. note:: The trigram index is only created if ``pg_trgm``
+              extension is available (see migration ``0011``).
+              Without it, the lookup table is scanned.
+
+    :param int limit: Converts to SQL ``LIMIT``.
+    :rtype: django.db.models.query.QuerySet[RefData]
+    """
+    limit = limit or getattr(settings, 'DEFAULT_SEARCH_RESULT_LIMIT', 100)
+
+    # Parts only consist of ASCII letters and digits,
+    # so they need no escaping in the regular expression
+    parts = re.split(r'[^a-z0-9]', query.lower())
+    regex = r'[[:digit:]]*[^a-z0-9]'.join(parts)
+
+    return (
+        RefData.objects.
+        filter(id__in=RefDataDocID.objects.
+               filter(docid_normalized__regex=regex).
+               values('ref_data_id')).
+        only('ref', 'dataset', 'body').
+        order_by('-latest_date')[:limit])
+
+
+def search_refs_docids_per_id(
+    ids: Sequence[DocID],
+    limit: int = 15,
+    case_sensitive: bool = False,
+) -> List[List[RefData]]:
+    """Like :func:`~.search_refs_docids`, but matches each of given
+    document identifiers separately, using a fixed number of queries
+    regardless of how many identifiers are given.
+
+    Exact match preference is applied per identifier.
+
+    :param bool case_sensitive:
+        if True, only exactly matching items are returned.
+
+    :returns:
+        a list of the same length as ``ids``, containing for each identifier
+        up to ``limit`` matching :class:`.models.RefData` instances,
+        latest first.
+    """
+    if len(ids) < 1:
+        return []
+
+    query = Q()
+    for id in ids:
+        query |= get_docid_lookup_query(id)
+
+    matches = list(
+        RefDataDocID.objects.
+        filter(query).
+        values_list(
+            'ref_data_id',
+            'doctype',
+            'docid',
+            'docid_normalized',
+            'primary',
+        ))
+
+    ref_data_ids_per_id: List[Set[int]] = []
+    for id in ids:
+        id_matches = [
+            (ref_data_id, doctype, docid)
+            for ref_data_id, doctype, docid, docid_normalized, primary
+            in matches
+            if docid_normalized == id.id.lower()
+            and (not id.type or doctype.lower() == id.type.lower())
+            and (not id.primary or primary)
         ]
-        refs = search_refs_relaton_field(
-            *jsonpath_queries,
-            exact=True,
-            limit=15,
+        exact_matches = set(
+            ref_data_id
+            for ref_data_id, doctype, docid in id_matches
+            if docid_matches_exactly(id, doctype, docid)
         )
-        # try:
-        #     # Force evaluation
-        #     refs[0]
-        # except (IndexError, DataError):
-        #     # No results or malformed JSON path query
-        #     pass
+        ref_data_ids_per_id.append(
+            exact_matches
+            if exact_matches or case_sensitive
+            else set(ref_data_id for ref_data_id, _, _ in id_matches))
 
-    return refs
+    refs = (
+        RefData.objects.
+        filter(id__in=set().union(*ref_data_ids_per_id)).
+        only('ref', 'dataset', 'body', 'latest_date').
+        order_by('-latest_date'))
+
+    refs_per_id: List[List[RefData]] = [[] for _ in ids]
+    for ref in refs:
+        for idx, ref_data_ids in enumerate(ref_data_ids_per_id):
+            if ref.pk in ref_data_ids and len(refs_per_id[idx]) < limit:
+                refs_per_id[idx].append(ref)
+
+    return refs_per_id
+
+
+def get_docid_lookup_query(id: Union[DocID, str]) -> Q:
+    """Returns a query matching :class:`.models.RefDataDocID` rows
+    for given ``DocID`` instance (or ``docid.id`` string),
+    see :func:`~.search_refs_docids` for semantics."""
+    if isinstance(id, DocID):
+        query = Q(docid_normalized=id.id.lower())
+        if id.type:
+            query &= Q(doctype__iexact=id.type)
+        if id.primary:
+            query &= Q(primary=True)
+        return query
+    else:
+        return Q(docid_normalized=id.lower())
+
+
+def docid_matches_exactly(
+    id: Union[DocID, str],
+    doctype: str,
+    docid: str,
+) -> bool:
+    """Returns True if given document identifier type and ID
+    match given ``DocID`` instance (or ``docid.id`` string),
+    case-sensitively."""
+    if isinstance(id, DocID):
+        return docid == id.id and (not id.type or doctype == id.type)
+    else:
+        return docid == id
 
 
 def build_citation_for_docid(
@@ -427,7 +626,8 @@ def build_citation_for_docid(
     This also means that there can be multiple bibliographic items
     matching given document ID among different datasets,
     which is why a composite bibliographic item is returned.
-    This function is also more expensive and incurs multiple DB queries.
+    This function is also more expensive and incurs multiple DB queries,
+    which is why built items are cached (see :mod:`main.citation_cache`).
 
     :param str id: :term:`docid.id`
     :param str id_type: Optional :term:`document identifier type`
@@ -441,6 +641,10 @@ def build_citation_for_docid(
     :raises main.exceptions.RefNotFoundError: if no matching refs were found.
     """
 
+    cache_key = get_cache_key(id, id_type, strict, hydrate_relation_levels)
+    if cached_item := get_cached_citation(cache_key):
+        return cached_item
+
     # Retrieve pre-indexed refs
     refs = query_suppressing_user_input_error(
         lambda: search_refs_docids(
@@ -476,6 +680,8 @@ def build_citation_for_docid(
             resolved_item_cache=resolved_item_cache or {},
         )
 
+    cache_citation(cache_key, composite_item)
+
     return composite_item
 
 
@@ -488,10 +694,15 @@ def hydrate_relations(
 ):
     """
     For every :class:`~relaton.models.bibdata.Relation`
-    of given list of ``relations``, calls :func:`~.build_citation_for_docid()`
-    on related bibliographic item,
+    of given list of ``relations``, builds a composite item
+    for related bibliographic item (like :func:`~.build_citation_for_docid()`)
     and replaces relation’s ``bibitem`` with the result.
 
+    Related items at each level are retrieved together
+    using :func:`~.build_citations_for_docids()`,
+    so the number of DB queries depends on ``depth``
+    rather than on the number of relations.
+
     This lets sources avoid specifying full bibliographic data
     on every relation, reducing duplication.
     If full bibliographic data for related item
@@ -517,14 +728,13 @@ def hydrate_relations(
     :param bool strict: see :ref:`strict-validation`
 
     :param int depth:
-        How many relation levels to recurse
-        (through :func:`~.build_citation_for_docid()`) into.
+        How many relation levels to recurse into.
 
-        If larger than zero, this function calls itself
-        to query available sources for each relation’s bibitem
-        and replaces it with CompositeSourcedBibliographicItem.
+        Relations of this level are always hydrated.
+        If larger than one, this function calls itself
+        on relations of hydrated items.
         This value is decremented on each recursion level.
-        When zero, relations are left alone and recursion stops.
+        When one, relations of hydrated items are left alone.
 
     :param dict resolved_item_cache:
         A cache containing document identifiers mapped to already-resolved
@@ -537,39 +747,58 @@ def hydrate_relations(
            This structure is updated in place during function runtime.
     """
     cache: Dict[str, Optional[CompositeSourcedBibliographicItem]] = \
-        resolved_item_cache or {}
+        resolved_item_cache if resolved_item_cache is not None else {}
 
+    # Primary identifiers of this level’s relations not yet in cache
+    docids: Dict[str, DocID] = {}
     for relation in relations:
         if _docid := get_primary_docid(relation.bibitem.docid):
-            _id = _docid.id
-            _type = _docid.type
-
-            id_key = f'{_type}:{_id}'
-
-            # Fill in cache for this item.
+            id_key = f'{_docid.type}:{_docid.id}'
             if id_key not in cache:
-                try:
-                    cache[id_key] = build_citation_for_docid(
-                        _id,
-                        _type,
-                        strict,
-                        depth - 1,
-                        # ^ it’s important to decrement this,
-                        # or we may recurse infinitely
-                        # since circular relations are very much
-                        # a possibility.
-                        cache,
-                    )
-                except Exception as err:
-                    # XXX: Catch more specific exceptions?
-                    # We have failed to obtain a hydrated item
-                    # for this relation, store None in cache.
-                    log.warn(
-                        "Failed to hydrate related bibitem %s, %s: %s",
-                        _type,
-                        _id,
-                        err)
-                    cache[id_key] = None
+                docids[id_key] = DocID(id=_docid.id, type=_docid.type)
+
+    if docids:
+        # Fill in cache for this level’s items in one go.
+        try:
+            built = build_citations_for_docids(list(docids.values()), strict)
+        except Exception as err:
+            # XXX: Catch more specific exceptions?
+            log.warn(
+                "Failed to hydrate related bibitems %s: %s",
+                ', '.join(docids.keys()),
+                err)
+            built = [None for _ in docids]
+
+        next_level: List[Relation] = []
+        for id_key, result in zip(docids.keys(), built):
+            if result is None:
+                # We have failed to obtain a hydrated item
+                # for this relation, store None in cache.
+                log.warn(
+                    "Failed to hydrate related bibitem %s",
+                    id_key)
+                cache[id_key] = None
+            else:
+                item, valid = result
+                cache[id_key] = item
+                if valid and item.relation:
+                    next_level.extend(item.relation)
+
+        # It’s important to decrement depth,
+        # or we may recurse infinitely
+        # since circular relations are very much
+        # a possibility.
+        if depth - 1 > 0 and next_level:
+            hydrate_relations(
+                next_level,
+                strict=strict,
+                depth=depth - 1,
+                resolved_item_cache=cache,
+            )
+
+    for relation in relations:
+        if _docid := get_primary_docid(relation.bibitem.docid):
+            id_key = f'{_docid.type}:{_docid.id}'
 
             # Switch original bibitem on this relation
             # to hydrated item in cache, if any. Hydrated item,
@@ -588,6 +817,177 @@ def hydrate_relations(
                 )
 
 
+def build_citations_for_docids(
+    docids: Sequence[DocID],
+    strict: bool = True,
+    errors: Optional[Dict[int, ValidationError]] = None,
+) -> List[Optional[Tuple[CompositeSourcedBibliographicItem, bool]]]:
+    """Like :func:`~.build_citation_for_docid`, but for many
+    document identifiers at once and without hydrating relations.
+
+    Refs matching all given identifiers are retrieved together,
+    then refs sharing each item’s primary identifier are retrieved together,
+    and composite items are built in memory.
+    The number of DB queries does not depend on the number of identifiers.
+
+    :param dict errors:
+        If given, items that fail strict validation are None in results,
+        and their validation errors are stored in this dictionary
+        under their index in ``docids``, instead of being raised.
+
+        .. note::
+
+           This structure is updated in place during function runtime.
+
+    :returns:
+        a list of the same length as ``docids``, containing for each
+        identifier either a 2-tuple (composite item, is_valid)
+        as returned by :func:`~.query_utils.compose_bibitem`,
+        or None if no matching refs were found.
+    :raises pydantic.ValidationError:
+        if ``strict`` is set, ``errors`` is not given,
+        and any of the items doesn’t validate.
+    """
+    refs_per_id = search_refs_docids_per_id(docids)
+
+    # Retrieve additional bibliographic items
+    # with the same primary identifier, if one is available.
+    primary_docids: List[Optional[DocID]] = [
+        get_primary_docid([
+            DocID(**id)
+            for ref in refs
+            for id in as_list(ref.body.get('docid', []))
+        ]) if refs else None
+        for refs in refs_per_id
+    ]
+    unique_primary_docids: Dict[Tuple[str, str], DocID] = {
+        (docid.type, docid.id): docid
+        for docid in primary_docids
+        if docid
+    }
+    refs_per_primary_id = dict(zip(
+        unique_primary_docids.keys(),
+        search_refs_docids_per_id(list(unique_primary_docids.values())),
+    ))
+
+    results: List[Optional[Tuple[CompositeSourcedBibliographicItem, bool]]] \
+        = []
+    for idx, (refs, primary_docid) in enumerate(
+        zip(refs_per_id, primary_docids)
+    ):
+        if primary_docid:
+            refs = refs_per_primary_id[(primary_docid.type, primary_docid.id)]
+        if len(refs) < 1:
+            results.append(None)
+            continue
+        try:
+            results.append(compose_bibitem(
+                refs,
+                primary_docid.id if primary_docid else None,
+                strict))
+        except ValidationError as err:
+            if errors is None:
+                raise
+            errors[idx] = err
+            results.append(None)
+
+    return results
+
+
+def build_citations_in_batch(
+    docids: Sequence[DocID],
+    strict: bool = True,
+    hydrate_relation_levels: int = 1,
+    errors: Optional[Dict[int, ValidationError]] = None,
+) -> List[Optional[CompositeSourcedBibliographicItem]]:
+    """Like :func:`~.build_citation_for_docid`, but for many
+    document identifiers at once.
+
+    Items found in citation cache (see :mod:`main.citation_cache`)
+    are returned as is. The rest are built
+    using :func:`~.build_citations_for_docids`,
+    after which relations of all built items are hydrated together
+    using :func:`~.hydrate_relations` with a single shared cache,
+    and results are cached.
+
+    :param docids:
+        Document identifiers to build items for.
+        An identifier with empty ``type`` matches any
+        :term:`document identifier type`.
+    :param dict errors:
+        If given, validation errors are reported per item
+        as in :func:`~.build_citations_for_docids`,
+        so that one invalid item doesn’t fail the whole batch.
+    :returns:
+        a list of the same length as ``docids``, containing for each
+        identifier either a composite item or None if no matching refs
+        were found (or, if ``errors`` is given, if the item didn’t validate).
+    :raises pydantic.ValidationError:
+        if ``strict`` is set, ``errors`` is not given,
+        and any of the items doesn’t validate.
+    """
+    generation = get_generation_token(list(indexable.registry.keys()))
+    cache_keys = [
+        get_cache_key(
+            docid.id,
+            docid.type,
+            strict,
+            hydrate_relation_levels,
+            generation)
+        for docid in docids
+    ]
+    results: List[Optional[CompositeSourcedBibliographicItem]] = [
+        get_cached_citation(cache_key)
+        for cache_key in cache_keys
+    ]
+
+    uncached: Dict[Tuple[Optional[str], str], DocID] = {
+        (docid.type, docid.id): DocID(id=docid.id, type=docid.type)
+        for docid, cached_item in zip(docids, results)
+        if cached_item is None
+    }
+    if not uncached:
+        return results
+
+    built: Dict[Tuple[Optional[str], str], CompositeSourcedBibliographicItem] \
+        = {}
+    relations: List[Relation] = []
+    uncached_errors: Dict[int, ValidationError] = {}
+    failed: Dict[Tuple[Optional[str], str], ValidationError] = {}
+    for idx, (id_key, result) in enumerate(zip(
+        uncached.keys(),
+        build_citations_for_docids(
+            list(uncached.values()),
+            strict,
+            uncached_errors if errors is not None else None),
+    )):
+        if idx in uncached_errors:
+            failed[id_key] = uncached_errors[idx]
+        elif result is not None:
+            item, valid = result
+            built[id_key] = item
+            if valid and item.relation:
+                relations.extend(item.relation)
+
+    if hydrate_relation_levels > 0 and relations:
+        hydrate_relations(
+            relations,
+            strict=strict,
+            depth=hydrate_relation_levels,
+            resolved_item_cache={},
+        )
+
+    for idx, (docid, cache_key) in enumerate(zip(docids, cache_keys)):
+        if results[idx] is None:
+            if errors is not None and (docid.type, docid.id) in failed:
+                errors[idx] = failed[(docid.type, docid.id)]
+            elif built_item := built.get((docid.type, docid.id)):
+                cache_citation(cache_key, built_item)
+                results[idx] = built_item
+
+    return results
+
+
 def refdata_to_bibitem(
     ref_data: Dict[str, Any],
     resolved_items:
@@ -650,6 +1050,26 @@ def refdata_to_bibitem(
 DocIDTuple = Tuple[Tuple[str, str], Tuple[str, str]]
 
 
+def only_listing_fields(refs: QuerySet[RefData]) -> QuerySet[RefData]:
+    """Narrows given queryset of found refs
+    to only retrieve parts of their bodies needed
+    to list them (see :data:`.LISTING_BODY_SQL`),
+    extracted on the database side.
+
+    Full bodies are not retrieved, so the result is only suitable
+    for passing to :func:`.build_search_results`.
+    Items built this way have only listing fields.
+
+    :param django.db.models.query.QuerySet[RefData] refs: found refs
+    :rtype: django.db.models.query.QuerySet[RefData]
+    """
+    return refs.annotate(listing_body=RawSQL(
+        LISTING_BODY_SQL,
+        (),
+        output_field=JSONField(),
+    )).only('ref', 'dataset')
+
+
 def build_search_results(
     refs: QuerySet[RefData],
 ) -> List[FoundItem]:
@@ -661,6 +1081,9 @@ def build_search_results(
 
     Takes care of merging search headline annotations, if any.
 
+    If refs were narrowed with :func:`.only_listing_fields`,
+    uses partial bodies and does not retrieve full ones.
+
     :param django.db.models.query.QuerySet[RefData] refs: found refs
     :rtype: List[FoundItem]
     """
@@ -672,6 +1095,10 @@ def build_search_results(
     results: List[FoundItem] = []
 
     for idx, ref in enumerate(refs):
+        if (listing_body := getattr(ref, 'listing_body', None)) is not None:
+            # Takes place of the deferred field
+            ref.body = listing_body
+
         suitable_ids: List[DocID] = as_list([
             DocID(**id)
             for id in ref.body.get('docid', [])
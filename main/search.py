@@ -1,11 +1,14 @@
 import re
 import json
-from typing import Any, List, Callable, Union, Optional, cast
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Callable, Union, Optional, Tuple, cast
 from urllib.parse import unquote_plus
 
 from django.http import HttpResponseBadRequest, HttpResponseRedirect
 from django.urls import reverse
 from django.views.generic.list import BaseListView
+from django.db import connections
 from django.db.models.query import QuerySet
 from django.conf import settings
 from django.core.cache import cache
@@ -13,13 +16,16 @@ from django.http import Http404
 from django.contrib import messages
 from prometheus_client import Counter
 
-from common.util import get_fuzzy_match_regex
+from sources import indexable
+from sources.generations import get_generation_token
 
 from .types import FoundItem
-from .models import RefData
+from .models import RefData, RefDataDocID
 from .query import build_search_results
+from .query import only_listing_fields
 from .query import search_refs_relaton_struct
 from .query import search_refs_relaton_field
+from .query import search_refs_docid_substring
 from .query import search_refs_json_repr_match
 from .query_utils import query_suppressing_user_input_error
 
@@ -68,12 +74,22 @@ is_websearch: Callable[[str], bool] = (
 """Returns True if given query looks like a web search style query."""
 
 
+ResultKey = Tuple[datetime.date, int, List[int]]
+"""Sort key of a search result (``latest_date`` and ``id``
+of its first :class:`~.models.RefData` row),
+and IDs of all rows merged into the result."""
+
+
 class BaseCitationSearchView(BaseListView):
     """Generic view that handles citation search.
     Intended to be usable as a base for both template-based GUI and API views.
 
     The class is structured in a way that lends itself
     to refactoring by splitting into mixin classes in future.
+
+    If request has :attr:`cursor_param` GET parameter (possibly empty),
+    results are paginated using keyset cursors
+    (see :meth:`get_cursor_page`) instead of page numbers.
     """
 
     # model = RefData
@@ -113,6 +129,12 @@ class BaseCitationSearchView(BaseListView):
     """If True, and given query is unsuccessful, will try the next format.
     Can be overridden with ``allow_format_fallback`` GET parameter."""
 
+    fallback_workers: int = getattr(settings, 'SEARCH_FALLBACK_WORKERS', 1)
+    """How many query formats to try at once
+    if :attr:`query_format_allow_fallback` is ``True``
+    and the requested format found nothing
+    (see :meth:`handle_query_in_subsequent_formats`)."""
+
     query = None
     """Deserialized query, parsed from request."""
 
@@ -121,21 +143,48 @@ class BaseCitationSearchView(BaseListView):
 
     Still subject to ``limit_to``."""
 
+    listing_fields_only = False
+    """Whether found items only need fields shown in search result listings.
+    If True, full item data is not retrieved
+    (see :func:`main.query.only_listing_fields`)."""
+
     base_urlpattern_name: Union[str, None] = None
     """Base URL pattern name for this view."""
 
-    result_cache_seconds = getattr(settings, 'SEARCH_CACHE_SECONDS', 3600)
+    result_cache_seconds = getattr(settings, 'SEARCH_CACHE_SECONDS', 259200)
     """How long to cache search results for. Results are cached as a list
-    is constructed from query and query format. Default is one hour."""
+    is constructed from query and query format. Default is three days."""
 
     metric_counter: Optional[Counter] = None
     """A Prometheus Counter instance accepting two labels,
     ``query_format`` and ``got_results``.
     """
 
+    cursor_param = 'cursor'
+    """GET parameter that enables cursor pagination,
+    and holds the cursor returned with the previous page (if any)."""
+
+    cursor: Optional[Tuple[datetime.date, int]] = None
+    """Parsed cursor, if cursor pagination is used."""
+
+    next_cursor: Optional[str] = None
+    """Cursor for the page after current one, if any.
+    Only set if cursor pagination is used."""
+
+    total_found: Optional[int] = None
+    """Number of results across all pages.
+    Only set if cursor pagination is used."""
+
     def get(self, request, *args, **kwargs):
         self.is_gui = hasattr(self, 'template_name')
 
+        self.use_cursor = self.cursor_param in request.GET
+        if raw_cursor := request.GET.get(self.cursor_param, None):
+            try:
+                self.cursor = parse_cursor(raw_cursor)
+            except ValueError:
+                return HttpResponseBadRequest("Invalid cursor")
+
         if not self.query_in_path:
             self.raw_query = request.GET.get('query', None)
         else:
@@ -203,18 +252,35 @@ class BaseCitationSearchView(BaseListView):
             else:
                 raise
 
+    def get_paginate_by(self, queryset):
+        if self.use_cursor:
+            # Results are already limited to current page
+            return None
+        return super().get_paginate_by(queryset)
+
     def get_queryset(self) -> List[FoundItem]:
         """Returns a list of :class:`~.types.FoundItem` objects.
 
+        With cursor pagination, delegates to :meth:`get_cursor_page`.
+
         The actual query is delegated to :meth:`dispatch_handle_query`,
         unless cached results are present for the exact combination
-        of :attr:`query`, :attr:`query_format`, :attr:`show_all_by_default`
-        and :attr:`limit`.
+        of :attr:`query`, :attr:`query_format`, :attr:`show_all_by_default`,
+        :attr:`listing_fields_only` and :attr:`limit`.
+
+        Cache keys include generations of all indexable sources
+        (see :mod:`sources.generations`), so cached results
+        are not used after any source is reindexed.
         """
 
+        if self.use_cursor:
+            return self.get_cursor_page()
+
         if self.query is not None and self.query_format is not None:
             result_getter = (lambda: build_search_results(
-                self.dispatch_handle_query(self.query)))
+                self.dispatch_handle_query(
+                    self.query,
+                    prepare=self.prepare_found_refs)))
 
             if self.request.GET.get('bypass_cache'):
                 return result_getter()
@@ -225,12 +291,110 @@ class BaseCitationSearchView(BaseListView):
                         'query_format': self.query_format,
                         'limit': self.limit_to,
                         'show_all': self.show_all_by_default,
+                        'listing_fields_only': self.listing_fields_only,
+                        'generation': get_generation_token(
+                            list(indexable.registry.keys())),
                     }),
                     result_getter,
                     self.result_cache_seconds)
         else:
             return []
 
+    def get_cursor_page(self) -> List[FoundItem]:
+        """Returns results on the page after :attr:`cursor`,
+        and sets :attr:`next_cursor` and :attr:`total_found`.
+
+        Unlike :meth:`get_queryset`, which composes all found items
+        (up to :attr:`limit_to`) and lets Django’s paginator slice them,
+        this only retrieves sort keys of found items (which are cached
+        the same way full results are, see :meth:`get_result_keys`)
+        and composes items on current page.
+
+        Results are ordered by date and ID, from latest,
+        regardless of the order query format handler uses.
+        """
+        if self.query is None or self.query_format is None:
+            return []
+
+        if self.request.GET.get('bypass_cache'):
+            keys = self.get_result_keys()
+        else:
+            keys = cache.get_or_set(
+                json.dumps({
+                    'query': self.query,
+                    'query_format': self.query_format,
+                    'limit': self.limit_to,
+                    'show_all': self.show_all_by_default,
+                    'keys_only': True,
+                    'generation': get_generation_token(
+                        list(indexable.registry.keys())),
+                }),
+                self.get_result_keys,
+                self.result_cache_seconds)
+
+        self.total_found = len(keys)
+
+        if self.cursor:
+            keys = [key for key in keys if key[:2] < self.cursor]
+
+        page = keys[:self.paginate_by]
+
+        if len(keys) > len(page):
+            latest_date, ref_id, _ = page[-1]
+            self.next_cursor = format_cursor(latest_date, ref_id)
+
+        ref_ids = [ref_id for _, _, ids in page for ref_id in ids]
+        refs_by_id = self.prepare_found_refs(
+            RefData.objects.only('ref', 'dataset', 'body'),
+        ).in_bulk(ref_ids)
+
+        return build_search_results(cast(QuerySet[RefData], [
+            refs_by_id[ref_id]
+            for ref_id in ref_ids
+            if ref_id in refs_by_id
+        ]))
+
+    def prepare_found_refs(self, refs: QuerySet[RefData]) \
+            -> QuerySet[RefData]:
+        """Narrows found refs
+        according to :attr:`listing_fields_only`."""
+        if self.listing_fields_only:
+            return only_listing_fields(refs)
+        return refs
+
+    def get_result_keys(self) -> List[ResultKey]:
+        """Returns sort keys of all found items
+        (up to :attr:`limit_to`) in descending order,
+        merging rows that share their primary identifier
+        like :func:`~.query.build_search_results` does.
+
+        Does not retrieve item data.
+        """
+        rows: List[Tuple[int, datetime.date]] = sorted(
+            self.dispatch_handle_query(
+                self.query,
+                prepare=lambda qs: qs.values_list('id', 'latest_date'),
+            ),
+            key=lambda row: (row[1], row[0]),
+            reverse=True,
+        )
+
+        primary_docids: Dict[int, str] = dict(
+            RefDataDocID.objects.filter(
+                ref_data_id__in=[ref_id for ref_id, _ in rows],
+                primary=True,
+            ).values_list('ref_data_id', 'docid'))
+
+        keys: Dict[str, ResultKey] = {}
+        for ref_id, latest_date in rows:
+            group = primary_docids.get(ref_id, f'ref:{ref_id}')
+            keys.setdefault(
+                group,
+                (latest_date, ref_id, []),
+            )[2].append(ref_id)
+
+        return list(keys.values())
+
     def get_search_query_context_data(self, **kwargs):
         query_format_label = QUERY_FORMAT_LABELS.get(
             cast(str, self.query_format),
@@ -275,6 +439,71 @@ class BaseCitationSearchView(BaseListView):
 
         return ctx
 
+    def handle_query_in_subsequent_formats(
+        self,
+        prepare: Callable[[QuerySet], QuerySet],
+    ) -> Optional[Tuple[str, Any, Optional[QuerySet[RefData]]]]:
+        """Handles :attr:`raw_query` in every format after current one
+        it can be parsed as, using up to :attr:`fallback_workers`
+        threads at once, each with its own database connection.
+
+        This way, a query that finds nothing in any format
+        takes about as long as the slowest format,
+        rather than all formats combined.
+
+        Results are awaited in order of :attr:`supported_query_formats`,
+        so formats after the first one that found anything
+        are not awaited (and are not started, if still queued).
+
+        :returns: 3-tuple (format, parsed query, evaluated queryset)
+                  of the first format that found anything,
+                  or of the last format if none did,
+                  or ``None`` if no subsequent format could parse the query.
+                  The queryset is ``None`` if the query was invalid
+                  (see :func:`~.query_utils.query_suppressing_user_input_error`)
+        """
+        attempts: List[Tuple[str, Any]] = []
+
+        query_format: Optional[str] = self.query_format
+        while query_format := self.get_next_query_format(query_format):
+            parser = getattr(
+                self,
+                'parse_%s_query' % query_format,
+                self.parse_unsupported_query)
+            try:
+                attempts.append((query_format, parser(self.raw_query)))
+            except (UnsupportedQueryFormat, ValueError):
+                continue
+
+        if not attempts:
+            return None
+
+        def handle(attempt: Tuple[str, Any]) -> Optional[QuerySet[RefData]]:
+            query_format, query = attempt
+            handler = getattr(self, 'handle_%s_query' % query_format)
+            try:
+                return query_suppressing_user_input_error(
+                    lambda: prepare(handler(query)))
+            finally:
+                # Connections are per thread, and these threads are gone
+                # once the search is done
+                connections.close_all()
+
+        executor = ThreadPoolExecutor(
+            min(self.fallback_workers, len(attempts)))
+        try:
+            futures = [
+                executor.submit(handle, attempt)
+                for attempt in attempts
+            ]
+            for (query_format, query), future in zip(attempts, futures):
+                qs = future.result()
+                if qs is not None and len(qs) > 0:
+                    break
+            return query_format, query, qs
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def get_next_query_format(self, query_format) -> Union[str, None]:
         """Given ``query_format``, finds the next supported format in list.
 
@@ -347,12 +576,17 @@ class BaseCitationSearchView(BaseListView):
             self.query = None
             self.query_format = None
 
-    def dispatch_handle_query(self, query) \
-            -> QuerySet[RefData]:
+    def dispatch_handle_query(
+        self,
+        query,
+        prepare: Optional[Callable[[QuerySet], QuerySet]] = None,
+    ) -> QuerySet[RefData]:
         """Handles query by delegating
         to ``handle_{query-format}_query()`` method.
 
-        Forces evaluation of returned queryset of ``RefData`` instances.
+        Forces evaluation of returned queryset of ``RefData`` instances,
+        or of the queryset returned by ``prepare``, if given
+        (e.g., to only retrieve some columns).
 
         Exceptions arising from
 
@@ -360,11 +594,28 @@ class BaseCitationSearchView(BaseListView):
 
         If :attr:`query_format_allow_fallback` is ``True``,
         an error or empty queryset obtained when
+        handling the query in current format leads to trying
+        subsequent formats, concurrently
+        (see :meth:`handle_query_in_subsequent_formats`)
+        unless :attr:`fallback_workers` is 1.
         """
 
         handler = getattr(self, 'handle_%s_query' % self.query_format)
 
-        qs = query_suppressing_user_input_error(lambda: handler(query))
+        if prepare is None:
+            prepare = (lambda qs: qs)
+
+        qs = query_suppressing_user_input_error(
+            lambda: prepare(handler(query)))  # type: ignore[misc]
+
+        tried_all_formats = (
+            self.query_format_allow_fallback
+            and self.fallback_workers > 1
+            and (qs is None or len(qs) < 1))
+
+        if tried_all_formats:
+            if fallback := self.handle_query_in_subsequent_formats(prepare):
+                self.query_format, self.query, qs = fallback
 
         input_error = qs is None
         found_something = qs is not None and len(qs) > 0
@@ -372,19 +623,22 @@ class BaseCitationSearchView(BaseListView):
 
         if input_error:
             if self.show_all_by_default:
-                qs = RefData.objects.all()[:self.limit_to]
+                qs = prepare(RefData.objects.all()[:self.limit_to])
             else:
-                qs = RefData.objects.none()
+                qs = prepare(RefData.objects.none())
 
         if not found_something and self.query_format_allow_fallback:
-            next_format = self.get_next_query_format(self.query_format)
+            next_format = (
+                self.get_next_query_format(self.query_format)
+                if not tried_all_formats
+                else None)
             if next_format:
                 self.dispatch_parse_query(
                     self.request,
                     query=self.raw_query,
                     query_format=next_format,
                     suppress_errors=True)
-                return self.dispatch_handle_query(self.query)
+                return self.dispatch_handle_query(self.query, prepare)
 
         elif not found_something:
             msg = (
@@ -464,15 +718,7 @@ class BaseCitationSearchView(BaseListView):
     # Handlers
 
     def handle_docid_regex_query(self, query: str) -> QuerySet[RefData]:
-        fuzzy_q = r'@.id like_regex "(?i)%s"' % get_fuzzy_match_regex(
-            query,
-            match_sep=r'[[:digit:]]*[^a-zA-Z0-9]',
-        )
-        return search_refs_relaton_field(
-            {'docid[*]': fuzzy_q},
-            limit=self.limit_to,
-            exact=True,
-        )
+        return search_refs_docid_substring(query, limit=self.limit_to)
 
     def handle_json_struct_query(
             self,
@@ -505,3 +751,17 @@ class BaseCitationSearchView(BaseListView):
 class UnsupportedQueryFormat(ValueError):
     """Specified query format is not supported."""
     pass
+
+
+def format_cursor(latest_date: datetime.date, ref_id: int) -> str:
+    """Returns a cursor pointing after given search result sort key."""
+    return f'{latest_date.isoformat()}_{ref_id}'
+
+
+def parse_cursor(cursor: str) -> Tuple[datetime.date, int]:
+    """Parses a cursor returned by :func:`.format_cursor`.
+
+    :raises ValueError: malformed cursor
+    """
+    latest_date, ref_id = cursor.split('_', 1)
+    return datetime.date.fromisoformat(latest_date), int(ref_id)
@@ -12,23 +12,31 @@ under ``/data/`` directory under repository root
 
 .. seealso:: :rfp:req:`3`
 """
-from typing import Tuple, List, Dict, Any, cast
+from typing import Tuple, List, Dict, Any, Optional, Iterator, cast
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+import functools
+import json
 import glob
 from os import path
 import datetime
 
-import yaml
+import billiard
 from celery.utils.log import get_task_logger
 from relaton.models import dates, BibliographicItem
 from pydantic import ValidationError
 from django.core.exceptions import ImproperlyConfigured
 from django.conf import settings
-from django.db import transaction
+from django.db import transaction, connection
 
 from bib_models.util import normalize_relaxed
 from common.util import as_list
+from common.yaml import load_data
 from common.pydantic import ValidationErrorDict, pretty_print_loc
 from sources import indexable
+from sources.manifest import get_file_digest, load_manifest
+from sources.manifest import save_manifest_entries, delete_manifest_entries
+from sources.manifest import reset_manifest
 
 from .types import IndexedSourceMeta, IndexedObject
 from .models import RefData
@@ -63,6 +71,24 @@ DEFAULT_DATASET_REPO_BRANCH = getattr(
     'DEFAULT_DATASET_REPO_BRANCH',
     None)
 
+INDEXING_BATCH_SIZE: int = getattr(
+    settings,
+    'INDEXING_BATCH_SIZE',
+    500)
+
+INDEXING_PARSER_PROCESSES: int = getattr(
+    settings,
+    'INDEXING_PARSER_PROCESSES',
+    1)
+
+INDEXING_USE_STAGING_TABLE: bool = getattr(
+    settings,
+    'INDEXING_USE_STAGING_TABLE',
+    False)
+
+PARSER_CHUNK_SIZE = 50
+"""How many files are sent to a parser process at a time."""
+
 have_explicit_sources_for_all_datasets = all([
     dataset_id in DATASET_SOURCE_OVERRIDES
     for dataset_id in DATASETS
@@ -161,6 +187,9 @@ def register_relaton_source(source_id: str):
             on_progress,
             on_error,
         )),
+        'refs_for_changed_paths': (
+            lambda paths: get_refs_for_changed_paths(paths[0])
+        ),
         'reset_index': (lambda: reset_index_for_dataset(source_id)),
         'count_indexed': (
             lambda: RefData.objects.filter(dataset=source_id).count()
@@ -168,6 +197,16 @@ def register_relaton_source(source_id: str):
     })
 
 
+def get_refs_for_changed_paths(paths: List[str]) -> List[str]:
+    """Given a list of paths relative to Relaton data repository root,
+    returns refs corresponding to Relaton source files among them."""
+    return [
+        get_ref_from_path(fpath)
+        for fpath in paths
+        if path.dirname(fpath) == 'data' and fpath.endswith('.yaml')
+    ]
+
+
 for source_id in settings.RELATON_DATASETS:
     register_relaton_source(source_id)
 
@@ -179,27 +218,40 @@ def index_dataset(ds_id, relaton_path, refs=None,
                   on_progress=None, on_error=None) -> Tuple[int, int]:
     """Indexes Relaton data into :class:`~.models.RefData` instances.
 
+    Files are parsed using :func:`.iter_parsed_relaton_files()`,
+    possibly in parallel, while parsed items are accumulated into batches
+    of :data:`bibxml.settings.INDEXING_BATCH_SIZE`
+    and written using :func:`.upsert_refs()` by the calling process.
+
+    If :data:`bibxml.settings.INDEXING_USE_STAGING_TABLE` is enabled
+    and the entire dataset is being reindexed, items are loaded
+    into a temporary staging table instead (see :func:`.staging_table()`),
+    and merged into indexed data in a short transaction at the end.
+
+    Files whose contents did not change since they were last indexed,
+    according to dataset’s manifest (see :mod:`sources.manifest`),
+    are not parsed and validated again. Use
+    :func:`.reset_index_for_dataset()` to have every file parsed
+    on next run, e.g. if parsing or normalization logic changed.
+
     :param ds_id: dataset ID as a string
     :param relaton_path: path to Relaton source files
 
     :param refs: a list of string refs to index, or nothing to index everything
     :param on_progress: progress report lambda taking two ints (total, indexed)
 
-    :returns: a tuple of two integers (total, indexed)
+    :returns: a tuple of two integers (total, indexed),
+              where unchanged files are not counted as indexed
 
     :raise EnvironmentError: passes through any IOError, FileNotFoundError etc.
     """
-    yaml.SafeLoader.yaml_implicit_resolvers = {
-        k: [r for r in v if r[0] != "tag:yaml.org,2002:timestamp"]
-        for k, v in yaml.SafeLoader.yaml_implicit_resolvers.items()
-    }
-
     report_progress = on_progress or (lambda total, current: print(
         "Indexing {}: {} of {}".format(ds_id, total, current))
     )
 
     requested_refs = set(refs or [])
     indexed_refs = set()
+    unchanged_refs = set()
 
     relaton_source_files = glob.glob("%s/*.yaml" % relaton_path)
 
@@ -210,82 +262,302 @@ def index_dataset(ds_id, relaton_path, refs=None,
 
     report_progress(total, 0)
 
-    with transaction.atomic():
-        for idx, relaton_fpath in enumerate(relaton_source_files):
-            ref = path.splitext(path.basename(relaton_fpath))[0]
-
-            if refs is None or ref in requested_refs:
-                report_progress(total, idx)
-
-                with open(relaton_fpath, 'r', encoding='utf-8') \
-                     as relaton_fhandler:
-                    ref_data = yaml.load(
-                        relaton_fhandler.read(),
-                        Loader=yaml.SafeLoader)
-
-                    latest_date = max(
-                        to_dates(as_list(ref_data.get('date', [])))
-                        or [datetime.datetime.now().date()]
-                    )
-
-                    if on_error:
-                        try:
-                            BibliographicItem(**ref_data)
-                        except ValidationError as validation_error:
-                            err_desc = '\n'.join([
-                                f"{d['type']} at "
-                                f"{pretty_print_loc(d['loc'])}: {d['msg']}"
-                                for d in cast(
-                                    List[ValidationErrorDict],
-                                    validation_error.errors()
-                                )
-                            ])
-                            try:
-                                normalize_relaxed(ref_data)
-                                BibliographicItem(**ref_data)
-                            except Exception:
-                                on_error(
-                                    ref,
-                                    'Errors not resolved:\n%s' % err_desc)
-                            else:
-                                on_error(
-                                    ref,
-                                    'Errors resolved (normalized):\n%s'
-                                    % err_desc)
-
-                    RefData.objects.update_or_create(
-                        ref=ref,
-                        dataset=ds_id,
-                        defaults=dict(
-                            body=ref_data,
-                            latest_date=latest_date,
-                            representations=dict(),
-                        ),
-                    )
-
-                    indexed_refs.add(ref)
-
-        if refs is not None:
-            # If we’re indexing a subset of refs,
-            # and some of those refs were not found in source,
-            # delete those refs from the dataset.
-            missing_refs = requested_refs - indexed_refs
-            (RefData.objects.
-                filter(dataset=ds_id).
-                exclude(ref__in=missing_refs).
-                delete())
-
-        else:
-            # If we’re reindexing the entire dataset,
-            # delete all refs not found in source.
-            (RefData.objects.
-                filter(dataset=ds_id).
-                exclude(ref__in=indexed_refs).
-                delete())
+    manifest = load_manifest(ds_id)
+    current_digests: Dict[str, str] = {}
+    files_to_parse: List[str] = []
+
+    for fpath in relaton_source_files:
+        ref = get_ref_from_path(fpath)
+        if refs is None or ref in requested_refs:
+            fname = path.basename(fpath)
+            current_digests[fname] = get_file_digest(fpath)
+            if manifest.get(fname) == current_digests[fname]:
+                unchanged_refs.add(ref)
+            else:
+                files_to_parse.append(fpath)
+
+    logger.info(
+        "Indexing %s: %s files unchanged, %s files to parse",
+        ds_id,
+        len(unchanged_refs),
+        len(files_to_parse))
+
+    # Staging table is only worth it when reindexing everything
+    use_staging_table = INDEXING_USE_STAGING_TABLE and refs is None
+
+    write_refs = insert_staged_refs if use_staging_table else upsert_refs
+
+    with (staging_table() if use_staging_table else transaction.atomic()):
+        batch: List[RefData] = []
+
+        parsed_items = iter_parsed_relaton_files(
+            files_to_parse,
+            validate=on_error is not None)
+
+        for idx, (ref, ref_data, latest_date, error) in enumerate(
+            parsed_items
+        ):
+            report_progress(total, len(unchanged_refs) + idx)
+
+            if error and on_error:
+                on_error(ref, error)
+
+            batch.append(RefData(
+                ref=ref,
+                dataset=ds_id,
+                body=ref_data,
+                latest_date=latest_date,
+                representations=dict(),
+            ))
+
+            indexed_refs.add(ref)
+
+            if len(batch) >= INDEXING_BATCH_SIZE:
+                write_refs(batch)
+                batch = []
+
+        write_refs(batch)
+
+        with transaction.atomic():
+            if use_staging_table:
+                merge_staged_refs()
+
+            save_manifest_entries(ds_id, {
+                path.basename(fpath): current_digests[path.basename(fpath)]
+                for fpath in files_to_parse
+            })
+
+            present_refs = indexed_refs | unchanged_refs
+
+            if refs is not None:
+                # If we’re indexing a subset of refs,
+                # and some of those refs were not found in source,
+                # delete those refs from the dataset.
+                missing_refs = requested_refs - present_refs
+                (RefData.objects.
+                    filter(dataset=ds_id).
+                    filter(ref__in=missing_refs).
+                    delete())
+                delete_manifest_entries(
+                    ds_id,
+                    [f'{ref}.yaml' for ref in missing_refs])
+
+            else:
+                # If we’re reindexing the entire dataset,
+                # delete all refs not found in source.
+                # Manifest may not cover refs indexed before it existed,
+                # so it is only pruned here rather than relied upon.
+                (RefData.objects.
+                    filter(dataset=ds_id).
+                    exclude(ref__in=present_refs).
+                    delete())
+                delete_manifest_entries(
+                    ds_id,
+                    set(manifest.keys()) - set(current_digests.keys()))
 
     return total, len(indexed_refs)
 
 
+ParsedRelatonFile = Tuple[str, Dict[str, Any], datetime.date, Optional[str]]
+"""Ref, deserialized Relaton data, latest date,
+and validation error description (if any)."""
+
+
+def get_ref_from_path(fpath: str) -> str:
+    """Returns ref for given Relaton source file path
+    (which is the filename without extension)."""
+    return path.splitext(path.basename(fpath))[0]
+
+
+def parse_relaton_file(fpath: str, validate: bool) -> ParsedRelatonFile:
+    """Reads and deserializes a Relaton YAML file.
+
+    If ``validate`` is True, also validates the data,
+    attempting to normalize it in place if it’s invalid,
+    and describes validation errors in the last tuple member.
+
+    Must stay at module level, since it is called
+    in pool worker processes (see :func:`.iter_parsed_relaton_files()`).
+    """
+    ref = get_ref_from_path(fpath)
+    error: Optional[str] = None
+
+    with open(fpath, 'r', encoding='utf-8') as relaton_fhandler:
+        ref_data = load_data(relaton_fhandler.read())
+
+    latest_date = max(
+        to_dates(as_list(ref_data.get('date', [])))
+        or [datetime.datetime.now().date()]
+    )
+
+    if validate:
+        try:
+            BibliographicItem(**ref_data)
+        except ValidationError as validation_error:
+            err_desc = '\n'.join([
+                f"{d['type']} at "
+                f"{pretty_print_loc(d['loc'])}: {d['msg']}"
+                for d in cast(
+                    List[ValidationErrorDict],
+                    validation_error.errors()
+                )
+            ])
+            try:
+                normalize_relaxed(ref_data)
+                BibliographicItem(**ref_data)
+            except Exception:
+                error = 'Errors not resolved:\n%s' % err_desc
+            else:
+                error = 'Errors resolved (normalized):\n%s' % err_desc
+
+    return ref, ref_data, latest_date, error
+
+
+def iter_parsed_relaton_files(
+    fpaths: List[str],
+    validate: bool,
+) -> Iterator[ParsedRelatonFile]:
+    """Parses given Relaton source files with :func:`.parse_relaton_file()`,
+    yielding results in the same order as given paths.
+
+    Uses a pool of :data:`bibxml.settings.INDEXING_PARSER_PROCESSES`
+    worker processes, unless configured to use one process
+    or there are too few files for a pool to be worth starting.
+
+    .. note:: Worker processes are started using ``billiard``
+              (Celery’s fork of ``multiprocessing``), since unlike
+              the standard library it allows daemonic processes
+              (such as Celery prefork pool workers, which run
+              indexing tasks) to have children.
+    """
+    parse = functools.partial(parse_relaton_file, validate=validate)
+
+    processes = min(
+        INDEXING_PARSER_PROCESSES,
+        len(fpaths) // PARSER_CHUNK_SIZE,
+    )
+
+    if processes > 1:
+        with ProcessPoolExecutor(
+            processes,
+            mp_context=billiard.get_context('fork'),
+        ) as executor:
+            yield from executor.map(
+                parse,
+                fpaths,
+                chunksize=PARSER_CHUNK_SIZE)
+    else:
+        yield from map(parse, fpaths)
+
+
+def upsert_refs(items: List[RefData]):
+    """Writes given unsaved :class:`~.models.RefData` instances
+    using a single ``INSERT ... ON CONFLICT (ref, dataset) DO UPDATE``
+    statement, replacing data of any already indexed items.
+
+    Does nothing if ``items`` is empty.
+    """
+    if len(items) < 1:
+        return
+
+    RefData.objects.bulk_create(
+        items,
+        update_conflicts=True,
+        unique_fields=['ref', 'dataset'],
+        update_fields=['body', 'latest_date', 'representations'],
+    )
+
+
+STAGING_TABLE_NAME = 'api_ref_data_staging'
+"""Name of the temporary table used
+when :data:`bibxml.settings.INDEXING_USE_STAGING_TABLE` is enabled."""
+
+
+@contextmanager
+def staging_table():
+    """Context manager that creates an empty temporary staging table
+    for :class:`~.models.RefData` rows,
+    without any indexes or constraints, and drops it on exit.
+
+    The table is only visible to current database connection.
+
+    .. seealso:: :func:`.insert_staged_refs()`, :func:`.merge_staged_refs()`
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(f'''
+            CREATE TEMPORARY TABLE {STAGING_TABLE_NAME} (
+                ref varchar(128) NOT NULL,
+                dataset varchar(24) NOT NULL,
+                body jsonb NOT NULL,
+                latest_date date NOT NULL,
+                representations jsonb NOT NULL
+            )
+        ''')
+    try:
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS {STAGING_TABLE_NAME}')
+
+
+def insert_staged_refs(items: List[RefData]):
+    """Inserts given unsaved :class:`~.models.RefData` instances
+    into the staging table in a single statement.
+
+    Must be called within :func:`.staging_table()` context.
+    Does nothing if ``items`` is empty.
+    """
+    if len(items) < 1:
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'''
+            INSERT INTO {STAGING_TABLE_NAME}
+            (ref, dataset, body, latest_date, representations)
+            VALUES {', '.join(['(%s, %s, %s, %s, %s)'] * len(items))}
+            ''',
+            [
+                param
+                for item in items
+                for param in (
+                    item.ref,
+                    item.dataset,
+                    json.dumps(item.body),
+                    item.latest_date,
+                    json.dumps(item.representations),
+                )
+            ],
+        )
+
+
+def merge_staged_refs():
+    """Copies rows from the staging table into
+    :class:`~.models.RefData` table with a single
+    ``INSERT ... SELECT ... ON CONFLICT DO UPDATE`` statement.
+
+    Rows whose data is identical to already indexed data
+    are left alone.
+    Must be called within :func:`.staging_table()` context.
+    """
+    table = RefData._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(f'''
+            INSERT INTO {table}
+            (ref, dataset, body, latest_date, representations,
+             ref_id, ref_type)
+            SELECT ref, dataset, body, latest_date, representations, '', ''
+            FROM {STAGING_TABLE_NAME}
+            ON CONFLICT (ref, dataset) DO UPDATE SET
+                body = EXCLUDED.body,
+                latest_date = EXCLUDED.latest_date,
+                representations = EXCLUDED.representations
+            WHERE
+                {table}.body IS DISTINCT FROM EXCLUDED.body
+                OR {table}.latest_date IS DISTINCT FROM EXCLUDED.latest_date
+        ''')
+
+
 def to_dates(items: List[Dict[str, Any]]) -> List[datetime.date]:
     """Converts a list of dates in raw deserialized Relaton data
     into a list of ``datetime.date`` objects."""
@@ -305,9 +577,11 @@ def to_dates(items: List[Dict[str, Any]]) -> List[datetime.date]:
 
 
 def reset_index_for_dataset(ds_id):
-    """Deletes all references for given dataset."""
+    """Deletes all references for given dataset,
+    along with dataset’s manifest."""
 
     with transaction.atomic():
         (RefData.objects.
             filter(dataset=ds_id).
             delete())
+        reset_manifest(ds_id)
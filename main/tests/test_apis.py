@@ -1,12 +1,16 @@
+import asyncio
 import datetime
 import json
-from typing import Dict, Any
+from typing import Dict, Any, List
+from unittest import mock
 from urllib.parse import quote_plus
 
 from django.test import TestCase
 from django.urls import reverse
 
+from main import api
 from main.models import RefData
+from sources.generations import bump_generation
 
 
 class RefDataApiTests(TestCase):
@@ -58,12 +62,187 @@ class RefDataApiTests(TestCase):
             json.loads(response.content)["data"]["id"], self.ref_body["id"]
         )
 
+    async def test_get_ref_asynchronously(self):
+        url = f"%s?docid={self.ref_id}" % reverse("api_get_by_docid")
+        response = await self.async_client.get(
+            url,
+            headers={"X-Datatracker-Token": "test"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["data"]["id"], self.ref_body["id"])
+
+        response = await self.async_client.get(
+            url,
+            headers={
+                "X-Datatracker-Token": "test",
+                "If-None-Match": response.headers["ETag"],
+            })
+        self.assertEqual(response.status_code, 304)
+
+    def test_get_ref_conditionally(self):
+        url = f"%s?docid={self.ref_id}" % reverse("api_get_by_docid")
+        response = self.client.get(url, **self.api_headers)
+        etag = response.headers["ETag"]
+
+        response = self.client.get(
+            url,
+            HTTP_IF_NONE_MATCH=etag,
+            **self.api_headers)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+        bump_generation(self.dataset_name)
+        response = self.client.get(
+            url,
+            HTTP_IF_NONE_MATCH=etag,
+            **self.api_headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["ETag"], etag)
+        self.assertIn("Last-Modified", response.headers)
+
+    def test_get_ref_conditionally_after_data_change(self):
+        url = f"%s?docid={self.ref_id}" % reverse("api_get_by_docid")
+        etag = self.client.get(url, **self.api_headers).headers["ETag"]
+
+        self.ref1.body = {**self.ref_body, "language": ["fr"]}
+        self.ref1.save()
+        response = self.client.get(
+            url,
+            HTTP_IF_NONE_MATCH=etag,
+            **self.api_headers)
+        self.assertEqual(response.status_code, 200)
+
+    def test_get_ref_computes_validators_once(self):
+        url = f"%s?docid={self.ref_id}" % reverse("api_get_by_docid")
+        with mock.patch.object(
+            api, '_get_indexed_docid_digest',
+            wraps=api._get_indexed_docid_digest,
+        ) as get_digest:
+            response = self.client.get(url, **self.api_headers)
+        self.assertIn("ETag", response.headers)
+        self.assertEqual(get_digest.call_count, 1)
+
+    def test_get_unindexed_ref_unconditionally(self):
+        url = "%s?docid=NONEXISTENTKEY404" % reverse("api_get_by_docid")
+        response = self.client.get(url, **self.api_headers)
+        self.assertNotIn("ETag", response.headers)
+        self.assertNotIn("Last-Modified", response.headers)
+
+    def test_get_ref_from_dataset_conditionally(self):
+        url = reverse("api_get_ref", args=[self.dataset_name, self.ref_id])
+        etag = self.client.get(url, **self.api_headers).headers["ETag"]
+
+        self.ref1.body = {**self.ref_body, "language": ["fr"]}
+        self.ref1.save()
+        response = self.client.get(
+            url,
+            HTTP_IF_NONE_MATCH=etag,
+            **self.api_headers)
+        self.assertEqual(response.status_code, 200)
+
     def test_not_found_ref(self):
         url = "%s?docid=NONEXISTENTKEY404" % reverse("api_get_by_docid")
         response = self.client.get(url, **self.api_headers)
         self.assertEqual(response.status_code, 404)
         self.assertTrue(len(response.json()["error"]) > 0)
 
+    def _post_batch(self, **params):
+        response = self.client.post(
+            reverse("api_get_by_docids"),
+            json.dumps(params),
+            content_type="application/json",
+            **self.api_headers)
+        return response, [
+            json.loads(line)
+            for line in response.content.splitlines()
+        ] if response.status_code == 200 else []
+
+    def test_get_refs_in_batch(self):
+        response, lines = self._post_batch(
+            items=[
+                {"docid": "NONEXISTENTKEY404", "doctype": "standard"},
+                {"docid": self.ref_id, "anchor": "CUSTOM"},
+            ],
+            check_external_sources="never",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual([line["status"] for line in lines], [404, 200])
+        self.assertEqual(lines[1]["docid"], self.ref_id)
+        self.assertEqual(lines[1]["anchor"], "CUSTOM")
+        self.assertEqual(lines[1]["data"]["id"], self.ref_body["id"])
+
+    def test_get_refs_in_batch_as_bibxml(self):
+        response, lines = self._post_batch(
+            items=[{"docid": self.ref_id, "doctype": "standard"}],
+            format="bibxml",
+        )
+        self.assertEqual(lines[0]["status"], 200)
+        self.assertIn("<reference", lines[0]["content"])
+
+    def test_get_refs_in_batch_with_invalid_item(self):
+        RefData.objects.create(
+            ref="ref_invalid",
+            dataset=self.dataset_name,
+            body={
+                **self.ref_body,
+                "id": "ref_invalid",
+                "docid": [{"id": "ref_invalid", "type": "standard"}],
+                "title": [{"content": {"invalid": True}}],
+            },
+            representations={},
+            latest_date=datetime.datetime.now().date(),
+        )
+        with mock.patch.object(
+            api, 'build_citation_for_docid',
+        ) as build_citation_for_docid:
+            response, lines = self._post_batch(
+                items=[
+                    {"docid": "ref_invalid"},
+                    {"docid": self.ref_id},
+                ],
+                check_external_sources="never",
+            )
+        build_citation_for_docid.assert_not_called()
+        self.assertEqual([line["status"] for line in lines], [500, 200])
+
+    def test_get_refs_in_batch_from_external_sources_concurrently(self):
+        active = 0
+        max_active = 0
+
+        async def aget_external_item(docid, doctype):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(active, max_active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return None
+
+        with mock.patch.object(
+            api, 'aget_external_item',
+            side_effect=aget_external_item,
+        ) as mocked, mock.patch.object(
+            api, 'API_BATCH_EXTERNAL_CONCURRENCY', 2,
+        ):
+            response, lines = self._post_batch(
+                items=[
+                    {"docid": f"NONEXISTENTKEY{num}", "doctype": "standard"}
+                    for num in range(5)
+                ] + [{"docid": "NONEXISTENTKEY5"}],
+            )
+        # Items without doctype are not looked up externally
+        self.assertEqual(mocked.call_count, 5)
+        self.assertEqual(max_active, 2)
+        self.assertEqual([line["status"] for line in lines], [404] * 6)
+
+    def test_get_refs_in_batch_invalid_request(self):
+        response, _ = self._post_batch(docids=[self.ref_id])
+        self.assertEqual(response.status_code, 400)
+
+        response, _ = self._post_batch(
+            items=[{"docid": self.ref_id}],
+            format="nonexistent")
+        self.assertEqual(response.status_code, 400)
+
     def test_success_search_ref(self):
         docid = self.ref_body.get("docid") or [{"id": "ref_01"}]
 
@@ -95,6 +274,47 @@ class RefDataApiTests(TestCase):
         self.assertEqual(found_obj["id"], self.ref_body["id"])
         self.assertEqual(found_obj_doc_id, self.ref_body["docid"])
 
+    def test_search_ref_with_cursor(self):
+        for idx in range(12):
+            RefData.objects.create(
+                ref=f"ref_cursor_{idx}",
+                dataset=self.dataset_name,
+                body={
+                    **self.ref_body,
+                    "id": f"ref_cursor_{idx}",
+                    "docid": [{
+                        "id": f"ref_cursor_{idx}",
+                        "type": "standard",
+                    }],
+                },
+                representations={},
+                latest_date=datetime.date(2000, 1, 1 + idx % 3),
+            )
+
+        url = "%s?query_format=websearch&cursor=" % reverse(
+            "api_search",
+            args=["lorem"],
+        )
+        found_ids: List[str] = []
+        while url:
+            response = self.client.get(url, **self.api_headers)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()["meta"]["total_records"], 13)
+            found_ids.extend(item["id"] for item in response.json()["data"])
+            url = response.json()["meta"].get("next")
+
+        self.assertEqual(len(found_ids), 13)
+        self.assertEqual(len(set(found_ids)), 13)
+        self.assertEqual(found_ids[0], self.ref_id)
+
+    def test_search_ref_with_invalid_cursor(self):
+        url = "%s?query_format=websearch&cursor=foo" % reverse(
+            "api_search",
+            args=["lorem"],
+        )
+        response = self.client.get(url, **self.api_headers)
+        self.assertEqual(response.status_code, 400)
+
     def test_fail_search_ref(self):
         struct_query = json.dumps(
             {
@@ -0,0 +1,97 @@
+import datetime
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from main import citation_cache
+from main.models import RefData
+from main.query import build_citation_for_docid
+from sources import indexable
+from sources.generations import bump_generation
+
+
+class CitationCacheTestCase(TestCase):
+    """
+    Test cases for citation_cache.py
+    """
+
+    dataset_id = 'test-citation-cache'
+
+    def setUp(self):
+        cache.clear()
+        citation_cache.local_cache.clear()
+        self.ref = RefData.objects.create(
+            ref='CACHE1',
+            dataset=self.dataset_id,
+            body={
+                'docid': [{'id': 'CACHE 1', 'type': 'TEST', 'primary': True}],
+                'title': [{'content': 'Cached item', 'type': 'main'}],
+            },
+            representations={},
+            latest_date=datetime.date.today())
+
+    def tearDown(self):
+        cache.clear()
+        citation_cache.local_cache.clear()
+
+    def test_cached_item_is_returned_without_querying(self):
+        item = build_citation_for_docid('CACHE 1', 'TEST', strict=False)
+
+        with self.assertNumQueries(0):
+            cached_item = build_citation_for_docid(
+                'CACHE 1',
+                'TEST',
+                strict=False)
+
+        self.assertEqual(cached_item, item)
+        self.assertIsNot(cached_item, item)
+
+    def test_shared_cache_is_used_without_local_entry(self):
+        item = build_citation_for_docid('CACHE 1', 'TEST', strict=False)
+        citation_cache.local_cache.clear()
+
+        with self.assertNumQueries(0):
+            cached_item = build_citation_for_docid(
+                'CACHE 1',
+                'TEST',
+                strict=False)
+
+        self.assertEqual(cached_item, item)
+
+    def test_reindexing_any_source_invalidates_items(self):
+        build_citation_for_docid('CACHE 1', 'TEST', strict=False)
+        key = citation_cache.get_cache_key('CACHE 1', 'TEST', False, 1)
+        self.assertIsNotNone(citation_cache.get_cached_citation(key))
+
+        bump_generation(list(indexable.registry.keys())[0])
+        self.assertIsNone(citation_cache.get_cached_citation(
+            citation_cache.get_cache_key('CACHE 1', 'TEST', False, 1)))
+
+    def test_item_read_before_reindexing_is_not_served(self):
+        # Key is obtained before data is read...
+        key = citation_cache.get_cache_key('CACHE 1', 'TEST', False, 1)
+        item = build_citation_for_docid('CACHE 1', 'TEST', strict=False)
+
+        # ...and the item is written after reindexing finished
+        bump_generation(list(indexable.registry.keys())[0])
+        citation_cache.cache_citation(key, item)
+
+        self.assertIsNone(citation_cache.get_cached_citation(
+            citation_cache.get_cache_key('CACHE 1', 'TEST', False, 1)))
+
+    def test_caching_can_be_disabled(self):
+        with mock.patch.object(citation_cache, 'CITATION_CACHE_SECONDS', 0):
+            build_citation_for_docid('CACHE 1', 'TEST', strict=False)
+            key = citation_cache.get_cache_key('CACHE 1', 'TEST', False, 1)
+            self.assertIsNone(citation_cache.get_cached_citation(key))
+
+    def test_local_cache_evicts_least_recently_used(self):
+        local_cache = citation_cache.LocalLRUCache(2, 60)
+        local_cache.set('a', b'1')
+        local_cache.set('b', b'2')
+        local_cache.get('a')
+        local_cache.set('c', b'3')
+        self.assertEqual(local_cache.get('a'), b'1')
+        self.assertIsNone(local_cache.get('b'))
+        self.assertEqual(local_cache.get('c'), b'3')
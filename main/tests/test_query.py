@@ -1,11 +1,16 @@
+import datetime
 import json
 import re
 from typing import List, Any
 from unittest import TestCase
 
+from django.core.cache import cache
 from django.core.management import call_command
+from django.db import connection
 from django.db.models import QuerySet, Q
+from django.test.utils import CaptureQueriesContext
 
+from bib_models import DocID
 from main.exceptions import RefNotFoundError
 from main.models import RefData
 from main.query import (
@@ -13,8 +18,12 @@ from main.query import (
     list_refs,
     list_doctypes,
     search_refs_docids,
+    search_refs_docid_substring,
     build_citation_for_docid,
+    build_citations_for_docids,
+    build_citations_in_batch,
     build_search_results,
+    only_listing_fields,
     get_indexed_item,
     get_indexed_ref_by_query,
     search_refs_relaton_struct,
@@ -30,6 +39,7 @@ class QueryTestCase(TestCase):
     def setUp(self) -> None:
         # load fixtures (fixtures file is in a different app, thus it needs to be loaded manually)
         call_command("loaddata", "xml2rfc_compat/fixtures/test_refdata.json")
+        cache.clear()
 
         with open("xml2rfc_compat/fixtures/test_refdata.json", "r") as f:
             self.json_fixtures = json.load(f)
@@ -99,6 +109,65 @@ class QueryTestCase(TestCase):
         self.assertGreater(refs.count(), 0)
         self.assertLessEqual(refs.count(), limit)
 
+    def test_search_refs_relaton_field_websearch_ranks_by_field(self):
+        def create(ref: str, title: str, abstract: str, year: int):
+            item = RefData.objects.create(
+                ref=ref,
+                dataset="misc",
+                body={
+                    "docid": [{"id": ref, "type": "test"}],
+                    "title": [{"content": title}],
+                    "abstract": [{"content": abstract}],
+                },
+                representations={},
+                latest_date=datetime.date(year, 1, 1),
+            )
+            self.addCleanup(item.delete)
+            return item
+
+        in_title = create("RANK-1", "Zebrafish routing", "Unrelated", 2000)
+        in_abstract = create("RANK-2", "Unrelated", "About zebrafish", 2020)
+
+        refs = search_refs_relaton_field({"": "zebrafish"})
+        self.assertEqual(
+            [ref.pk for ref in refs],
+            [in_title.pk, in_abstract.pk])
+
+        refs = search_refs_relaton_field({"title": "zebrafish"})
+        self.assertEqual([ref.pk for ref in refs], [in_title.pk])
+
+        # Negated terms apply to the field only
+        refs = search_refs_relaton_field({"title": "zebrafish -unrelated"})
+        self.assertEqual([ref.pk for ref in refs], [in_title.pk])
+        refs = search_refs_relaton_field({"title": "zebrafish -routing"})
+        self.assertEqual([ref.pk for ref in refs], [])
+
+    def test_search_vector_indexes_weighted_fields_once(self):
+        item = RefData.objects.create(
+            ref="WEIGHT-1",
+            dataset="misc",
+            body={
+                "docid": [{"id": "WEIGHT-1", "type": "test"}],
+                "title": [{"content": "Zebrafish"}],
+                "abstract": [{"content": "Axolotl"}],
+                "publisher": [{"name": "Quokka"}],
+            },
+            representations={},
+            latest_date=datetime.date(2000, 1, 1),
+        )
+        self.addCleanup(item.delete)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT search_vector::text FROM api_ref_data WHERE id = %s",
+                [item.pk])
+            search_vector = cursor.fetchone()[0]
+
+        # Title is only indexed with weight A
+        self.assertRegex(search_vector, r"'zebrafish':\d+A(\s|$)")
+        self.assertIn("'axolotl'", search_vector)
+        self.assertIn("'quokka'", search_vector)
+
     def test_search_refs_relaton_field_without_field_queries(self):
         """
         The function search_refs_relaton_field should return an empty
@@ -115,6 +184,43 @@ class QueryTestCase(TestCase):
         self.assertIsInstance(refs, QuerySet[RefData])
         self.assertGreater(refs.count(), 0)
 
+    def test_search_refs_docid_substring(self):
+        docid = self._get_list_of_docids_for_dataset_from_fixture()[0]["id"]
+        refs = search_refs_docid_substring(re.sub(r"[^a-zA-Z0-9]", "-", docid.lower()))
+        self.assertIn(
+            docid,
+            [d["id"] for ref in refs for d in ref.body["docid"]])
+        self.assertEqual(search_refs_docid_substring("NONEXISTENT-ID").count(), 0)
+
+    def test_search_refs_docids_case_insensitive(self):
+        docids = self._get_list_of_docids_for_dataset_from_fixture()
+        docid = DocID(id=docids[0]["id"].lower(), type=docids[0]["type"])
+        self.assertGreater(search_refs_docids(docid).count(), 0)
+        self.assertEqual(
+            search_refs_docids(docid, case_sensitive=True).count(),
+            0)
+
+    def test_docid_lookup_table_follows_refdata(self):
+        ref = RefData.objects.create(
+            ref="docid_lookup_test",
+            dataset="test_dataset_docid",
+            body={"docid": {"id": "TEST 1", "type": "TEST"}},
+            representations={},
+            latest_date=datetime.date.today())
+        try:
+            self.assertEqual(
+                list(search_refs_docids("test 1").values_list("id", flat=True)),
+                [ref.pk])
+
+            ref.body = {"docid": [{"id": "TEST 2", "type": "TEST"}]}
+            ref.save()
+            self.assertEqual(search_refs_docids("TEST 1").count(), 0)
+            self.assertEqual(search_refs_docids("TEST 2").count(), 1)
+        finally:
+            ref.delete()
+
+        self.assertEqual(search_refs_docids("TEST 2").count(), 0)
+
     def test_build_citation_for_docid(self):
         docids = self._get_list_of_docids_for_dataset_from_fixture()
         for docid in docids:
@@ -122,6 +228,70 @@ class QueryTestCase(TestCase):
             citation = build_citation_for_docid(id, doctype)
             self.assertIsInstance(citation, CompositeSourcedBibliographicItem)
 
+    def test_build_citations_for_docids(self):
+        docids = self._get_list_of_docids_for_dataset_from_fixture()
+        results = build_citations_for_docids([
+            DocID(id=docids[0]["id"], type=docids[0]["type"]),
+            DocID(id="nonexistentid", type="nonexistenttype"),
+        ])
+        self.assertEqual(len(results), 2)
+        self.assertIsNotNone(results[0])
+        self.assertIsInstance(results[0][0], CompositeSourcedBibliographicItem)  # type: ignore[index]
+        self.assertIsNone(results[1])
+
+    def test_build_citations_in_batch(self):
+        docids = self._get_list_of_docids_for_dataset_from_fixture()
+        batch = [
+            DocID(id=docids[0]["id"], type=""),
+            DocID(id="nonexistentid", type="nonexistenttype"),
+        ]
+        results = build_citations_in_batch(batch)
+        self.assertIsInstance(results[0], CompositeSourcedBibliographicItem)
+        self.assertIsNone(results[1])
+
+        with CaptureQueriesContext(connection) as ctx:
+            cached_results = build_citations_in_batch(batch[:1])
+        self.assertEqual(len(ctx.captured_queries), 0)
+        self.assertEqual(cached_results[0], results[0])
+
+    def test_build_citation_hydrates_relations_in_batch(self):
+        def _body(num: int, related: List[int]):
+            return {
+                "docid": [{"id": f"TEST {num}", "type": "TEST", "primary": True}],
+                "relation": [{
+                    "type": "updates",
+                    "bibitem": {"docid": [{
+                        "id": f"TEST {related_num}",
+                        "type": "TEST",
+                        "primary": True,
+                    }]},
+                } for related_num in related],
+            }
+
+        refs = [
+            RefData.objects.create(
+                ref=f"hydration_test_{num}",
+                dataset="test_dataset_hydration",
+                body=_body(num, list(range(1, 11)) if num == 0 else []),
+                representations={},
+                latest_date=datetime.date.today())
+            for num in range(11)
+        ]
+        try:
+            with CaptureQueriesContext(connection) as ctx:
+                citation = build_citation_for_docid("TEST 0", "TEST", strict=False)
+            relations = citation.relation or []
+            self.assertEqual(len(relations), 10)
+            for relation in relations:
+                self.assertIsInstance(
+                    relation.bibitem,
+                    CompositeSourcedBibliographicItem)
+            # Two queries per docid lookup, two lookups per level
+            self.assertLessEqual(len(ctx.captured_queries), 8)
+        finally:
+            for ref in refs:
+                ref.delete()
+
     def test_build_citation_for_nonexistent_docid(self):
         """
         The function build_citation_for_docid should :raise RefNotFoundError:
@@ -159,6 +329,57 @@ class QueryTestCase(TestCase):
         self.assertIsInstance(found_items, list)
         self.assertGreater(len(found_items), 0)
 
+    def test_build_search_results_with_listing_fields_only(self):
+        refs = RefData.objects.filter(dataset="misc").order_by("-latest_date")[:10]
+        full_items = build_search_results(refs)
+
+        with CaptureQueriesContext(connection) as ctx:
+            found_items = build_search_results(only_listing_fields(refs))
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertNotIn('"api_ref_data"."body"', ctx.captured_queries[0]["sql"])
+
+        self.assertEqual(
+            [item.docid for item in found_items],
+            [item.docid for item in full_items])
+        self.assertEqual(
+            [item.title for item in found_items],
+            [item.title for item in full_items])
+        self.assertTrue(all(not item.abstract for item in found_items))
+
+    def test_listing_fields_include_relations_of_untitled_items(self):
+        relation = [{
+            "type": "includes",
+            "bibitem": {"docid": [{"id": "LISTING 0", "type": "TEST"}]},
+        }]
+        titles = {
+            "LISTING 1": [],
+            "LISTING 2": [{"content": "", "type": "main"}],
+            "LISTING 3": [{"content": "Title", "type": "main"}],
+        }
+        refs = [
+            RefData.objects.create(
+                ref=f"listing_test_{idx}",
+                dataset="test_dataset_listing",
+                body={
+                    "docid": [{"id": docid, "type": "TEST"}],
+                    "title": title,
+                    "relation": relation,
+                },
+                representations={},
+                latest_date=datetime.date.today())
+            for idx, (docid, title) in enumerate(titles.items())
+        ]
+        try:
+            found_items = build_search_results(only_listing_fields(
+                RefData.objects.filter(dataset="test_dataset_listing").
+                order_by("ref")))
+            self.assertEqual(
+                [bool(item.relation) for item in found_items],
+                [True, True, False])
+        finally:
+            for ref in refs:
+                ref.delete()
+
     def test_build_search_empty_results(self):
         """
         Test that build_search_results returns an empty list of
@@ -0,0 +1,101 @@
+import threading
+import time
+
+from django.test import SimpleTestCase, RequestFactory
+
+from main.search import BaseCitationSearchView
+
+
+class FallbackSearchView(BaseCitationSearchView):
+    supported_query_formats = (
+        'first',
+        'unparseable',
+        'second',
+        'third',
+        'unsupported',
+    )
+
+    def __init__(self, found, **kwargs):
+        super().__init__(**kwargs)
+        self.found = found
+        self.handled = []
+        self.barrier = threading.Barrier(2, timeout=5)
+        self.released = threading.Event()
+
+    def parse_first_query(self, query):
+        return f'first:{query}'
+
+    def parse_unparseable_query(self, query):
+        raise ValueError()
+
+    def parse_second_query(self, query):
+        return f'second:{query}'
+
+    def parse_third_query(self, query):
+        return f'third:{query}'
+
+    def handle_first_query(self, query):
+        self.handled.append(query)
+        return self.found.get(query, [])
+
+    def handle_second_query(self, query):
+        self.handled.append(query)
+        if not self.found:
+            # Fails unless fallback formats are handled at once
+            self.barrier.wait()
+        return self.found.get(query, [])
+
+    def handle_third_query(self, query):
+        self.handled.append(query)
+        if self.found:
+            self.released.wait(timeout=5)
+        else:
+            self.barrier.wait()
+        return self.found.get(query, [])
+
+
+class FallbackSearchTestCase(SimpleTestCase):
+    """
+    Test cases for trying query formats concurrently.
+    """
+
+    def _search(self, found):
+        view = FallbackSearchView(found)
+        view.setup(RequestFactory().get('/'))
+        view.fallback_workers = 3
+        view.query_format_allow_fallback = True
+        view.raw_query = 'foo'
+        view.dispatch_parse_query(
+            view.request,
+            query=view.raw_query,
+            query_format='first')
+        self.addCleanup(view.released.set)
+        return view, view.dispatch_handle_query(view.query)
+
+    def test_other_formats_are_not_tried_if_first_found_anything(self):
+        view, found = self._search({
+            'first:foo': ['first result'],
+            'second:foo': ['second result'],
+        })
+        self.assertEqual(found, ['first result'])
+        self.assertEqual(view.handled, ['first:foo'])
+
+    def test_first_format_that_found_anything_wins(self):
+        started = time.monotonic()
+        view, found = self._search({
+            'second:foo': ['second result'],
+            'third:foo': ['third result'],
+        })
+        # Lower-priority formats are not awaited
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertEqual(found, ['second result'])
+        self.assertEqual(view.query_format, 'second')
+        self.assertEqual(view.query, 'second:foo')
+
+    def test_last_format_is_kept_if_nothing_found(self):
+        view, found = self._search({})
+        self.assertEqual(len(found), 0)
+        self.assertEqual(view.query_format, 'third')
+        self.assertEqual(
+            sorted(view.handled),
+            ['first:foo', 'second:foo', 'third:foo'])
@@ -0,0 +1,180 @@
+import os
+import tempfile
+from unittest import mock
+
+from django.test import TestCase
+
+from main import sources
+from main.models import RefData
+from sources.manifest import load_manifest, reset_manifest
+
+
+def _relaton_yaml(docid: str, date: str = '2020-01-01') -> str:
+    return (
+        "docid:\n"
+        f"- id: {docid}\n"
+        "  type: IETF\n"
+        "  primary: true\n"
+        "date:\n"
+        "- type: published\n"
+        f"  value: '{date}'\n"
+        "title:\n"
+        "- content: Test item\n"
+        "  type: main\n"
+    )
+
+
+class IndexDatasetTestCase(TestCase):
+    """
+    Test cases for Relaton dataset indexing in sources.py
+    """
+
+    dataset_id = 'test-dataset'
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.data_path = self._tmp.name
+        for num in range(5):
+            self._write(f'RFC{num}', _relaton_yaml(f'RFC {num}'))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _fpath(self, ref: str) -> str:
+        return os.path.join(self.data_path, f'{ref}.yaml')
+
+    def _write(self, ref: str, contents: str):
+        with open(self._fpath(ref), 'w', encoding='utf-8') as f:
+            f.write(contents)
+
+    def _index(self, refs=None):
+        return sources.index_dataset(
+            self.dataset_id,
+            self.data_path,
+            refs,
+            on_progress=lambda total, indexed: None,
+        )
+
+    def _count(self) -> int:
+        return RefData.objects.filter(dataset=self.dataset_id).count()
+
+    def test_index_in_batches(self):
+        with mock.patch.object(sources, 'INDEXING_BATCH_SIZE', 2):
+            total, indexed = self._index()
+        self.assertEqual((total, indexed), (5, 5))
+        self.assertEqual(self._count(), 5)
+
+    def test_index_in_parallel(self):
+        with mock.patch.object(sources, 'INDEXING_PARSER_PROCESSES', 2), \
+             mock.patch.object(sources, 'PARSER_CHUNK_SIZE', 1):
+            total, indexed = self._index()
+        self.assertEqual((total, indexed), (5, 5))
+        self.assertEqual(
+            set(RefData.objects.
+                filter(dataset=self.dataset_id).
+                values_list('ref', flat=True)),
+            {f'RFC{num}' for num in range(5)},
+        )
+
+    def test_index_via_staging_table(self):
+        self._index()
+        self._write('RFC1', _relaton_yaml('RFC 1', '2021-06-01'))
+        os.remove(self._fpath('RFC3'))
+
+        with mock.patch.object(sources, 'INDEXING_USE_STAGING_TABLE', True):
+            total, indexed = self._index()
+
+        self.assertEqual((total, indexed), (4, 1))
+        self.assertEqual(self._count(), 4)
+        item = RefData.objects.get(dataset=self.dataset_id, ref='RFC1')
+        self.assertEqual(item.latest_date.isoformat(), '2021-06-01')
+        self.assertEqual(item.body['date'][0]['value'], '2021-06-01')
+
+    def test_reindex_updates_existing_items(self):
+        self._index()
+        self._write('RFC1', _relaton_yaml('RFC 1', '2021-06-01'))
+        self._index()
+
+        item = RefData.objects.get(dataset=self.dataset_id, ref='RFC1')
+        self.assertEqual(item.latest_date.isoformat(), '2021-06-01')
+        self.assertEqual(self._count(), 5)
+
+    def test_dates_are_kept_as_strings(self):
+        self._index()
+        item = RefData.objects.get(dataset=self.dataset_id, ref='RFC1')
+        self.assertEqual(item.body['date'][0]['value'], '2020-01-01')
+
+    def test_unchanged_files_are_skipped(self):
+        self._index()
+        self._write('RFC1', _relaton_yaml('RFC 1', '2021-06-01'))
+
+        total, indexed = self._index()
+
+        self.assertEqual((total, indexed), (5, 1))
+        self.assertEqual(self._count(), 5)
+
+    def test_deleted_files_are_removed_from_index(self):
+        self._index()
+        os.remove(self._fpath('RFC3'))
+
+        self._index()
+
+        self.assertEqual(self._count(), 4)
+        self.assertFalse(RefData.objects.filter(
+            dataset=self.dataset_id,
+            ref='RFC3',
+        ).exists())
+
+    def test_deleted_files_indexed_before_manifest_are_removed(self):
+        self._index()
+        # Simulate refs indexed before manifest was introduced
+        reset_manifest(self.dataset_id)
+        self._index(refs=['RFC1'])
+        os.remove(self._fpath('RFC3'))
+
+        total, indexed = self._index()
+
+        self.assertEqual((total, indexed), (4, 3))
+        self.assertEqual(self._count(), 4)
+        self.assertFalse(RefData.objects.filter(
+            dataset=self.dataset_id,
+            ref='RFC3',
+        ).exists())
+        self.assertNotIn('RFC3.yaml', load_manifest(self.dataset_id))
+
+    def test_reset_index_clears_manifest(self):
+        self._index()
+        sources.reset_index_for_dataset(self.dataset_id)
+
+        total, indexed = self._index()
+
+        self.assertEqual((total, indexed), (5, 5))
+
+    def test_partial_reindex_deletes_only_missing_refs(self):
+        self._index()
+        os.remove(self._fpath('RFC3'))
+
+        self._write('RFC1', _relaton_yaml('RFC 1', '2021-06-01'))
+
+        total, indexed = self._index(refs=['RFC1', 'RFC3'])
+
+        self.assertEqual(indexed, 1)
+        self.assertEqual(self._count(), 4)
+        self.assertFalse(RefData.objects.filter(
+            dataset=self.dataset_id,
+            ref='RFC3',
+        ).exists())
+
+
+class RefsForChangedPathsTestCase(TestCase):
+    def test_only_data_files_map_to_refs(self):
+        self.assertEqual(
+            sources.get_refs_for_changed_paths([
+                'README.adoc',
+                'data/RFC1.yaml',
+                'data/RFC2.yaml',
+                'data/nested/RFC3.yaml',
+                'index.yaml',
+            ]),
+            ['RFC1', 'RFC2'],
+        )
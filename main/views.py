@@ -155,14 +155,14 @@ def browse_citation_by_docid(request):
         ))
 
 
-def export_citation(request):
+async def export_citation(request):
     """Calls :func:`main.api.get_by_docid`
     (wrapping it in :func:`datatracker.auth.api`),
     providing appropriate Content-Disposition header and handling errors
     (including authentication errors) by queueing an error-level message
     for the user and redirecting to referer.
     """
-    resp = auth.api(get_by_docid)(request)
+    resp = await auth.api(get_by_docid)(request)
 
     if resp.status_code == 200:
         ext = 'xml' if request.GET.get('format') == 'bibxml' else 'json'
@@ -202,6 +202,7 @@ class CitationSearchResultListView(MultipleObjectTemplateResponseMixin,
 
     template_name = 'browse/search_citations.html'
     metric_counter = metrics.gui_search_hits
+    listing_fields_only = True
 
     def get_context_data(self, **kwargs):
         return dict(
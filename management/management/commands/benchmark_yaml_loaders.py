@@ -0,0 +1,99 @@
+"""
+Compares YAML loaders from :mod:`common.yaml`
+on a sample of Relaton source files, e.g.::
+
+    python manage.py benchmark_yaml_loaders /data/datasets/rfcs/data
+"""
+
+import glob
+import random
+import time
+from os import path
+from typing import Any, List, Type
+
+import yaml
+from django.core.management.base import BaseCommand, CommandError
+
+from common.yaml import DataLoader, PurePythonDataLoader
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares libyaml-backed and pure Python YAML loaders "
+        "on a sample of Relaton YAML files in given directory.")
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'data_dir',
+            help="Directory with Relaton YAML files.")
+        parser.add_argument(
+            '--sample-size',
+            type=int,
+            default=500,
+            help="How many randomly chosen files to parse.")
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=3,
+            help="How many times to parse the sample with each loader.")
+
+    def handle(self, *args, **options):
+        fpaths = glob.glob(path.join(options['data_dir'], '*.yaml'))
+        if len(fpaths) < 1:
+            raise CommandError("No YAML files found")
+
+        sample = random.sample(
+            fpaths,
+            min(options['sample_size'], len(fpaths)))
+
+        contents: List[str] = []
+        for fpath in sample:
+            with open(fpath, 'r', encoding='utf-8') as fhandle:
+                contents.append(fhandle.read())
+
+        self.stdout.write(
+            f"Parsing {len(contents)} files "
+            f"{options['repeat']} times with each loader")
+
+        timings = {
+            loader.__name__: self.measure(
+                loader,
+                contents,
+                options['repeat'])
+            for loader in (PurePythonDataLoader, DataLoader)
+        }
+
+        for loader_name, seconds in timings.items():
+            self.stdout.write(
+                f"{loader_name}: {seconds:.3f}s best run, "
+                f"{seconds / len(contents) * 1000:.3f}ms per file")
+
+        if DataLoader is PurePythonDataLoader:
+            self.stdout.write(self.style.WARNING(
+                "PyYAML was built without libyaml, "
+                "both loaders are pure Python"))
+        else:
+            self.check_equal(contents)
+            self.stdout.write(self.style.SUCCESS("Speedup: %.1fx" % (
+                timings[PurePythonDataLoader.__name__]
+                / timings[DataLoader.__name__])))
+
+    def measure(self, loader: Type[Any], contents: List[str], repeat: int) \
+            -> float:
+        """Returns the best of ``repeat`` runs, in seconds."""
+        runs: List[float] = []
+        for _ in range(max(repeat, 1)):
+            start = time.perf_counter()
+            for data in contents:
+                yaml.load(data, Loader=loader)
+            runs.append(time.perf_counter() - start)
+        return min(runs)
+
+    def check_equal(self, contents: List[str]):
+        """Ensures both loaders deserialize given strings identically."""
+        for data in contents:
+            if (yaml.load(data, Loader=DataLoader)
+                    != yaml.load(data, Loader=PurePythonDataLoader)):
+                raise CommandError(
+                    "Loaders produced different data for:\n%s"
+                    % data[:200])
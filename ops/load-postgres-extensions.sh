@@ -3,5 +3,6 @@ set -e
 
 psql -v ON_ERROR_STOP=1 --username "$POSTGRES_USER" --dbname "$POSTGRES_DB" <<-EOSQL
   create extension if not exists "btree_gin";
+  create extension if not exists "pg_trgm";
   select * FROM pg_extension;
 EOSQL
@@ -6,7 +6,7 @@ rather than in corresponding modules.
 # Empty docstrings are workarounds
 # to include these self-explanatory metrics in Sphinx autodoc.
 
-from prometheus_client import Counter
+from prometheus_client import Counter, Histogram
 
 
 _prefix_ = 'bibxml_service_'
@@ -63,3 +63,13 @@ xml2rfc_api_bibitem_hits = Counter(
     # outcome should be either success, fallback or not_found
 )
 """"""
+
+
+datatracker_request_duration = Histogram(
+    f'{_prefix_}datatracker_request_duration_seconds',
+    "Time spent on requests to Datatracker API, including retries",
+    ['endpoint', 'method'],
+    # endpoint should have object IDs replaced,
+    # see datatracker.request.get_endpoint_label()
+)
+""""""
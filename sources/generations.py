@@ -0,0 +1,97 @@
+"""
+Per-source generation counters.
+
+A source’s generation is bumped every time its index changes
+(see :func:`sources.indexable.register_git_source`).
+Caches of data derived from indexed sources fold generations
+into their keys (see :func:`.get_generation_token()`),
+so that entries become unreachable as soon as underlying data changes
+and can be kept for a long time otherwise.
+"""
+
+import hashlib
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional, Sequence
+
+from . import cache
+
+
+__all__ = (
+    'get_generations',
+    'get_generation_token',
+    'get_last_changed_at',
+    'bump_generation',
+)
+
+
+GENERATION_KEY_PREFIX = 'source-generation'
+
+CHANGED_AT_KEY_PREFIX = 'source-changed-at'
+
+
+def get_generation_key(source_id: str) -> str:
+    return f'{GENERATION_KEY_PREFIX}:{source_id}'
+
+
+def get_changed_at_key(source_id: str) -> str:
+    return f'{CHANGED_AT_KEY_PREFIX}:{source_id}'
+
+
+def bump_generation(source_id: str) -> int:
+    """Increments the generation of given source,
+    records current time as the time the source last changed,
+    and returns the new generation."""
+    pipeline = cache.pipeline()
+    pipeline.incr(get_generation_key(source_id))
+    pipeline.set(get_changed_at_key(source_id), time.time())
+    generation, _ = pipeline.execute()
+    return generation
+
+
+def get_last_changed_at(source_ids: Sequence[str]) -> Optional[datetime]:
+    """Returns the latest time any of given sources changed,
+    or None if none of them changed since generations were introduced."""
+    if len(source_ids) < 1:
+        return None
+    timestamps = [
+        float(value)
+        for value in cache.mget([
+            get_changed_at_key(source_id)
+            for source_id in source_ids
+        ])
+        if value
+    ]
+    if timestamps:
+        return datetime.fromtimestamp(max(timestamps), tz=timezone.utc)
+    return None
+
+
+def get_generations(source_ids: Sequence[str]) -> Dict[str, int]:
+    """Returns current generation of each of given sources.
+    Sources that were never indexed are at generation 0."""
+    if len(source_ids) < 1:
+        return {}
+    values = cache.mget([
+        get_generation_key(source_id)
+        for source_id in source_ids
+    ])
+    return {
+        source_id: int(value or 0)
+        for source_id, value in zip(source_ids, values)
+    }
+
+
+def get_generation_token(source_ids: Sequence[str]) -> str:
+    """Returns a short string that changes whenever
+    any of given sources is reindexed.
+
+    :param source_ids:
+        IDs of sources the cached data is derived from,
+        e.g. all keys of :data:`sources.indexable.registry`.
+    """
+    generations = get_generations(sorted(source_ids))
+    return hashlib.sha1(';'.join(
+        f'{source_id}:{generation}'
+        for source_id, generation in generations.items()
+    ).encode('utf-8')).hexdigest()[:16]
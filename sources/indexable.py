@@ -13,10 +13,13 @@ from os import path, makedirs
 
 from celery.utils.log import get_task_logger
 from django.conf import settings
+from git import Repo
 
-from common.git import ensure_latest
+from common.git import ensure_latest, get_changed_paths
 
 from . import cache, celery_app
+from .generations import bump_generation
+from .signals import index_changed
 
 
 __all__ = (
@@ -77,7 +80,9 @@ class IndexableSource:
        (problematic item and error description).
     4) ``force``, a flag that will ensure the indexer runs even
        if cached HEAD commit hash from previous indexation
-       has not changed.
+       has not changed, and that all references are reindexed
+       rather than only those affected by changes
+       (see :attr:`IndexableSourceToRegister.refs_for_changed_paths`).
 
     Returns 2-tuple of integers
     (number of found items, number of indexed items).
@@ -106,7 +111,28 @@ that handles data retrieval and indexing.
 """
 
 
-class IndexableSourceToRegister(TypedDict, total=True):
+class _IndexableSourceToRegisterOptional(TypedDict, total=False):
+    refs_for_changed_paths: Callable[[List[List[str]]], List[str]]
+    """
+    A function that receives a list of lists of paths
+    (one list for each of repository sources specified during registration,
+    each path relative to repository root) that were added, changed
+    or deleted since last successful indexation, and returns
+    a list of references that should be reindexed as a result.
+
+    If provided, indexing that is not forced and not limited
+    to specific references only reindexes returned references
+    (which means the indexer must support partial reindexing,
+    including deleting items for references
+    that no longer exist in source data).
+    If not provided, any change causes full reindex.
+    """
+
+
+class IndexableSourceToRegister(
+    _IndexableSourceToRegisterOptional,
+    total=True,
+):
     """A dictionary expected by indexable source registration.
 
     When you *register* a pluggable indexable source, this is the spec.
@@ -160,6 +186,11 @@ def register_git_source(source_id: str, repos: List[Tuple[str, str]]):
     Returned wrapper will handle things like fetching Git repositories
     and checking that head commits changed before calling registered
     indexer implementation.
+
+    If the source provides ``refs_for_changed_paths``,
+    the wrapper also determines which paths changed
+    since previously indexed head commits,
+    and calls the indexer only with affected references.
     """
 
     latest_indexed_heads_key = f'{source_id}_latest_indexed_heads'
@@ -196,6 +227,7 @@ def register_git_source(source_id: str, repos: List[Tuple[str, str]]):
             force=False,
         ) -> Tuple[int, int]:
             work_dir_paths: List[str] = []
+            git_repos: List[Repo] = []
             repo_heads: List[str] = []
 
             on_progress = on_progress or default_on_progress
@@ -224,14 +256,33 @@ def register_git_source(source_id: str, repos: List[Tuple[str, str]]):
                     repo_branch,
                     work_dir_path)
 
+                git_repos.append(repo)
                 repo_heads.append(repo.head.commit.hexsha)
 
             heads_serialized = ', '.join(repo_heads)
+            previous_heads_serialized = cache.get(latest_indexed_heads_key)
+
+            if force or previous_heads_serialized != heads_serialized:
+                if (not force
+                        and refs is None
+                        and previous_heads_serialized
+                        and 'refs_for_changed_paths' in index_info):
+                    refs = get_refs_to_reindex(
+                        git_repos,
+                        previous_heads_serialized.split(', '),
+                    )
+                    if refs is not None and len(refs) < 1:
+                        log.info(
+                            "No relevant paths changed for %s, "
+                            "skipping indexing",
+                            source_id)
+                        cache.set(latest_indexed_heads_key, heads_serialized)
+                        return 0, 0
 
-            if force or cache.get(latest_indexed_heads_key) != heads_serialized:
                 log.info(
-                    "Repositories changed for %s, starting index",
-                    source_id)
+                    "Repositories changed for %s, starting index (%s)",
+                    source_id,
+                    f'{len(refs)} refs' if refs is not None else 'all refs')
                 on_index_progress = (lambda total, indexed: on_progress(
                     'indexing using data in {}'
                     .format(', '.join(repo[0] for repo in repos)),
@@ -249,6 +300,10 @@ def register_git_source(source_id: str, repos: List[Tuple[str, str]]):
                 # Only set this key after index run completed without errors.
                 cache.set(latest_indexed_heads_key, heads_serialized)
 
+                # Invalidate caches derived from indexed data.
+                bump_generation(source_id)
+                send_index_changed(refs)
+
                 return found, indexed
 
             else:
@@ -257,10 +312,44 @@ def register_git_source(source_id: str, repos: List[Tuple[str, str]]):
                     source_id)
                 return 0, 0
 
+        def get_refs_to_reindex(
+            git_repos: List[Repo],
+            previous_heads: List[str],
+        ) -> Optional[List[str]]:
+            """Returns refs affected by changes since previous heads,
+            or None if changes could not be determined
+            and everything should be reindexed."""
+            if len(previous_heads) != len(git_repos):
+                return None
+
+            changed_paths: List[List[str]] = []
+            for repo, previous_head in zip(git_repos, previous_heads):
+                paths = get_changed_paths(repo, previous_head)
+                if paths is None:
+                    return None
+                changed_paths.append(paths)
+
+            return index_info['refs_for_changed_paths'](changed_paths)
+
+        def handle_reset_index():
+            index_info['reset_index']()
+            bump_generation(source_id)
+            send_index_changed(None)
+
+        def send_index_changed(refs: Optional[List[str]]):
+            responses = index_changed.send_robust(source_id, refs=refs)
+            for receiver, response in responses:
+                if isinstance(response, Exception):
+                    log.error(
+                        "Index change handler %s failed for %s: %s",
+                        receiver,
+                        source_id,
+                        response)
+
         indexable_source = IndexableSource(
             id=source_id,
             index=handle_index,
-            reset_index=index_info['reset_index'],
+            reset_index=handle_reset_index,
             count_indexed=index_info['count_indexed'],
             list_repository_urls=lambda: [r[0] for r in repos],
         )
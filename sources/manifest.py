@@ -0,0 +1,80 @@
+"""
+Helpers for maintaining :term:`indexable source` manifests,
+which map source file paths to digests of their contents
+as of latest indexation (see :class:`~.models.SourceFileDigest`).
+
+An indexer can compare current file digests to the manifest
+to skip files that have not changed since they were last indexed,
+and compare manifest paths to current paths to find deleted files.
+Manifest should be updated within the same transaction
+as indexed data.
+"""
+
+from typing import Dict, Iterable
+import hashlib
+
+from .models import SourceFileDigest
+
+
+__all__ = (
+    'get_file_digest',
+    'load_manifest',
+    'save_manifest_entries',
+    'delete_manifest_entries',
+    'reset_manifest',
+)
+
+
+def get_file_digest(*fpaths: str) -> str:
+    """Returns hex SHA-256 digest of contents of given files.
+
+    If more than one path is given, returns a combined digest
+    that changes if any file changes, is added or removed.
+    """
+    digest = hashlib.sha256()
+    for fpath in fpaths:
+        try:
+            with open(fpath, 'rb') as fhandle:
+                digest.update(hashlib.sha256(fhandle.read()).digest())
+        except FileNotFoundError:
+            digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+def load_manifest(source_id: str) -> Dict[str, str]:
+    """Returns a dictionary mapping paths to digests
+    for given indexable source."""
+    return dict(
+        SourceFileDigest.objects.
+        filter(source_id=source_id).
+        values_list('path', 'digest'))
+
+
+def save_manifest_entries(source_id: str, digests: Dict[str, str]):
+    """Creates or updates manifest entries for given paths."""
+    if len(digests) < 1:
+        return
+
+    SourceFileDigest.objects.bulk_create(
+        [
+            SourceFileDigest(source_id=source_id, path=fpath, digest=digest)
+            for fpath, digest in digests.items()
+        ],
+        update_conflicts=True,
+        unique_fields=['source_id', 'path'],
+        update_fields=['digest'],
+        batch_size=1000,
+    )
+
+
+def delete_manifest_entries(source_id: str, paths: Iterable[str]):
+    """Deletes manifest entries for given paths."""
+    (SourceFileDigest.objects.
+        filter(source_id=source_id, path__in=list(paths)).
+        delete())
+
+
+def reset_manifest(source_id: str):
+    """Deletes the entire manifest for given indexable source,
+    so that next indexation processes every file."""
+    SourceFileDigest.objects.filter(source_id=source_id).delete()
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-17 04:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sources', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SourceFileDigest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source_id', models.CharField(max_length=250)),
+                ('path', models.CharField(max_length=1024)),
+                ('digest', models.CharField(max_length=64)),
+            ],
+            options={
+                'unique_together': {('source_id', 'path')},
+            },
+        ),
+    ]
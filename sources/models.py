@@ -20,3 +20,27 @@ class SourceIndexationOutcome(models.Model):
 
     notes = models.TextField(default='')
     """Any notes, e.g. warnings or stats."""
+
+
+class SourceFileDigest(models.Model):
+    """
+    Content digest of a source file as of its latest indexation.
+
+    Entries for an :term:`indexable source` make up its manifest,
+    which indexers use to skip files that have not changed
+    and to find deleted files without scanning indexed data.
+
+    .. seealso:: :mod:`sources.manifest`
+    """
+
+    source_id = models.CharField(max_length=250)
+    """Identifier of the :term:`indexable source`."""
+
+    path = models.CharField(max_length=1024)
+    """Source-specific file path, usually relative to data directory."""
+
+    digest = models.CharField(max_length=64)
+    """Hex digest of file contents."""
+
+    class Meta:
+        unique_together = [['source_id', 'path']]
@@ -1,13 +1,42 @@
-from datetime import datetime, timedelta
+"""Signals sent by indexable sources, and receivers of model signals."""
+
+import logging
+from datetime import timedelta
 
 from django.db.models.signals import post_save
-from django.dispatch import receiver
+from django.dispatch import Signal, receiver
+from django.utils import timezone
+
+
+__all__ = (
+    'index_changed',
+)
+
+
+log = logging.getLogger(__name__)
+
+
+index_changed = Signal()
+"""Sent after an :term:`indexable source` was successfully indexed
+or its index was reset.
+
+Sender is the source ID. Receivers get keyword argument ``refs``:
+a list of refs that were reindexed, or None if the source
+was indexed (or reset) in full.
 
-from sources.models import SourceIndexationOutcome
+Receivers are called with ``send_robust()``,
+their failures are logged and don’t affect indexing outcome.
+"""
 
 
-@receiver(post_save, sender=SourceIndexationOutcome)
+# Sender is given as a string, since this module is imported
+# by :mod:`sources.indexable` possibly before models are loaded
+@receiver(post_save, sender='sources.SourceIndexationOutcome')
 def delete_old_source_indexation_outcome_entries(sender, **kwargs):
     days = 9
-    print(f"Deleting SourceIndexationOutcome entries older than {days} days.")
-    SourceIndexationOutcome.objects.filter(timestamp__lte=datetime.now()-timedelta(days=days)).delete()
+    log.debug(
+        "Deleting SourceIndexationOutcome entries older than %s days.",
+        days)
+    sender.objects.filter(
+        timestamp__lte=timezone.now() - timedelta(days=days),
+    ).delete()
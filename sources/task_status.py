@@ -1,17 +1,29 @@
 """Primitives for working with indexing task status."""
 
-from typing import List, Optional, TypedDict, Union, cast
+from typing import Callable, List, Optional, Tuple, TypedDict, Union, cast
 import time
 import datetime
 import traceback
 
 from celery.result import AsyncResult
+from django.conf import settings
 
 from .celery import app
 from .models import SourceIndexationOutcome
 from . import cache
 
 
+PROGRESS_REPORT_INTERVAL: float = getattr(
+    settings,
+    'INDEXING_PROGRESS_REPORT_INTERVAL',
+    2)
+
+PROGRESS_REPORT_ITEMS: int = getattr(
+    settings,
+    'INDEXING_PROGRESS_REPORT_ITEMS',
+    1000)
+
+
 TaskError = TypedDict(
     'TaskError',
     {'type': str, 'message': str})
@@ -238,3 +250,52 @@ def describe_indexing_task(tid: str) -> IndexingTaskDescription:
                     task['progress'] = progress
 
     return task
+
+
+class ThrottledProgressHandler:
+    """
+    Wraps an indexing progress handler (taking action string,
+    total and indexed counts) and coalesces updates,
+    so that calls that follow too soon after the previous
+    passed-through call are not passed through.
+
+    An update is passed through if it is the first one,
+    if action changed, or if at least ``interval`` seconds passed
+    or at least ``items`` items were indexed since the last update
+    that was passed through.
+
+    Call :meth:`flush()` when done to pass through the latest update,
+    if it was held back.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[str, int, int], None],
+        interval: float = PROGRESS_REPORT_INTERVAL,
+        items: int = PROGRESS_REPORT_ITEMS,
+    ):
+        self.handler = handler
+        self.interval = interval
+        self.items = items
+        self._last_reported: Optional[Tuple[str, int, int]] = None
+        self._last_reported_at: float = 0
+        self._pending: Optional[Tuple[str, int, int]] = None
+
+    def __call__(self, action: str, total: int, indexed: int):
+        self._pending = (action, total, indexed)
+
+        last = self._last_reported
+        if (last is None
+                or last[0] != action
+                or indexed - last[2] >= self.items
+                or time.monotonic() - self._last_reported_at
+                >= self.interval):
+            self.flush()
+
+    def flush(self):
+        """Passes through the latest update, unless it was already."""
+        if self._pending is not None:
+            self.handler(*self._pending)
+            self._last_reported = self._pending
+            self._last_reported_at = time.monotonic()
+            self._pending = None
@@ -10,6 +10,7 @@ from .celery import app
 
 from .indexable import registry
 from .task_status import IndexingTaskCeleryMeta, push_task
+from .task_status import ThrottledProgressHandler
 from .models import SourceIndexationOutcome
 
 
@@ -53,17 +54,18 @@ def fetch_and_index_task(
         meta=task_desc,
     )
 
-    update_status = (lambda action, total, indexed: task.update_state(
-        state='PROGRESS',
-        meta={
-            **task_desc,
-            'action': action,
-            'progress': {
-                'total': total,
-                'current': indexed,
+    update_status = ThrottledProgressHandler(
+        lambda action, total, indexed: task.update_state(
+            state='PROGRESS',
+            meta={
+                **task_desc,
+                'action': action,
+                'progress': {
+                    'total': total,
+                    'current': indexed,
+                },
             },
-        },
-    ))
+        ))
 
     item_errors: List[Tuple[str, str]] = []
 
@@ -112,6 +114,8 @@ def fetch_and_index_task(
         raise
 
     else:
+        update_status.flush()
+
         outcome.successful = True
         outcome.notes += (
             f"Total: {found}\n"
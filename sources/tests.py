@@ -0,0 +1,68 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from . import cache
+from .generations import bump_generation, get_generation_key
+from .generations import get_generation_token, get_generations
+from .task_status import ThrottledProgressHandler
+
+
+class ThrottledProgressHandlerTestCase(SimpleTestCase):
+    def test_updates_are_coalesced_and_flushed(self):
+        handler = mock.Mock()
+        throttled = ThrottledProgressHandler(handler, interval=60, items=10)
+
+        for idx in range(25):
+            throttled('indexing', 25, idx)
+        throttled.flush()
+
+        self.assertEqual(
+            [c.args for c in handler.call_args_list],
+            [
+                ('indexing', 25, 0),
+                ('indexing', 25, 10),
+                ('indexing', 25, 20),
+                ('indexing', 25, 24),
+            ],
+        )
+
+    def test_action_change_is_passed_through(self):
+        handler = mock.Mock()
+        throttled = ThrottledProgressHandler(handler, interval=60, items=10)
+
+        throttled('pulling', 1, 1)
+        throttled('indexing', 25, 0)
+
+        self.assertEqual(handler.call_count, 2)
+
+    def test_flush_does_not_repeat_updates(self):
+        handler = mock.Mock()
+        throttled = ThrottledProgressHandler(handler, interval=60, items=10)
+
+        throttled('indexing', 25, 0)
+        throttled.flush()
+
+        self.assertEqual(handler.call_count, 1)
+
+
+class GenerationsTestCase(SimpleTestCase):
+    source_id = 'test-generations'
+
+    def tearDown(self):
+        cache.delete(get_generation_key(self.source_id))
+
+    def test_token_changes_when_generation_is_bumped(self):
+        token = get_generation_token([self.source_id, 'other'])
+        self.assertEqual(
+            get_generation_token(['other', self.source_id]),
+            token)
+
+        bump_generation(self.source_id)
+
+        self.assertNotEqual(
+            get_generation_token([self.source_id, 'other']),
+            token)
+        self.assertEqual(
+            get_generations([self.source_id])[self.source_id],
+            1)
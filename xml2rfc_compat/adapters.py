@@ -11,15 +11,16 @@ import re
 from django.urls import reverse, NoReverseMatch
 from django.conf import settings
 
-from relaton.models.bibdata import BibliographicItem, DocID
+from relaton.models.bibdata import BibliographicItem, DocID, Relation
 
 from bib_models.util import get_primary_docid
-from common.util import get_fuzzy_match_regex
+from common.util import as_list, get_fuzzy_match_regex
 
 from main.models import RefData
 from main.query_utils import compose_bibitem
 from main.query import hydrate_relations, search_refs_relaton_field
-from main.query import build_citation_for_docid
+from main.query import build_citation_for_docid, search_refs_docids
+from main.query import search_refs_docids_per_id
 from main.exceptions import RefNotFoundError
 
 from .models import Xml2rfcItem, construct_normalized_xml2rfc_subpath
@@ -61,13 +62,31 @@ class Xml2rfcAdapter:
     """
     If True, then default behavior is to match
     the docid.id obtained from ``resolve_docid()`` exactly
-    (unless you override ``get_docid_query()`` or others).
+    using docid lookup table (unless you override ``fetch_refs()``).
 
     If False, a case-insensitive regex query is used
     to match ID parts split by punctuation/special characters.
     This is fuzzier and can lead to false positives.
     """
 
+    prerender: bool = True
+    """
+    Whether XML for paths returned by :meth:`.reverse()`
+    should be pre-rendered when sources are indexed
+    (see :mod:`xml2rfc_compat.prerender`).
+
+    Adapters whose resolution depends on data
+    not covered by indexable sources, such as external services,
+    should set this to False. Responses for such adapters’ paths
+    also don’t support conditional requests.
+    """
+
+    prefetched_refs: Optional[Sequence[RefData]] = None
+    """
+    If populated by :meth:`.resolve_many()`,
+    :meth:`.fetch_refs()` returns these refs instead of querying.
+    """
+
     _log: List[str]
 
     def __init__(self, subpath: str, dirname: str, anchor: str):
@@ -112,6 +131,73 @@ class Xml2rfcAdapter:
                 return None
         return self.resolved_item
 
+    @classmethod
+    def resolve_many(cls, instances: Sequence['Xml2rfcAdapter']):
+        """
+        Resolves given instances of this adapter together,
+        using a fixed number of DB queries,
+        so that subsequent :meth:`.resolve()` calls
+        don’t have to query for each instance.
+
+        By default, only has effect if :attr:`.exact_docid_match` is set:
+        refs for identifiers obtained from ``resolve_docid()``
+        are retrieved together and stored
+        under :attr:`.prefetched_refs`, then items are built
+        and their relations are hydrated together,
+        populating :attr:`.resolved_item`.
+
+        Does not raise exceptions. Instances that fail to build
+        are left unresolved, so that :meth:`.resolve()`
+        can report the error.
+        """
+        if not cls.exact_docid_match:
+            return
+
+        instance_docids: List[List[DocID]] = []
+        for instance in instances:
+            docids = as_list(instance.resolve_docid() or [])
+            for docid in docids:
+                instance.log(f"using exact docid {docid.type} {docid.id}")
+            instance_docids.append([
+                DocID(id=docid.id, type=docid.type, primary=True)
+                for docid in docids
+            ])
+
+        refs_per_id = iter(search_refs_docids_per_id(
+            [docid for docids in instance_docids for docid in docids],
+            case_sensitive=True,
+        ))
+
+        relations: List[Relation] = []
+        for instance, docids in zip(instances, instance_docids):
+            refs: Dict[int, RefData] = {}
+            for _ in docids:
+                refs.update((ref.pk, ref) for ref in next(refs_per_id))
+            instance.prefetched_refs = sorted(
+                refs.values(),
+                key=lambda ref: ref.latest_date,
+                reverse=True,
+            )[:15]
+            if num_refs := len(instance.prefetched_refs):
+                try:
+                    item, valid = compose_bibitem(
+                        instance.prefetched_refs,
+                        strict=True)
+                except Exception:
+                    continue
+                instance.log(f"{num_refs} found")
+                instance.resolved_item = item
+                if valid and item.relation:
+                    relations.extend(item.relation)
+
+        if relations:
+            hydrate_relations(
+                relations,
+                strict=True,
+                depth=1,
+                resolved_item_cache={},
+            )
+
     def format_anchor(self) -> Optional[str]:
         """
         If service requires a different anchor attribute value
@@ -178,6 +264,10 @@ class Xml2rfcAdapter:
         self._log.append(msg)
 
     def fetch_refs(self) -> Sequence[RefData]:
+        if self.prefetched_refs is not None:
+            return self.prefetched_refs
+        if self.exact_docid_match:
+            return self.fetch_refs_by_exact_docid()
         if (query := self.get_docid_query()):
             self.log(f"using query {query}")
             return search_refs_relaton_field({
@@ -185,6 +275,22 @@ class Xml2rfcAdapter:
             }, limit=10, exact=True)
         return []
 
+    def fetch_refs_by_exact_docid(self) -> Sequence[RefData]:
+        """
+        Finds items where any of docids obtained from ``resolve_docid()``
+        is primary and matches exactly,
+        using :func:`main.query.search_refs_docids()`.
+        """
+        docids = as_list(self.resolve_docid() or [])
+        for docid in docids:
+            self.log(f"using exact docid {docid.type} {docid.id}")
+        if len(docids) > 0:
+            return search_refs_docids(*(
+                DocID(id=docid.id, type=docid.type, primary=True)
+                for docid in docids
+            ), case_sensitive=True)
+        return []
+
     def get_docid_query(self) -> Optional[str]:
         if (docid := self.resolve_docid()):
             if isinstance(docid, list):
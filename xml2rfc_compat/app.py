@@ -10,3 +10,9 @@ class Config(AppConfig):
         # Import modules to make things register as a side effect
         importlib.import_module('xml2rfc_compat.source')
         importlib.import_module('xml2rfc_compat.serializer')
+
+        from sources.signals import index_changed
+        from .prerender import handle_index_changed
+        index_changed.connect(
+            handle_index_changed,
+            dispatch_uid='xml2rfc_prerender')
@@ -19,7 +19,7 @@ from django.db.models.query import QuerySet
 from django.conf import settings
 from django.core.cache import cache
 
-from sources import indexable
+from sources.generations import get_generation_token
 from bib_models import BibliographicItem
 
 from .aliases import get_aliases
@@ -100,7 +100,7 @@ class ExploreDirectory(TemplateView):
     Template must be supplied by view user via ``template_name``.
     """
 
-    item_list_cache_seconds = 300
+    item_list_cache_seconds = 86400
     """How many seconds to cache given directory item listing for."""
 
     def get(self, request, *args, **kwargs):
@@ -192,19 +192,18 @@ class ExploreDirectory(TemplateView):
     def get_cache_key(self, dirname) -> str:
         """
         A cache key that is guaranteed to change if any mapped path changes,
-        or if the number of indexed xml2rfc paths is different.
+        or if xml2rfc paths were reindexed.
         """
         no_cache = self.request.GET.get('bypass_cache', None)
         if no_cache:
             return str(time.time())
         else:
-            indexed_count = indexable.registry['xml2rfc'].count_indexed()
             mapped_paths = frozenset([
                 f"{m.subpath}:{m.sidecar_meta['primary_docid']}"
                 for m in get_mapped_xml2rfc_items().order_by('subpath')
             ])
             return json.dumps({
-                'total_indexed': indexed_count,
+                'generation': get_generation_token(['xml2rfc']),
                 'map_hash': hash(mapped_paths),
                 'dirname': dirname,
             })
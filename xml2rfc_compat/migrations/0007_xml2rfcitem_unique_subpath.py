@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-17 04:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('xml2rfc_compat', '0006_delete_manualpathmap_xml2rfcitem_sidecar_meta'),
+    ]
+
+    operations = [
+        # Paths were never duplicated in practice, since the table
+        # used to be wiped before each indexing run,
+        # but make sure the unique constraint can be created
+        migrations.RunSQL(
+            sql="""
+            DELETE FROM xml2rfc_compat_xml2rfcitem a
+            USING xml2rfc_compat_xml2rfcitem b
+            WHERE a.subpath = b.subpath AND a.id < b.id;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AlterField(
+            model_name='xml2rfcitem',
+            name='subpath',
+            field=models.CharField(max_length=255, unique=True),
+        ),
+    ]
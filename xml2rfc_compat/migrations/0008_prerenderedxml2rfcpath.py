@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-17 04:40
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('xml2rfc_compat', '0007_xml2rfcitem_unique_subpath'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PrerenderedXml2rfcPath',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('subpath', models.CharField(max_length=255, unique=True)),
+                ('xml_repr', models.TextField()),
+                ('resolution_method', models.CharField(max_length=16)),
+                ('resolution_config', models.TextField()),
+                ('source_ids', models.JSONField(default=list)),
+                ('rendered_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'indexes': [django.contrib.postgres.indexes.GinIndex(fields=['source_ids'], name='prerendered_source_ids_gin')],
+            },
+        ),
+    ]
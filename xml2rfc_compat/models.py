@@ -1,6 +1,7 @@
 from typing import Optional
 import re
 from django.db import models
+from django.contrib.postgres.indexes import GinIndex
 from django.db.models.query import QuerySet
 
 
@@ -39,7 +40,7 @@ def construct_normalized_xml2rfc_subpath(dirname: str, anchor: str) -> str:
 class Xml2rfcItem(models.Model):
     """Represents an item at an :term:`xml2rfc-style path`."""
 
-    subpath = models.CharField(max_length=255, db_index=True)
+    subpath = models.CharField(max_length=255, unique=True)
     """File path, relative to :data:`bibxml.settings.XML2RFC_PATH_PREFIX`
     with no leading slash."""
 
@@ -79,6 +80,38 @@ class Xml2rfcItem(models.Model):
             return self.subpath
 
 
+class PrerenderedXml2rfcPath(models.Model):
+    """Bibxml pre-rendered for an :term:`xml2rfc-style path`
+    when sources are indexed.
+
+    .. seealso:: :mod:`xml2rfc_compat.prerender`
+    """
+
+    subpath = models.CharField(max_length=255, unique=True)
+    """Normalized subpath with canonical (unaliased) dirname,
+    see :func:`.construct_normalized_xml2rfc_subpath()`."""
+
+    xml_repr = models.TextField()
+    """Serialized resolved item, with anchor formatted by adapter
+    but not yet mangled."""
+
+    resolution_method = models.CharField(max_length=16)
+    """How the item was resolved (“manual” or “auto”)."""
+
+    resolution_config = models.TextField()
+    """Adapter’s resolution log at the time of rendering."""
+
+    source_ids = models.JSONField(default=list)
+    """IDs of sources the rendered item depends on."""
+
+    rendered_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=['source_ids'], name='prerendered_source_ids_gin'),
+        ]
+
+
 def get_xml2rfc_items_for_dir(dirname: str) -> QuerySet[Xml2rfcItem]:
     """Returns a QuerySet of Xml2rfcItem objects
     given canonical (unaliased) ``dirname`` (e.g., “bibxml2”).
@@ -0,0 +1,235 @@
+"""
+Pre-rendering of bibxml for :term:`xml2rfc-style paths <xml2rfc-style path>`
+when indexable sources change.
+
+After a source is indexed (see :data:`sources.signals.index_changed`),
+paths that registered adapters’ ``reverse()`` methods return
+for the source’s items, as well as previously rendered paths
+that depended on the source, are resolved the same way
+:func:`xml2rfc_compat.views.handle_xml2rfc_path` would resolve them.
+Serialized results are stored
+as :class:`~xml2rfc_compat.models.PrerenderedXml2rfcPath` instances,
+and the view serves them with only the anchor substituted.
+
+Paths that fail to resolve are removed from the store,
+so that the view falls back to resolving them on request.
+
+Adapters can opt out via :attr:`~.adapters.Xml2rfcAdapter.prerender`.
+"""
+
+import logging
+from typing import Iterable, List, Optional, Set, Tuple
+
+from django.conf import settings
+from django.db.models import Q
+
+from bib_models.util import construct_bibitem
+from main.citation_cache import get_source_ids
+from main.models import RefData
+from main.sources import get_source_meta
+from relaton.models.bibdata import BibliographicItem
+
+from .adapters import adapters
+from .models import PrerenderedXml2rfcPath
+from .models import construct_normalized_xml2rfc_subpath
+from .models import get_dir_subpath_regex, get_mapped_xml2rfc_items
+from .serializer import to_xml_string
+from .source import SOURCE_ID
+from .views import resolve_item, format_anchor_safe
+
+
+__all__ = (
+    'handle_index_changed',
+    'prerender_for_source',
+    'prerender_paths',
+    'render_xml2rfc_path',
+    'list_prerenderable_paths',
+)
+
+
+log = logging.getLogger(__name__)
+
+
+XML2RFC_PRERENDER: bool = getattr(
+    settings,
+    'XML2RFC_PRERENDER',
+    True)
+
+INDEXING_BATCH_SIZE: int = getattr(
+    settings,
+    'INDEXING_BATCH_SIZE',
+    500)
+
+
+Xml2rfcPath = Tuple[str, str]
+"""Canonical dirname and anchor."""
+
+
+def handle_index_changed(sender: str, refs: Optional[List[str]], **kwargs):
+    """Receiver for :data:`sources.signals.index_changed`."""
+    if XML2RFC_PRERENDER:
+        rendered, removed = prerender_for_source(sender, refs)
+        log.info(
+            "Pre-rendered %s xml2rfc paths, removed %s, after %s changed",
+            rendered,
+            removed,
+            sender)
+
+
+def prerender_for_source(
+    source_id: str,
+    refs: Optional[List[str]] = None,
+) -> Tuple[int, int]:
+    """Pre-renders paths affected by changes in given source.
+
+    :param refs:
+        refs that were reindexed, or None if the whole source was.
+    :returns: 2-tuple (number of rendered paths, number of removed paths)
+    """
+    paths: Set[Xml2rfcPath] = set()
+
+    # Paths for items provided by the source
+    ref_bodies = RefData.objects.filter(dataset=source_id)
+    if refs is not None:
+        ref_bodies = ref_bodies.filter(ref__in=refs)
+    for body in ref_bodies.values_list('body', flat=True).iterator():
+        try:
+            item, _ = construct_bibitem(body, strict=False)
+        except Exception:
+            log.exception("Failed to construct item when pre-rendering")
+        else:
+            paths.update(list_prerenderable_paths(item))
+
+    # Paths mapped manually
+    if source_id == SOURCE_ID:
+        for xml2rfc_item in get_mapped_xml2rfc_items():
+            paths.add((
+                xml2rfc_item.format_dirname(),
+                xml2rfc_item.format_anchor(),
+            ))
+
+    # Previously rendered paths that depend on the source
+    query = Q(source_ids__contains=[source_id])
+    query |= Q(source_ids__contains=[get_source_meta(source_id).id])
+    for subpath in (
+        PrerenderedXml2rfcPath.objects.
+        filter(query).
+        values_list('subpath', flat=True).
+        iterator()
+    ):
+        if path := parse_normalized_subpath(subpath):
+            paths.add(path)
+
+    return prerender_paths(paths)
+
+
+def prerender_paths(paths: Iterable[Xml2rfcPath]) -> Tuple[int, int]:
+    """Renders given paths and stores results in bulk,
+    in batches of :data:`bibxml.settings.INDEXING_BATCH_SIZE`.
+    Paths that fail to render are removed from the store.
+
+    :returns: 2-tuple (number of rendered paths, number of removed paths)
+    """
+    batch: List[PrerenderedXml2rfcPath] = []
+    failed_subpaths: List[str] = []
+    rendered = 0
+
+    for dirname, anchor in sorted(paths):
+        adapter_cls = adapters.get(dirname, None)
+        if not adapter_cls or not adapter_cls.prerender:
+            continue
+        if obj := render_xml2rfc_path(dirname, anchor):
+            batch.append(obj)
+            rendered += 1
+            if len(batch) >= INDEXING_BATCH_SIZE:
+                upsert_prerendered(batch)
+                batch = []
+        else:
+            failed_subpaths.append(
+                construct_normalized_xml2rfc_subpath(dirname, anchor))
+
+    upsert_prerendered(batch)
+
+    removed, _ = (
+        PrerenderedXml2rfcPath.objects.
+        filter(subpath__in=failed_subpaths).
+        delete())
+
+    return rendered, removed
+
+
+def render_xml2rfc_path(
+    dirname: str,
+    anchor: str,
+) -> Optional[PrerenderedXml2rfcPath]:
+    """Resolves and serializes given path
+    the same way :func:`xml2rfc_compat.views.handle_xml2rfc_path` would,
+    without mangling the anchor.
+
+    Returns an unsaved instance, or None if path could not be resolved.
+    Does not raise exceptions.
+    """
+    subpath = construct_normalized_xml2rfc_subpath(dirname, anchor)
+    adapter = adapters[dirname](subpath, dirname, anchor)
+
+    item, method_results = resolve_item(adapter, subpath, subpath)
+    if not item:
+        return None
+
+    try:
+        xml_repr = to_xml_string(
+            item,
+            anchor=format_anchor_safe(adapter, subpath),
+        ).decode('utf-8')
+    except Exception:
+        log.exception("Failed to pre-render xml2rfc path %s", subpath)
+        return None
+
+    method, outcome = next(iter(method_results.items()))
+    source_ids = get_source_ids(item)
+    if method == 'manual':
+        source_ids.add(SOURCE_ID)
+
+    return PrerenderedXml2rfcPath(
+        subpath=subpath,
+        xml_repr=xml_repr,
+        resolution_method=method,
+        resolution_config=outcome['config'],
+        source_ids=sorted(source_ids),
+    )
+
+
+def upsert_prerendered(items: List[PrerenderedXml2rfcPath]):
+    """Creates or updates given instances in a single statement."""
+    if len(items) < 1:
+        return
+    PrerenderedXml2rfcPath.objects.bulk_create(
+        items,
+        update_conflicts=True,
+        unique_fields=['subpath'],
+        update_fields=[
+            'xml_repr',
+            'resolution_method',
+            'resolution_config',
+            'source_ids',
+            'rendered_at',
+        ],
+    )
+
+
+def list_prerenderable_paths(item: BibliographicItem) -> List[Xml2rfcPath]:
+    """Returns paths that adapters opting into pre-rendering
+    reverse given item to."""
+    return [
+        (dirname, anchor)
+        for dirname, adapter_cls in adapters.items()
+        if adapter_cls.prerender
+        for anchor, _ in adapter_cls.reverse(item)
+    ]
+
+
+def parse_normalized_subpath(subpath: str) -> Optional[Xml2rfcPath]:
+    dirname = subpath.split('/', 1)[0]
+    if match := get_dir_subpath_regex(dirname).match(subpath):
+        return dirname, match.group('anchor')
+    return None
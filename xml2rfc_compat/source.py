@@ -6,17 +6,29 @@ during migration from xml2rfc-style API.
 
 import glob
 import os
-from typing import List, Union, Callable, Tuple
-
-import yaml
+from typing import List, Dict, Union, Callable, Tuple, Optional, Any
 
+from django.conf import settings
 from django.db import transaction
 
+from common.yaml import load_data
 from sources import indexable
+from sources.manifest import get_file_digest, load_manifest
+from sources.manifest import save_manifest_entries, delete_manifest_entries
+from sources.manifest import reset_manifest
 
 from .models import Xml2rfcItem
 
 
+SOURCE_ID = 'xml2rfc'
+"""Identifier of the :term:`xml2rfc archive source`."""
+
+INDEXING_BATCH_SIZE: int = getattr(
+    settings,
+    'INDEXING_BATCH_SIZE',
+    500)
+
+
 def index_xml2rfc_source(
     work_dirs: List[str],
     refs: Union[List[str], None],
@@ -30,6 +42,13 @@ def index_xml2rfc_source(
 
     Uses :class:`.models.Xml2rfcItem` to store indexed data.
 
+    Only writes items for XML or sidecar files
+    that have changed since last indexation (in batches
+    of :data:`bibxml.settings.INDEXING_BATCH_SIZE`),
+    and deletes items for XML files that were removed,
+    using source manifest (see :mod:`sources.manifest`).
+    Sidecar files that have not changed are not parsed again.
+
     .. seealso:: :term:`xml2rfc archive source`
     """
 
@@ -53,14 +72,36 @@ def index_xml2rfc_source(
     on_progress(total, 0)
 
     indexed_paths = set()
+    unchanged_paths = set()
 
-    with transaction.atomic():
-        # Unconditionally drop all first
-        Xml2rfcItem.objects.all().delete()
+    manifest = load_manifest(SOURCE_ID)
+    changed_digests: Dict[str, str] = {}
 
+    # Items to write, with sidecar metadata set to None
+    # if sidecar file did not change and can be kept as is
+    batch: List[Tuple[str, str, Optional[Dict[str, Any]]]] = []
+
+    with transaction.atomic():
         for idx, xml_fpath in enumerate(source_xml_files):
             on_progress(total, idx)
 
+            _pparts = xml_fpath.split(os.sep)
+            dirname, fname = _pparts[-2], _pparts[-1]
+            relative_fpath = f'{dirname}{os.sep}{fname}'
+            relative_yaml_fpath = get_sidecar_path(relative_fpath)
+
+            yaml_fpath = get_sidecar_path(xml_fpath)
+
+            xml_digest = get_file_digest(xml_fpath)
+            yaml_digest = get_file_digest(yaml_fpath)
+
+            xml_changed = manifest.get(relative_fpath) != xml_digest
+            yaml_changed = manifest.get(relative_yaml_fpath) != yaml_digest
+
+            if not xml_changed and not yaml_changed:
+                unchanged_paths.add(relative_fpath)
+                continue
+
             with open(xml_fpath, 'r', encoding='utf-8') as xml_fhandler:
                 try:
                     xml_data = xml_fhandler.read()
@@ -72,37 +113,106 @@ def index_xml2rfc_source(
                         on_error(xml_fpath, "NUL character in XML string")
                         continue
 
-            # Parsing sidecar metadata file
-            yaml_fpath = f"{xml_fpath.removesuffix('.xml')}.yaml"
-            if os.path.exists(yaml_fpath):
+            sidecar_metadata: Optional[Dict[str, Any]]
+            if not yaml_changed:
+                sidecar_metadata = None
+            elif os.path.exists(yaml_fpath):
                 with open(yaml_fpath, 'r', encoding='utf-8') as yaml_fh:
-                    sidecar_metadata = yaml.load(
-                        yaml_fh.read(),
-                        Loader=yaml.SafeLoader)
+                    sidecar_metadata = load_data(yaml_fh.read())
             else:
                 sidecar_metadata = dict()
 
-            _pparts = xml_fpath.split(os.sep)
-            dirname, fname = _pparts[-2], _pparts[-1]
-            relative_fpath = f'{dirname}{os.sep}{fname}'
-            Xml2rfcItem.objects.update_or_create(
-                subpath=relative_fpath,
-                defaults=dict(
-                    xml_repr=xml_data,
-                    sidecar_meta=sidecar_metadata,
-                ),
-            )
+            batch.append((relative_fpath, xml_data, sidecar_metadata))
 
             indexed_paths.add(relative_fpath)
+            changed_digests[relative_fpath] = xml_digest
+            changed_digests[relative_yaml_fpath] = yaml_digest
+
+            if len(batch) >= INDEXING_BATCH_SIZE:
+                upsert_items(batch)
+                batch = []
+
+        upsert_items(batch)
+
+        save_manifest_entries(SOURCE_ID, changed_digests)
+
+        present_paths = indexed_paths | unchanged_paths
+
+        if manifest:
+            # Delete items for files that were indexed previously
+            # but are now gone from source (or failed to index)
+            stale_paths = set(
+                fpath
+                for fpath in manifest.keys()
+                if fpath.endswith('.xml')
+            ) - present_paths
+            Xml2rfcItem.objects.filter(subpath__in=stale_paths).delete()
+            delete_manifest_entries(SOURCE_ID, [
+                *stale_paths,
+                *(get_sidecar_path(fpath) for fpath in stale_paths),
+            ])
+        else:
+            Xml2rfcItem.objects.exclude(subpath__in=present_paths).delete()
 
     return total, len(indexed_paths)
 
 
+def get_sidecar_path(xml_fpath: str) -> str:
+    """Returns sidecar metadata file path for given XML file path."""
+    return f"{xml_fpath.removesuffix('.xml')}.yaml"
+
+
+def upsert_items(items: List[Tuple[str, str, Optional[Dict[str, Any]]]]):
+    """Creates or updates :class:`~.models.Xml2rfcItem` instances
+    in a single statement.
+
+    Takes a list of tuples (subpath, XML string, sidecar metadata).
+    Where sidecar metadata is None, metadata of already indexed item
+    is kept.
+    """
+    if len(items) < 1:
+        return
+
+    existing_sidecars: Dict[str, Dict[str, Any]] = dict(
+        Xml2rfcItem.objects.
+        filter(subpath__in=[
+            subpath
+            for subpath, _, sidecar_meta in items
+            if sidecar_meta is None
+        ]).
+        values_list('subpath', 'sidecar_meta'))
+
+    Xml2rfcItem.objects.bulk_create(
+        [
+            Xml2rfcItem(
+                subpath=subpath,
+                xml_repr=xml_repr,
+                sidecar_meta=(
+                    sidecar_meta
+                    if sidecar_meta is not None
+                    else existing_sidecars.get(subpath, dict())
+                ),
+            )
+            for subpath, xml_repr, sidecar_meta in items
+        ],
+        update_conflicts=True,
+        unique_fields=['subpath'],
+        update_fields=['xml_repr', 'sidecar_meta'],
+    )
+
+
+def reset_xml2rfc_index():
+    """Deletes all indexed xml2rfc paths, along with source manifest."""
+    with transaction.atomic():
+        Xml2rfcItem.objects.all().delete()
+        reset_manifest(SOURCE_ID)
+
+
 indexable.register_git_source(
-    'xml2rfc',
+    SOURCE_ID,
     [('https://github.com/ietf-tools/bibxml-data-archive', 'main')],
 )({
     'indexer': index_xml2rfc_source,
     'count_indexed': Xml2rfcItem.objects.count,
-    'reset_index': (lambda: Xml2rfcItem.objects.all().delete()),
+    'reset_index': reset_xml2rfc_index,
 })
@@ -0,0 +1,111 @@
+import json
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from bibxml.settings import XML2RFC_PATH_PREFIX
+from bibxml.xml2rfc_adapters import IanaAdapter
+from xml2rfc_compat.models import Xml2rfcItem
+from xml2rfc_compat.views import resolve_xml2rfc_paths
+
+
+class BatchResolutionTestCase(TestCase):
+    """
+    Test cases for resolving many xml2rfc paths at once.
+    """
+
+    fixtures = ['test_refdata.json']
+
+    rfc_subpaths = [
+        'bibxml/reference.RFC.4035.xml',
+        'bibxml/reference.RFC.4036.xml',
+        'bibxml/reference.RFC.4037.xml',
+    ]
+
+    def _get(self, subpath: str):
+        return self.client.get(
+            f'/{XML2RFC_PATH_PREFIX}{subpath}',
+            HTTP_X_REQUESTED_WITH='xml2rfcResolver')
+
+    def _post(self, subpaths):
+        response = self.client.post(
+            reverse('xml2rfc_batch'),
+            json.dumps({'paths': subpaths}),
+            content_type='application/json',
+            HTTP_X_REQUESTED_WITH='xml2rfcResolver')
+        return response, [
+            json.loads(line)
+            for line in response.content.splitlines()
+        ] if response.status_code == 200 else []
+
+    def test_results_match_individual_requests(self):
+        subpaths = [
+            *self.rfc_subpaths,
+            'bibxml2/reference.FIPS.180.1993.xml',
+        ]
+        results = resolve_xml2rfc_paths(subpaths)
+
+        for subpath, result in zip(subpaths, results):
+            self.assertIsNotNone(result)
+            xml_repr, _ = result  # type: ignore[misc]
+            self.assertEqual(
+                xml_repr.encode('utf-8'),  # type: ignore[union-attr]
+                self._get(subpath).content)
+
+    def test_query_count_does_not_depend_on_path_count(self):
+        with CaptureQueriesContext(connection) as single:
+            resolve_xml2rfc_paths(self.rfc_subpaths[:1])
+        with CaptureQueriesContext(connection) as many:
+            resolve_xml2rfc_paths(self.rfc_subpaths)
+
+        self.assertEqual(
+            len(many.captured_queries),
+            len(single.captured_queries))
+
+    def test_iana_paths_use_prefetched_items(self):
+        subpath = 'bibxml8/reference.IANA.xml-security-uris_security-uris.xml'
+        with mock.patch.object(
+            IanaAdapter,
+            'build_bibitem_from_refs',
+        ) as build_bibitem_from_refs:
+            [(xml_repr, _)] = resolve_xml2rfc_paths([  # type: ignore[misc]
+                subpath,
+            ])
+
+        build_bibitem_from_refs.assert_not_called()
+        self.assertEqual(
+            xml_repr.encode('utf-8'),  # type: ignore[union-attr]
+            self._get(subpath).content)
+
+    def test_fallback_xml(self):
+        Xml2rfcItem.objects.create(
+            subpath='bibxml/reference.RFC.9999.xml',
+            xml_repr='<reference anchor="RFC9999"/>',
+            sidecar_meta={})
+
+        [(xml_repr, method_results)] = resolve_xml2rfc_paths([  # type: ignore[misc]
+            'bibxml/_reference.RFC.9999.xml',
+        ])
+
+        self.assertEqual(xml_repr, '<reference anchor="RFC9999"/>')
+        self.assertEqual(method_results['fallback']['error'], '')
+
+    def test_batch_view(self):
+        response, lines = self._post([
+            f'/{XML2RFC_PATH_PREFIX}{self.rfc_subpaths[0]}',
+            'bibxml/reference.RFC.99999.xml',
+            'unknown/reference.FOO.xml',
+        ])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([line['status'] for line in lines], [200, 404, 404])
+        self.assertEqual(lines[0]['subpath'], self.rfc_subpaths[0])
+        self.assertIn('<reference', lines[0]['content'])
+        self.assertIn('message', lines[1]['error'])
+
+    def test_batch_view_invalid_request(self):
+        response, _ = self._post('bibxml/reference.RFC.4037.xml')
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,95 @@
+from unittest import mock
+
+from django.test import TestCase
+
+from bibxml.settings import XML2RFC_PATH_PREFIX
+from main.models import RefData
+from xml2rfc_compat.models import PrerenderedXml2rfcPath
+from xml2rfc_compat import views
+from xml2rfc_compat.prerender import prerender_for_source
+
+
+class PrerenderTestCase(TestCase):
+    """
+    Test cases for pre-rendering xml2rfc paths.
+    """
+
+    fixtures = ['test_refdata.json']
+
+    subpath = 'bibxml/reference.RFC.4037.xml'
+
+    def _get(self, params=None, **headers):
+        return self.client.get(
+            f'/{XML2RFC_PATH_PREFIX}{self.subpath}',
+            params or {},
+            HTTP_X_REQUESTED_WITH='xml2rfcResolver',
+            **headers)
+
+    def test_prerender_for_source(self):
+        rendered, removed = prerender_for_source('rfcs')
+
+        self.assertGreater(rendered, 0)
+        self.assertEqual(removed, 0)
+        prerendered = PrerenderedXml2rfcPath.objects.get(subpath=self.subpath)
+        self.assertEqual(prerendered.resolution_method, 'auto')
+        self.assertIn('<reference', prerendered.xml_repr)
+
+    def test_prerendered_xml_is_served(self):
+        cold = self._get()
+        prerender_for_source('rfcs')
+        RefData.objects.filter(dataset='rfcs').delete()
+
+        warm = self._get()
+
+        self.assertEqual(warm.status_code, 200)
+        self.assertEqual(warm.content, cold.content)
+        self.assertIn('(prerendered)', warm.headers['X-Resolution-Outcomes'])
+
+    def test_not_modified(self):
+        prerender_for_source('rfcs')
+        etag = self._get().headers['ETag']
+
+        resp = self._get(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, 304)
+
+        PrerenderedXml2rfcPath.objects.filter(subpath=self.subpath).update(
+            xml_repr='<reference anchor="RFC4037"/>')
+        resp = self._get(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, 200)
+
+    def test_prerendered_xml_is_not_served_if_disabled(self):
+        prerender_for_source('rfcs')
+        PrerenderedXml2rfcPath.objects.filter(subpath=self.subpath).update(
+            xml_repr='<reference anchor="RFC4037"/>')
+
+        with mock.patch.object(views, 'XML2RFC_PRERENDER', False):
+            etag = self._get().headers['ETag']
+            resp = self._get()
+            self.assertEqual(resp.status_code, 200)
+            self.assertNotIn(
+                '(prerendered)',
+                resp.headers['X-Resolution-Outcomes'])
+
+            PrerenderedXml2rfcPath.objects.filter(
+                subpath=self.subpath,
+            ).update(xml_repr='<reference anchor="OTHER"/>')
+            resp = self._get(HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(resp.status_code, 304)
+
+    def test_requested_anchor_is_substituted(self):
+        prerender_for_source('rfcs')
+
+        resp = self._get({'anchor': 'CUSTOM'})
+
+        self.assertIn(b'anchor="CUSTOM"', resp.content)
+
+    def test_unresolvable_paths_are_removed(self):
+        prerender_for_source('rfcs')
+        RefData.objects.filter(dataset='rfcs', ref='RFC4037').delete()
+
+        rendered, removed = prerender_for_source('rfcs')
+
+        self.assertGreaterEqual(removed, 1)
+        self.assertFalse(PrerenderedXml2rfcPath.objects.filter(
+            subpath=self.subpath,
+        ).exists())
@@ -0,0 +1,84 @@
+import os
+import tempfile
+
+from django.test import TestCase
+
+from xml2rfc_compat.models import Xml2rfcItem
+from xml2rfc_compat.source import index_xml2rfc_source
+
+
+class IndexXml2rfcSourceTestCase(TestCase):
+    """
+    Test cases for xml2rfc archive source indexing.
+    """
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.work_dir = self._tmp.name
+        os.makedirs(os.path.join(self.work_dir, 'bibxml'))
+        for num in range(3):
+            self._write(
+                f'bibxml/reference.RFC.{num}.xml',
+                f'<reference anchor="RFC{num}"/>')
+        self._write(
+            'bibxml/reference.RFC.1.yaml',
+            'primary_docid: RFC 1\n')
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, relative_path: str, contents: str):
+        fpath = os.path.join(self.work_dir, relative_path)
+        with open(fpath, 'w', encoding='utf-8') as f:
+            f.write(contents)
+
+    def _index(self):
+        return index_xml2rfc_source(
+            [self.work_dir],
+            None,
+            lambda total, indexed: None,
+            lambda item, err: None,
+        )
+
+    def test_index(self):
+        self.assertEqual(self._index(), (3, 3))
+        self.assertEqual(
+            Xml2rfcItem.objects.get(
+                subpath='bibxml/reference.RFC.1.xml',
+            ).sidecar_meta,
+            {'primary_docid': 'RFC 1'},
+        )
+
+    def test_unchanged_files_are_skipped(self):
+        self._index()
+        self._write(
+            'bibxml/reference.RFC.1.yaml',
+            'primary_docid: RFC 2\n')
+
+        self.assertEqual(self._index(), (3, 1))
+        self.assertEqual(Xml2rfcItem.objects.count(), 3)
+        self.assertEqual(
+            Xml2rfcItem.objects.get(
+                subpath='bibxml/reference.RFC.1.xml',
+            ).sidecar_meta,
+            {'primary_docid': 'RFC 2'},
+        )
+
+    def test_unchanged_sidecar_is_kept(self):
+        self._index()
+        self._write(
+            'bibxml/reference.RFC.1.xml',
+            '<reference anchor="RFC1-updated"/>')
+
+        self.assertEqual(self._index(), (3, 1))
+        item = Xml2rfcItem.objects.get(subpath='bibxml/reference.RFC.1.xml')
+        self.assertEqual(item.xml_repr, '<reference anchor="RFC1-updated"/>')
+        self.assertEqual(item.sidecar_meta, {'primary_docid': 'RFC 1'})
+
+    def test_deleted_files_are_removed_from_index(self):
+        self._index()
+        os.remove(os.path.join(self.work_dir, 'bibxml/reference.RFC.2.xml'))
+
+        self._index()
+
+        self.assertEqual(Xml2rfcItem.objects.count(), 2)
@@ -2,14 +2,17 @@
 Provides utilities for constructing patterns
 fit for inclusion in site’s root URL configuration.
 """
-from django.urls import re_path
+from django.urls import path, re_path
 from django.views.decorators.cache import never_cache
-from django.views.decorators.http import require_safe
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+
+from common.decorators import cache_control, require_safe
 
 from .aliases import get_aliases
 from .models import dir_subpath_regex
 from .adapters import adapters
-from .views import handle_xml2rfc_path
+from .views import handle_xml2rfc_path, handle_xml2rfc_paths
 
 
 def get_urls():
@@ -28,7 +31,14 @@ def get_urls():
     and constructed view handles bibliographic item resolution
     according to :ref:`xml2rfc-path-resolution-algorithm`.
 
-    .. seealso:: :func:`.handle_xml2rfc_path` for how requests are handled.
+    Responses may be stored by clients and shared caches,
+    but must be revalidated on each use.
+
+    Additionally, ``batch/`` pattern accepts POST requests
+    to resolve many paths at once.
+
+    .. seealso:: :func:`.handle_xml2rfc_path` for how requests are handled,
+                 :func:`.handle_xml2rfc_paths` for batch requests.
     """
     dirnames_with_aliases = [
         d
@@ -36,9 +46,15 @@ def get_urls():
         for d in [dirname, *get_aliases(dirname)]
     ]
     return [
+        path(
+            'batch/',
+            never_cache(csrf_exempt(require_POST(handle_xml2rfc_paths))),
+            name='xml2rfc_batch'),
+    ] + [
         re_path(
             dir_subpath_regex % dirname,
-            never_cache(require_safe(handle_xml2rfc_path)),
+            cache_control(no_cache=True)(
+                require_safe(handle_xml2rfc_path)),
             name='xml2rfc_%s' % dirname)
         for dirname in dirnames_with_aliases
     ]
@@ -1,31 +1,55 @@
-from typing import Tuple, Optional, TypedDict, Dict, Callable
+from datetime import datetime
+from typing import Tuple, Optional, TypedDict, Dict, Callable, Type
+from typing import Any, List, Sequence
+import json
 import re
 import logging
 
 from pydantic import ValidationError
+from asgiref.sync import sync_to_async
 
+from django.conf import settings
+from django.db.models.functions import MD5
 from django.http import HttpResponse, HttpResponseNotFound, JsonResponse
 
-from bib_models import BibliographicItem
+from bib_models import BibliographicItem, DocID
+from common.decorators import condition
 from prometheus import metrics
 
+from main.conditional import make_etag, get_last_modified
 from main.exceptions import RefNotFoundError
+from main.query import build_citations_in_batch
 
-from .models import Xml2rfcItem, construct_normalized_xml2rfc_subpath
+from .models import Xml2rfcItem, PrerenderedXml2rfcPath
+from .models import construct_normalized_xml2rfc_subpath, dir_subpath_regex
 from .adapters import Xml2rfcAdapter, adapters
 # from .resolvers import AnchorFormatterFunc, anchor_formatter_registry
 from .serializer import to_xml_string
-from .aliases import unalias
+from .aliases import unalias, get_aliases
 
 
 log = logging.getLogger(__name__)
 
 
+XML2RFC_PATH_PREFIX: str = getattr(
+    settings,
+    'XML2RFC_PATH_PREFIX',
+    'public/rfc/')
+
+API_BATCH_MAX_ITEMS: int = getattr(settings, 'API_BATCH_MAX_ITEMS', 500)
+
+XML2RFC_PRERENDER: bool = getattr(settings, 'XML2RFC_PRERENDER', True)
+
+
 __all__ = (
     'handle_xml2rfc_path',
+    'handle_xml2rfc_paths',
+    'resolve_xml2rfc_paths',
+    'resolve_item',
     'resolve_mapping',
     'resolve_automatically',
     'obtain_fallback_xml',
+    'aobtain_fallback_xml',
     'ResolutionOutcome',
     '_replace_anchor',
 )
@@ -77,6 +101,77 @@ def resolve_mapping(
     return resolved_item, error
 
 
+def resolve_mapping_many(
+    instances: Dict[int, Xml2rfcAdapter],
+) -> Dict[int, BibliographicItem]:
+    """Like :func:`resolve_mapping`, but for many adapter instances at once.
+    Manual map entries are retrieved together,
+    and mapped items are built using
+    :func:`main.query.build_citations_in_batch`.
+
+    Returns resolved items under the same keys as given instances,
+    omitting instances that were not resolved.
+    Does not raise exceptions.
+    """
+    if len(instances) < 1:
+        return {}
+
+    subpaths = {
+        idx: (
+            construct_normalized_xml2rfc_subpath(
+                instance.dirname,
+                instance.anchor),
+            instance.subpath,
+        )
+        for idx, instance in instances.items()
+    }
+    try:
+        sidecar_meta: Dict[str, Dict[str, Any]] = {
+            subpath: meta or {}
+            for subpath, meta in Xml2rfcItem.objects.filter(
+                subpath__in=set(p for paths in subpaths.values() for p in paths),
+            ).values_list('subpath', 'sidecar_meta')
+        }
+    except Exception:
+        log.exception("Failed to retrieve manual map for xml2rfc paths")
+        return {}
+
+    mapped_docids: Dict[int, str] = {}
+    for idx, (normalized_subpath, subpath) in subpaths.items():
+        meta = sidecar_meta.get(
+            normalized_subpath,
+            sidecar_meta.get(subpath, {}))
+        if mapped_docid := meta.get('primary_docid', None):
+            mapped_docids[idx] = mapped_docid
+
+    try:
+        built = build_citations_in_batch([
+            DocID(id=mapped_docid, type='')
+            for mapped_docid in mapped_docids.values()
+        ])
+    except ValidationError:
+        # Let each instance report its own problem
+        resolved: Dict[int, BibliographicItem] = {}
+        for idx in mapped_docids.keys():
+            item, _ = resolve_mapping(subpaths[idx][0], instances[idx])
+            if item:
+                resolved[idx] = item
+        return resolved
+
+    resolved = {}
+    for idx, item in zip(mapped_docids.keys(), built):
+        instances[idx].log(f"mapped to {mapped_docids[idx]}")
+        if item:
+            instances[idx].resolved_item = item
+            resolved[idx] = item
+        else:
+            log.error(
+                "Unable to resolve an item for xml2rfc path %s, "
+                "despite it being mapped",
+                subpaths[idx][0])
+    return resolved
+
+
 def resolve_automatically(
     subpath: str,
     anchor: str,
@@ -123,7 +218,216 @@ class ResolutionOutcome(TypedDict, total=True):
     error: str
 
 
-def handle_xml2rfc_path(
+RESOLUTION_METHODS = ["manual", "auto", "fallback"]
+"""Resolution methods in the order they are tried."""
+
+
+def format_resolution_outcomes(
+    method_results: Dict[str, ResolutionOutcome],
+) -> str:
+    """Formats outcomes of tried resolution methods
+    for the ``X-Resolution-Outcomes`` header."""
+    return ';'.join([
+        (
+            '{config},{error}'.format(**method_results[method])
+            if method in method_results
+            else ''
+        )
+        for method in RESOLUTION_METHODS
+    ])
+
+
+def format_resolution_error(
+    method_results: Dict[str, ResolutionOutcome],
+) -> str:
+    """Formats outcomes of tried resolution methods
+    as an error message."""
+    return (
+        "Error resolving bibliographic item. "
+        "Tried methods: %s"
+        % ', '.join([
+            '{0} ({config}): {error}'.format(
+                method,
+                **method_results[method])
+            for method in RESOLUTION_METHODS
+            if method in method_results
+        ])
+    )
+
+
+def resolve_item(
+    adapter: Xml2rfcAdapter,
+    xml2rfc_subpath: str,
+    subpath_normalized: str,
+) -> Tuple[
+    Optional[BibliographicItem],
+    Dict[str, ResolutionOutcome],
+]:
+    """Resolves an item for an xml2rfc path using manual map,
+    then automatically using adapter.
+
+    Returns a 2-tuple of resolved item (or None)
+    and outcomes of tried resolution methods.
+    Does not raise exceptions.
+    """
+    method_results: Dict[str, ResolutionOutcome] = {}
+
+    item, error = resolve_mapping(subpath_normalized, adapter)
+    if item:
+        method_results['manual'] = dict(
+            config=adapter.format_log(),
+            error='' if item else (error or "no error information"),
+        )
+    else:
+        item, error = resolve_automatically(
+            xml2rfc_subpath,
+            adapter.anchor,
+            adapter)
+        method_results['auto'] = dict(
+            config=adapter.format_log(),
+            error='' if item else (error or "no error information"),
+        )
+
+    return item, method_results
+
+
+def format_anchor_safe(
+    adapter: Xml2rfcAdapter,
+    xml2rfc_subpath: str,
+) -> Optional[str]:
+    """Returns anchor formatted by adapter, if any.
+    Does not raise exceptions."""
+    try:
+        return adapter.format_anchor() or None
+    except Exception:
+        log.exception(
+            "xml2rfc path (%s): "
+            "Adapter failed at format_anchor()",
+            xml2rfc_subpath)
+        return None
+
+
+def get_prerendered(subpath: str) -> Optional[PrerenderedXml2rfcPath]:
+    """Returns pre-rendered XML for given normalized subpath, if any.
+    Does not raise exceptions.
+
+    Returns None if :data:`bibxml.settings.XML2RFC_PRERENDER` is off,
+    since stored XML is not kept up to date then."""
+    if not XML2RFC_PRERENDER:
+        return None
+    try:
+        return PrerenderedXml2rfcPath.objects.only(
+            'xml_repr',
+            'resolution_method',
+            'resolution_config',
+        ).get(subpath=subpath)
+    except PrerenderedXml2rfcPath.DoesNotExist:
+        return None
+    except Exception:
+        log.exception(
+            "Failed to retrieve pre-rendered XML for %s",
+            subpath)
+        return None
+
+
+async def aget_prerendered(
+    subpath: str,
+) -> Optional[PrerenderedXml2rfcPath]:
+    """Like :func:`get_prerendered`, but uses async ORM."""
+    if not XML2RFC_PRERENDER:
+        return None
+    try:
+        return await PrerenderedXml2rfcPath.objects.only(
+            'xml_repr',
+            'resolution_method',
+            'resolution_config',
+        ).aget(subpath=subpath)
+    except PrerenderedXml2rfcPath.DoesNotExist:
+        return None
+    except Exception:
+        log.exception(
+            "Failed to retrieve pre-rendered XML for %s",
+            subpath)
+        return None
+
+
+def get_prerendered_many(
+    subpaths: Dict[int, str],
+) -> Dict[int, PrerenderedXml2rfcPath]:
+    """Like :func:`get_prerendered`, but for many subpaths at once.
+    Returns pre-rendered XML under the same keys as given subpaths,
+    omitting subpaths that were not pre-rendered.
+    Does not raise exceptions."""
+    if len(subpaths) < 1 or not XML2RFC_PRERENDER:
+        return {}
+    try:
+        prerendered = {
+            obj.subpath: obj
+            for obj in PrerenderedXml2rfcPath.objects.filter(
+                subpath__in=subpaths.values(),
+            ).only(
+                'subpath',
+                'xml_repr',
+                'resolution_method',
+                'resolution_config',
+            )
+        }
+    except Exception:
+        log.exception("Failed to retrieve pre-rendered XML")
+        return {}
+    return {
+        idx: prerendered[subpath]
+        for idx, subpath in subpaths.items()
+        if subpath in prerendered
+    }
+
+
+def get_prerenderable_adapter(dirname: str) \
+        -> Optional[Type[Xml2rfcAdapter]]:
+    """Returns adapter class for given dirname,
+    if it is registered and resolves paths using indexed sources only."""
+    try:
+        adapter_cls = adapters[unalias(dirname)]
+    except (KeyError, ValueError):
+        return None
+    return adapter_cls if adapter_cls.prerender else None
+
+
+def get_xml2rfc_path_etag(
+    request,
+    xml2rfc_subpath: str,
+    dirname: str,
+    anchor: str,
+) -> Optional[str]:
+    if not get_prerenderable_adapter(dirname):
+        return None
+    digest = (
+        PrerenderedXml2rfcPath.objects.
+        filter(subpath=construct_normalized_xml2rfc_subpath(
+            unalias(dirname),
+            anchor)).
+        annotate(digest=MD5('xml_repr')).
+        values_list('digest', flat=True).
+        first()
+    ) if XML2RFC_PRERENDER else None
+    return make_etag(request, digest or '')
+
+
+def get_xml2rfc_path_last_modified(
+    request,
+    xml2rfc_subpath: str,
+    dirname: str,
+    anchor: str,
+) -> Optional[datetime]:
+    if not get_prerenderable_adapter(dirname):
+        return None
+    return get_last_modified()
+
+
+@condition(
+    etag_func=get_xml2rfc_path_etag,
+    last_modified_func=get_xml2rfc_path_last_modified)
+async def handle_xml2rfc_path(
     request,
     xml2rfc_subpath: str,
     dirname: str,
@@ -153,6 +457,21 @@ def handle_xml2rfc_path(
     - Inspects ``X-Requested-With`` request header, and does not increment
       access metric if it’s the internal ``xml2rfcResolver`` tool.
 
+    - If XML for the path was pre-rendered when sources were indexed
+      (see :mod:`xml2rfc_compat.prerender`)
+      and :data:`bibxml.settings.XML2RFC_PRERENDER` is on,
+      it is served as is,
+      with only anchor substituted, and resolution is skipped.
+
+    - Is an async view. Pre-rendered and fallback XML are retrieved
+      using async ORM, while item resolution (which may hit the database
+      many times) is done in a single thread hop.
+
+    - Supports conditional requests (see :mod:`main.conditional`),
+      unless adapter opts out of pre-rendering.
+      ETag is derived from generations of indexed sources
+      and pre-rendered XML, if any (and if pre-rendering is enabled).
+
     - The ``anchor`` component of URL pattern
       (see :data:`xml2rfc_compat.models.dir_subpath_regex`)
       is always used when attempting to auto-resolve to Relaton resource,
@@ -210,50 +529,53 @@ def handle_xml2rfc_path(
 
     adapter = adapter_cls(xml2rfc_subpath, normalized_dirname, anchor)
 
-    methods = ["manual", "auto", "fallback"]
+    methods = RESOLUTION_METHODS
     method_results: Dict[str, ResolutionOutcome] = {}
 
-    item, error = resolve_mapping(subpath_normalized, adapter)
-    if item:
-        method_results['manual'] = dict(
-            config=adapter.format_log(),
-            error='' if item else (error or "no error information"),
+    resolved = False
+
+    if (adapter_cls.prerender and (prerendered := await aget_prerendered(
+        construct_normalized_xml2rfc_subpath(normalized_dirname, anchor),
+    ))):
+        resolved = True
+        method_results[prerendered.resolution_method] = dict(
+            config=f'{prerendered.resolution_config} (prerendered)',
+            error='',
         )
+        xml_repr = (
+            _replace_anchor(prerendered.xml_repr, requested_anchor)
+            if requested_anchor
+            else prerendered.xml_repr)
+
     else:
-        item, error = resolve_automatically(
+        item, method_results = await sync_to_async(resolve_item)(
+            adapter,
             xml2rfc_subpath,
-            anchor,
-            adapter)
-        method_results['auto'] = dict(
-            config=adapter.format_log(),
-            error='' if item else (error or "no error information"),
-        )
+            subpath_normalized)
 
-    try:
         # format_anchor() should be called after attempts to resolve the item
-        if not requested_anchor and (_anch := adapter.format_anchor()):
-            requested_anchor = _anch
-    except Exception:
-        log.exception(
-            "xml2rfc path (%s): "
-            "Adapter failed at format_anchor()",
-            xml2rfc_subpath)
-
-    if item:
-        try:
-            xml_repr = to_xml_string(
-                item,
-                anchor=requested_anchor,
-            ).decode('utf-8')  # relaton-py’s serializer encodes.
-        except Exception:
-            log.exception(
-                "xml2rfc path (%s): "
-                "Failed to serialize resolved item, "
-                "attempting fallback",
+        if not requested_anchor:
+            requested_anchor = await sync_to_async(format_anchor_safe)(
+                adapter,
                 xml2rfc_subpath)
 
+        if item:
+            try:
+                xml_repr = to_xml_string(
+                    item,
+                    anchor=requested_anchor,
+                ).decode('utf-8')  # relaton-py’s serializer encodes.
+            except Exception:
+                log.exception(
+                    "xml2rfc path (%s): "
+                    "Failed to serialize resolved item, "
+                    "attempting fallback",
+                    xml2rfc_subpath)
+            else:
+                resolved = True
+
     if not xml_repr:
-        xml_repr = obtain_fallback_xml(
+        xml_repr = await aobtain_fallback_xml(
             subpath_normalized,
             anchor=requested_anchor)
         method_results['fallback'] = dict(
@@ -269,7 +591,7 @@ def handle_xml2rfc_path(
             lambda anchor: adapter.mangle_anchor(anchor),
         )
 
-        if item:
+        if resolved:
             metric_label = 'success'
         else:
             metric_label = 'success_fallback'
@@ -293,16 +615,7 @@ def handle_xml2rfc_path(
         # but API declares a JSON response so…
         resp = JsonResponse({
             "error": {
-                "message":
-                    "Error resolving bibliographic item. "
-                    "Tried methods: %s"
-                    % ', '.join([
-                        '{0} ({config}): {error}'.format(
-                            method,
-                            **method_results[method])
-                        for method in methods
-                        if method in method_results
-                    ])
+                "message": format_resolution_error(method_results),
             }
         }, status=404)
 
@@ -314,16 +627,251 @@ def handle_xml2rfc_path(
         ).inc()
 
     resp.headers['X-Resolution-Methods'] = ';'.join(methods)
-    resp.headers['X-Resolution-Outcomes'] = ';'.join([
-        (
-            '{config},{error}'.format(**method_results[method])
-            if method in method_results
-            else ''
+    resp.headers['X-Resolution-Outcomes'] = \
+        format_resolution_outcomes(method_results)
+
+    return resp
+
+
+PathResolution = Tuple[Optional[str], Dict[str, ResolutionOutcome]]
+"""XML string (or None, if path could not be resolved)
+and outcomes of tried resolution methods."""
+
+
+def resolve_xml2rfc_paths(
+    xml2rfc_subpaths: Sequence[str],
+) -> List[Optional[PathResolution]]:
+    """Resolves many xml2rfc subpaths
+    the way :func:`handle_xml2rfc_path` resolves one.
+
+    Instead of querying for each path, pre-rendered XML,
+    manual map entries, items paths are mapped to,
+    items resolved automatically (see
+    :meth:`~.adapters.Xml2rfcAdapter.resolve_many()`)
+    and fallback XML are each retrieved together,
+    so that the number of DB queries does not depend on the number of paths
+    (except for adapters that can’t resolve paths in batch).
+
+    :returns:
+        a list of the same length as ``xml2rfc_subpaths``,
+        containing for each path either a :data:`PathResolution`
+        or None, if there is no adapter for the path.
+
+    Does not raise exceptions.
+    """
+    subpath_regex = re.compile(dir_subpath_regex % '|'.join([
+        re.escape(d)
+        for dirname in adapters.keys()
+        for d in [dirname, *get_aliases(dirname)]
+    ]))
+
+    # Instantiate adapters for paths that match any
+    instances: Dict[int, Xml2rfcAdapter] = {}
+    normalized_subpaths: Dict[int, str] = {}
+    for idx, xml2rfc_subpath in enumerate(xml2rfc_subpaths):
+        if match := subpath_regex.match(xml2rfc_subpath):
+            dirname = unalias(match.group('dirname'))
+            anchor = match.group('anchor')
+            instances[idx] = adapters[dirname](xml2rfc_subpath, dirname, anchor)
+            normalized_subpaths[idx] = \
+                construct_normalized_xml2rfc_subpath(dirname, anchor)
+
+    xml_reprs: Dict[int, str] = {}
+    method_results: Dict[int, Dict[str, ResolutionOutcome]] = {
+        idx: {}
+        for idx in instances.keys()
+    }
+    items: Dict[int, BibliographicItem] = {}
+
+    # Pre-rendered XML
+    for idx, prerendered in get_prerendered_many({
+        idx: subpath
+        for idx, subpath in normalized_subpaths.items()
+        if instances[idx].prerender
+    }).items():
+        xml_reprs[idx] = prerendered.xml_repr
+        method_results[idx][prerendered.resolution_method] = dict(
+            config=f'{prerendered.resolution_config} (prerendered)',
+            error='',
+        )
+
+    # Manual map
+    for idx, mapped_item in resolve_mapping_many({
+        idx: instance
+        for idx, instance in instances.items()
+        if idx not in xml_reprs
+    }).items():
+        items[idx] = mapped_item
+        method_results[idx]['manual'] = dict(
+            config=instances[idx].format_log(),
+            error='',
+        )
+
+    # Automatic resolution
+    unresolved: Dict[int, Xml2rfcAdapter] = {
+        idx: instance
+        for idx, instance in instances.items()
+        if idx not in xml_reprs and idx not in items
+    }
+    for adapter_cls in set(type(instance) for instance in unresolved.values()):
+        try:
+            adapter_cls.resolve_many([
+                instance
+                for instance in unresolved.values()
+                if type(instance) is adapter_cls
+            ])
+        except Exception:
+            log.exception(
+                "Failed to resolve xml2rfc paths in batch using %s",
+                adapter_cls.__name__)
+    for idx, instance in unresolved.items():
+        item, error = resolve_automatically(
+            instance.subpath,
+            instance.anchor,
+            instance)
+        if item:
+            items[idx] = item
+        method_results[idx]['auto'] = dict(
+            config=instance.format_log(),
+            error='' if item else (error or "no error information"),
         )
-        for method in methods
+
+    # Serialization
+    anchors: Dict[int, Optional[str]] = {}
+    for idx, instance in instances.items():
+        if idx in xml_reprs:
+            continue
+        # format_anchor() should be called after attempts to resolve the item
+        anchors[idx] = format_anchor_safe(instance, instance.subpath)
+        if item := items.get(idx):
+            try:
+                xml_reprs[idx] = to_xml_string(
+                    item,
+                    anchor=anchors[idx],
+                ).decode('utf-8')
+            except Exception:
+                log.exception(
+                    "xml2rfc path (%s): "
+                    "Failed to serialize resolved item, "
+                    "attempting fallback",
+                    instance.subpath)
+
+    # Fallback XML
+    fallback_xml_reprs = obtain_fallback_xml_many([
+        normalized_subpaths[idx]
+        for idx in instances.keys()
+        if idx not in xml_reprs
     ])
+    for idx in instances.keys():
+        if idx not in xml_reprs:
+            xml_repr = fallback_xml_reprs.get(normalized_subpaths[idx], None)
+            if xml_repr:
+                xml_reprs[idx] = (
+                    _replace_anchor(xml_repr, anchor)
+                    if (anchor := anchors[idx])
+                    else xml_repr)
+            method_results[idx]['fallback'] = dict(
+                config='',
+                error='' if xml_repr else "not indexed",
+            )
+
+    return [
+        (
+            _replace_anchor(xml_reprs[idx], instances[idx].mangle_anchor)
+            if idx in xml_reprs
+            else None,
+            method_results[idx],
+        )
+        if idx in instances
+        else None
+        for idx in range(len(xml2rfc_subpaths))
+    ]
+
+
+def handle_xml2rfc_paths(request):
+    """View function that resolves many xml2rfc paths at once,
+    using :func:`resolve_xml2rfc_paths`.
+
+    Expects a JSON object in POST body, with ``paths`` key
+    containing a list of :term:`xml2rfc subpaths <xml2rfc subpath>`,
+    such as ``bibxml/reference.RFC.2119.xml``.
+    At most :data:`bibxml.settings.API_BATCH_MAX_ITEMS`
+    paths can be requested.
+
+    Responds with newline-delimited JSON, one object per
+    requested path in the same order. Each object contains
+    ``subpath`` and HTTP-like ``status``,
+    and either ``content`` (XML string) or ``error`` with ``message``.
+    Resolved paths also have ``outcomes``, formatted
+    like the ``X-Resolution-Outcomes`` header
+    of :func:`handle_xml2rfc_path` responses.
+
+    Access metric is incremented for each path
+    the same way :func:`handle_xml2rfc_path` does.
+    """
+    try:
+        paths = json.loads(request.body)['paths']
+        if not isinstance(paths, list):
+            raise TypeError("Paths must be a list")
+        xml2rfc_subpaths = [
+            path.removeprefix('/').removeprefix(XML2RFC_PATH_PREFIX)
+            for path in paths
+        ]
+    except (ValueError, TypeError, KeyError, AttributeError):
+        return JsonResponse({
+            "error": {
+                "message":
+                    "Expected a JSON object with a list of paths",
+            }
+        }, status=400)
 
-    return resp
+    if len(xml2rfc_subpaths) > API_BATCH_MAX_ITEMS:
+        return JsonResponse({
+            "error": {
+                "message":
+                    "Too many paths requested (maximum is %s)"
+                    % API_BATCH_MAX_ITEMS,
+            }
+        }, status=400)
+
+    results = resolve_xml2rfc_paths(xml2rfc_subpaths)
+
+    count_access = \
+        request.headers.get('x-requested-with', None) != 'xml2rfcResolver'
+
+    lines: List[str] = []
+    for xml2rfc_subpath, result in zip(xml2rfc_subpaths, results):
+        line: Dict[str, Any] = dict(subpath=xml2rfc_subpath)
+        if result is None:
+            metric_label = 'not_found'
+            line.update(status=404, error=dict(
+                message="No xml2rfc adapter for this path",
+            ))
+        else:
+            xml_repr, method_results = result
+            line['outcomes'] = format_resolution_outcomes(method_results)
+            if xml_repr:
+                metric_label = (
+                    'success_fallback'
+                    if 'fallback' in method_results
+                    else 'success')
+                line.update(status=200, content=xml_repr)
+            else:
+                metric_label = 'not_found'
+                line.update(status=404, error=dict(
+                    message=format_resolution_error(method_results),
+                ))
+        if count_access:
+            metrics.xml2rfc_api_bibitem_hits.labels(
+                xml2rfc_subpath,
+                metric_label,
+            ).inc()
+        lines.append(json.dumps(line) + '\n')
+
+    return HttpResponse(
+        ''.join(lines),
+        content_type='application/x-ndjson',
+        charset='utf-8')
 
 
 def obtain_fallback_xml(
@@ -339,26 +887,68 @@ def obtain_fallback_xml(
               This would mean fallback response for ``_reference.foo.bar.xml``
               can use XML from ``reference.foo.bar.xml``, if it exists.
     """
+    if not (actual_subpath := _unalias_subpath(subpath)):
+        return None
+    try:
+        xml_repr = Xml2rfcItem.objects.get(subpath=actual_subpath).xml_repr
+    except Xml2rfcItem.DoesNotExist:
+        return None
+    else:
+        if anchor:
+            return _replace_anchor(xml_repr, anchor)
+        else:
+            return xml_repr
+
+
+async def aobtain_fallback_xml(
+    subpath: str,
+    anchor: Optional[str] = None,
+) -> Optional[str]:
+    """Like :func:`obtain_fallback_xml`, but uses async ORM."""
+    if not (actual_subpath := _unalias_subpath(subpath)):
+        return None
+    try:
+        xml_repr = (await Xml2rfcItem.objects.only('xml_repr').aget(
+            subpath=actual_subpath,
+        )).xml_repr
+    except Xml2rfcItem.DoesNotExist:
+        return None
+    else:
+        if anchor:
+            return _replace_anchor(xml_repr, anchor)
+        else:
+            return xml_repr
+
 
+def _unalias_subpath(subpath: str) -> Optional[str]:
+    """Returns given subpath with directory name unaliased,
+    or None if directory name is not known."""
     requested_dirname = subpath.split('/')[-2]
     try:
         actual_dirname = unalias(requested_dirname)
     except ValueError:
         return None
-    else:
-        subpath = subpath.replace(
-            requested_dirname,
-            actual_dirname,
-            1)
-        try:
-            xml_repr = Xml2rfcItem.objects.get(subpath=subpath).xml_repr
-        except Xml2rfcItem.DoesNotExist:
-            return None
-        else:
-            if anchor:
-                return _replace_anchor(xml_repr, anchor)
-            else:
-                return xml_repr
+    return subpath.replace(requested_dirname, actual_dirname, 1)
+
+
+def obtain_fallback_xml_many(subpaths: Sequence[str]) -> Dict[str, str]:
+    """Like :func:`obtain_fallback_xml`, but for many subpaths at once.
+    Expects subpaths with unaliased directory names.
+
+    Returns XML strings keyed by subpath,
+    omitting subpaths that have no fallback.
+    Does not raise exceptions.
+    """
+    if len(subpaths) < 1:
+        return {}
+    try:
+        return dict(
+            Xml2rfcItem.objects.
+            filter(subpath__in=subpaths).
+            values_list('subpath', 'xml_repr'))
+    except Exception:
+        log.exception("Failed to retrieve fallback XML")
+        return {}
 
 
 anchor_regex = re.compile(r'anchor=\"([^\"]*)\"')